@@ -1,18 +1,35 @@
-# DBProject/asgi.py
+# DoroDB/asgi.py
 
 """
-ASGI config for DBProject project.
+ASGI config for DoroDB project.
 
-It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP(일반 뷰 + async 뷰)와 WebSocket(채팅)을 한 프로세스에서 처리합니다.
+
+    daphne DoroDB.asgi:application -b 127.0.0.1 -p 8001
 
 For more information on this file, see
-https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
+https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'DBProject.settings')  # 👈 확인
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'DoroDB.settings')
+
+# 앱 로딩(django.setup)이 끝난 뒤에 모델을 쓰는 channels/chat 모듈을 import 해야 함
+django_asgi_app = get_asgi_application()
+
+from channels.auth import AuthMiddlewareStack  # noqa: E402
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import AllowedHostsOriginValidator  # noqa: E402
+
+import chat.routing  # noqa: E402
 
-application = get_asgi_application()
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    # 세션 쿠키로 로그인 사용자 확인 (scope['user']), ALLOWED_HOSTS 밖의 Origin은 거부
+    'websocket': AllowedHostsOriginValidator(
+        AuthMiddlewareStack(URLRouter(chat.routing.websocket_urlpatterns))
+    ),
+})
@@ -83,11 +83,80 @@ TEMPLATES = [
 ASGI_APPLICATION = "DoroDB.asgi.application"
 WSGI_APPLICATION = "DoroDB.wsgi.application"
 
-CHANNEL_LAYERS = {
-    'default':{
-        'BACKEND': 'channels.layers.InMemoryChannelLayer',
+# 채널 레이어 - CHANNEL_REDIS_URL이 있으면 Redis(멀티 프로세스), 없으면 인메모리(단일 프로세스)
+# 예) CHANNEL_REDIS_URL=redis://127.0.0.1:6379/0  (channels_redis 설치 필요)
+CHANNEL_REDIS_URL = os.environ.get('CHANNEL_REDIS_URL')
+
+if CHANNEL_REDIS_URL:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {
+                'hosts': [CHANNEL_REDIS_URL],
+            },
+        }
     }
-}
+else:
+    CHANNEL_LAYERS = {
+        'default':{
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        }
+    }
+
+# 캐시 - CACHE_REDIS_URL이 있으면 Redis(모든 프로세스 공유), 없으면 프로세스별 메모리(LocMem)
+# 예) CACHE_REDIS_URL=redis://127.0.0.1:6379/1  (redis 패키지 필요)
+# 웹 서버와 daphne를 따로 띄우거나 워커가 여러 개면 Redis를 설정해야 강의실/대시보드 스냅샷, FAQ
+# 캐시의 무효화가 모든 프로세스에 바로 전달됩니다.
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+# LocMem일 때 무효화로 갱신되는 캐시 항목의 최대 유지 시간(초) - 다른 프로세스의 변경은 이 시간 안에 반영 (core/cache.py)
+LOCAL_CACHE_TIMEOUT = 15
+
+# 채팅 메시지 일괄 저장 (N ms마다 또는 M개 쌓이면 bulk_create)
+CHAT_FLUSH_INTERVAL_MS = 200
+CHAT_FLUSH_BATCH_SIZE = 100
+CHAT_FLUSH_MAX_RETRIES = 5   # 저장 실패 시 재시도 횟수 (간격은 매번 두 배) - 넘으면 그 배치는 버리고 로그
+
+# 채팅 대화 기록 한 페이지 메시지 수 (요청 시 limit로 최대 100까지)
+CHAT_HISTORY_PAGE_SIZE = 50
+
+# 채팅 읽음 표시 - 멤버 한 명당 N초에 한 번만 DB 반영/알림 (그 사이 읽음은 하나로 합침)
+CHAT_READ_RECEIPT_INTERVAL = 1.0
+
+# 채팅 접속자/입력 중 알림 - 채널당 N초에 한 번 모아서 전송, 입력 표시는 N초 뒤 자동 해제
+CHAT_PRESENCE_INTERVAL = 0.25
+CHAT_TYPING_TTL = 5
+
+# 채팅 연결별 전송 큐 - N개를 넘으면 대기 중인 메시지를 batch 하나로 합치고,
+# 대기 메시지가 M개를 넘으면(클라이언트가 계속 못 받음) resync를 보내고 연결 종료
+CHAT_OUTBOX_SIZE = 100
+CHAT_OUTBOX_RESYNC_AT = 1000
+
+# 채팅 멤버 확인 - 웹소켓은 접속 시와 연결 중 N초에 한 번 DB로 확인 → 멤버에서 빠지면 최대 N초 뒤 끊김
+# (CHANNEL_REDIS_URL을 설정하면 다른 프로세스에서 멤버를 삭제해도 채널 레이어로 바로 끊김)
+CHAT_MEMBERSHIP_RECHECK = 5
+
+# 커뮤니티 검색 - 일치하는 글 중 최신 N개만 관련도 순위 계산 (board/search.py)
+BOARD_SEARCH_CANDIDATES = 1000
+
+# 조회수 버퍼 - 백그라운드 스레드가 N초마다 또는 M개 항목이 쌓이면 DB 반영 (강제 종료 시 최대 N초 분량 유실)
+VIEW_COUNT_FLUSH_INTERVAL = 10
+VIEW_COUNT_MAX_PENDING = 500
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
@@ -147,6 +216,31 @@ AUTH_USER_MODEL = 'user.User'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# 업로드 파일은 내용 해시 기준으로 한 번만 저장 (core/storage.py, 기존 파일은 dedup_media 명령으로 정리)
+STORAGES = {
+    "default": {"BACKEND": "core.storage.DeduplicatedFileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# 강의 썸네일 / 프로필 사진 변환본 (core/images.py) - 너비(px)별 WebP + JPEG
+IMAGE_VARIANT_WIDTHS = [160, 320, 640, 1280]
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_VARIANT_BACKGROUND = True   # 업로드 후 변환은 커밋 뒤 백그라운드 스레드에서 (False면 커밋 직후 요청 스레드에서)
+
+# 분할 업로드 (과제 제출 / 주차별 자료)
+CHUNKED_UPLOAD_MAX_SIZE = 2 * 1024 ** 3        # 파일 하나 최대 2GB
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = 8 * 1024 ** 2  # 조각 하나 최대 8MB
+CHUNKED_UPLOAD_EXPIRE_HOURS = 24               # 이 시간 동안 진행 없는 업로드는 cleanup_uploads가 삭제
+
+# 강의 자료/과제/제출 파일 다운로드 (classroom/downloads.py)
+# ''     : Django가 직접 전송 (Range/ETag 지원, 개발용)
+# 'nginx': X-Accel-Redirect - nginx에 아래 internal location 필요
+#            location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+# 'apache': X-Sendfile (mod_xsendfile)
+# 운영 서버에서는 course_materials/, assignment_files/, submissions/ 를 /media/로 공개하지 마세요.
+PROTECTED_MEDIA_SERVER = os.environ.get('PROTECTED_MEDIA_SERVER', '')
+PROTECTED_MEDIA_INTERNAL_URL = '/protected-media/'
+
 LOGIN_URL = 'user:login'
 LOGIN_REDIRECT_URL = '/'
 
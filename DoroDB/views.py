@@ -1,36 +1,26 @@
 # DBProject/views.py
 
+from django.db.models import Q
 from django.shortcuts import render
+from core.asyncviews import resolve_user
 from course.models import Course
 from board.models import Notice
 from datetime import date
 
 
-def index_view(request):
-    """홈페이지 - 최신 강의 + 공지사항"""
+async def index_view(request):
+    """홈페이지 - 최신 강의 + 공지사항 (async 뷰)"""
+    await resolve_user(request)
     today = date.today()
 
-    # 최신 강의 (기간 유효한 강의만)
-    all_courses = Course.objects.filter(
-        is_active=True
-    ).select_related('instructor').order_by('-created_at')
-
-    # 기간 필터링
-    recent_courses = []
-    for course in all_courses:
-        if course.start_date and course.end_date:
-            if course.end_date >= today:  # 종료일이 오늘 이후
-                recent_courses.append(course)
-        else:
-            # 기간 미설정 시 모두 표시
-            recent_courses.append(course)
-
-        # 최대 4개
-        if len(recent_courses) >= 4:
-            break
+    # 최신 강의 최대 4개 (기간 미설정 강의는 모두, 기간이 있으면 종료일이 오늘 이후인 것만)
+    recent_courses = [course async for course in Course.objects.filter(
+        Q(start_date__isnull=True) | Q(end_date__isnull=True) | Q(end_date__gte=today),
+        is_active=True,
+    ).select_related('instructor').order_by('-created_at')[:4]]
 
     # 최신 공지사항 4개
-    recent_notices = Notice.objects.order_by('-is_pinned', '-created_at')[:4]
+    recent_notices = [notice async for notice in Notice.objects.order_by('-is_pinned', '-created_at')[:4]]
 
     context = {
         'recent_courses': recent_courses,
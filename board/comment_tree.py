@@ -0,0 +1,41 @@
+# board/comment_tree.py
+
+from django.core.paginator import Paginator
+from django.db.models import Exists, OuterRef, Q
+from .models import CommunityComment
+
+
+def load_comment_tree(post, page=None, per_page=50):
+    """게시글의 댓글을 최상위 댓글 기준으로 페이지를 나눠서 트리로 구성
+
+    - 최상위 댓글은 SQL에서 페이지를 나눔 (COUNT + LIMIT), 답글은 그 페이지 댓글의 것만 한 번에 조회
+      → 답글이 수천 개인 글도 한 페이지 분량만 불러옴
+    - 각 댓글에 children(답글 목록)과 has_active_children(삭제 안 된 답글 여부)을 붙여 줌
+    - 삭제됐지만 살아 있는 답글이 있는 댓글은 "삭제된 댓글입니다"로 남김
+    """
+    active_replies = CommunityComment.objects.filter(parent=OuterRef('pk'), is_deleted=False)
+    roots = (
+        CommunityComment.objects.filter(post=post, parent__isnull=True)
+        .annotate(has_active_children=Exists(active_replies))
+        .filter(Q(is_deleted=False) | Q(has_active_children=True))
+        .select_related('author')
+        .order_by('comment_id')
+    )
+
+    page_obj = Paginator(roots, per_page).get_page(page)
+
+    by_id = {}
+    for comment in page_obj:
+        comment.children = []
+        by_id[comment.comment_id] = comment
+
+    if by_id:
+        replies = (
+            CommunityComment.objects.filter(parent_id__in=by_id)
+            .select_related('author')
+            .order_by('comment_id')
+        )
+        for reply in replies:
+            by_id[reply.parent_id].children.append(reply)
+
+    return page_obj
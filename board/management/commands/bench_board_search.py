@@ -0,0 +1,88 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from board.models import CommunityBoard, CommunityPost
+from board.search import build_search_document, get_backend
+from user.models import User
+
+
+WORDS = [
+    '파이썬', '자바', '데이터베이스', '인공지능', '로봇', '코딩', '과제', '질문', '수업', '강의',
+    '시험', '프로젝트', '아두이노', '센서', '모터', '알고리즘', '리스트', '함수', '변수', '반복문',
+    '오늘', '내일', '어려워요', '도와주세요', '감사합니다', '공유', '후기', '추천', '정리', '발표',
+    'python', 'django', 'sql', 'error', 'github', 'html', 'css', 'javascript', 'ai', 'robot',
+]
+QUERIES = ['파이썬', '데이터베이스 질문', '아두이노 센서', 'django error', '프로젝트 후기를', '없는검색어']
+
+
+class Command(BaseCommand):
+    help = '커뮤니티 게시글 N개(기본 100만 개)를 넣고 검색 응답 시간을 측정합니다. (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=1_000_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--budget-ms', type=float, default=50.0)
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        self.stdout.write(f"backend: {type(backend).__name__} / DB: {connection.vendor}")
+
+        with transaction.atomic():
+            self.seed(options['posts'])
+
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE community_post')
+
+            worst = 0.0
+            for query in QUERIES:
+                timings = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    results = backend.search(CommunityPost.objects.all(), query)
+                    # 첫 페이지(10개)를 가져오는 것까지 측정
+                    list(results[:10])
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                timings.sort()
+                median = timings[len(timings) // 2]
+                worst = max(worst, median)
+                self.stdout.write(f"'{query}': median {median:.2f} ms / max {timings[-1]:.2f} ms")
+
+            transaction.set_rollback(True)
+
+        if connection.vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING(
+                "⚠️ 목표(100만 개 / 50 ms)는 PostgreSQL(pg_trgm) 기준 - 이 결과로는 확인되지 않습니다"
+            ))
+        if worst <= options['budget_ms']:
+            self.stdout.write(self.style.SUCCESS(f"✅ 모든 검색어가 목표({options['budget_ms']} ms) 이내"))
+        else:
+            self.stdout.write(self.style.ERROR(f"❌ 가장 느린 검색어 {worst:.2f} ms (목표 {options['budget_ms']} ms)"))
+
+    def seed(self, count):
+        author = User.objects.create_user(
+            email='bench-search@example.com', password=None, name='bench', phone_number='bench-2'
+        )
+        board = CommunityBoard.objects.create(board_title='bench', board_type='free')
+
+        rng = random.Random(0)
+        batch = []
+        for i in range(count):
+            title = ' '.join(rng.choices(WORDS, k=4))
+            content = ' '.join(rng.choices(WORDS, k=40))
+            batch.append(CommunityPost(
+                board=board,
+                author=author,
+                post_title=title,
+                content=content,
+                search_document=build_search_document(title, content, author.name),
+            ))
+            if len(batch) >= 5000:
+                CommunityPost.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            CommunityPost.objects.bulk_create(batch)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from board.models import CommunityPost, CommunityComment
+
+
+class Command(BaseCommand):
+    help = '커뮤니티 게시글의 댓글 수(active_comment_count)를 실제 댓글 기준으로 다시 계산합니다.'
+
+    def handle(self, *args, **kwargs):
+        active_comments = CommunityComment.objects.filter(
+            post=OuterRef('pk'), is_deleted=False
+        ).order_by().values('post').annotate(c=Count('pk')).values('c')
+
+        updated = CommunityPost.objects.update(
+            active_comment_count=Coalesce(
+                Subquery(active_comments, output_field=IntegerField()), Value(0)
+            )
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"✅ 게시글 {updated}개의 댓글 수를 다시 계산했습니다."))
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:09
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_active_comment_count(apps, schema_editor):
+    CommunityPost = apps.get_model("board", "CommunityPost")
+    CommunityComment = apps.get_model("board", "CommunityComment")
+
+    active_comments = (
+        CommunityComment.objects.filter(post=OuterRef("pk"), is_deleted=False)
+        .order_by()
+        .values("post")
+        .annotate(c=Count("pk"))
+        .values("c")
+    )
+    CommunityPost.objects.update(
+        active_comment_count=Coalesce(
+            Subquery(active_comments, output_field=models.IntegerField()), Value(0)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("board", "0005_notice_notice_type_notice_target_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="communitypost",
+            name="active_comment_count",
+            field=models.IntegerField(default=0, verbose_name="댓글 수"),
+        ),
+        migrations.RunPython(fill_active_comment_count, migrations.RunPython.noop),
+    ]
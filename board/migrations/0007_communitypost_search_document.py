@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:12
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+
+# board.search.build_search_document의 이 시점 버전을 고정 (이후 검색 코드가 바뀌어도 마이그레이션 결과는 그대로)
+_TOKEN_RE = re.compile(r"[\w]+", re.UNICODE)
+
+
+def build_search_document(title, content, author_name):
+    text = unicodedata.normalize("NFKC", f"{title} {author_name} {content}").lower()
+    return " ".join(_TOKEN_RE.findall(text))
+
+
+def fill_search_document(apps, schema_editor):
+    CommunityPost = apps.get_model("board", "CommunityPost")
+
+    posts = CommunityPost.objects.select_related("author").only(
+        "post_id", "post_title", "content", "author__name"
+    )
+    batch = []
+    for post in posts.iterator(chunk_size=2000):
+        post.search_document = build_search_document(
+            post.post_title, post.content, post.author.name
+        )
+        batch.append(post)
+        if len(batch) >= 2000:
+            CommunityPost.objects.bulk_update(batch, ["search_document"])
+            batch = []
+    if batch:
+        CommunityPost.objects.bulk_update(batch, ["search_document"])
+
+
+def create_trigram_index(apps, schema_editor):
+    # PostgreSQL에서만 pg_trgm GIN 인덱스 생성 (SQLite 등은 파이썬 검색 사용)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS community_post_search_trgm "
+        "ON community_post USING gin (search_document gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS community_post_search_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("board", "0006_communitypost_active_comment_count"),
+        ("user", "0002_alter_dimc_result"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="communitypost",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(fill_search_document, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("board", "0007_communitypost_search_document"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="communitypost",
+            index=models.Index(
+                fields=["created_at", "post_id"], name="community_p_created_d03700_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notice",
+            index=models.Index(
+                fields=["is_pinned", "created_at", "notice_id"],
+                name="notice_is_pinn_7095cb_idx",
+            ),
+        ),
+    ]
@@ -6,6 +6,7 @@
 
 from django.db import models
 from user.models import User
+from .search import build_search_document
 
 
 class Notice(models.Model):
@@ -51,6 +52,10 @@ class Notice(models.Model):
         verbose_name = '공지사항'
         verbose_name_plural = '공지사항 목록'
         ordering = ['-is_pinned', '-created_at']
+        indexes = [
+            # 커서 페이지네이션 (is_pinned, created_at, notice_id)
+            models.Index(fields=['is_pinned', 'created_at', 'notice_id']),
+        ]
 
     def __str__(self):
         return self.title
@@ -86,14 +91,39 @@ class CommunityPost(models.Model):
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 일시")
     open = models.BooleanField(default=True, verbose_name="공개 여부")
     view = models.IntegerField(default=0, verbose_name="조회수")
+    # 삭제되지 않은 댓글 수 (comment_create / comment_delete에서 같이 갱신)
+    active_comment_count = models.IntegerField(default=0, verbose_name="댓글 수")
+    # 검색용 문자열 (제목 + 작성자 + 내용, 정규화) - 저장할 때 자동 갱신
+    search_document = models.TextField(blank=True, default='', editable=False)
 
     def get_active_comments_count(self):
         return self.communitycomment_set.filter(is_deleted=False).count()
 
+    # search_document에 들어가는 필드 (이 필드를 저장할 때만 다시 만듦)
+    SEARCH_FIELDS = {'post_title', 'content', 'author'}
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or self.SEARCH_FIELDS & set(update_fields):
+            self.search_document = build_search_document(self.post_title, self.content, self.author_name())
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'search_document'}
+        super().save(*args, **kwargs)
+
+    def author_name(self):
+        """작성자 이름 - 뷰에서 post.author = request.user 처럼 이미 붙여 둔 객체가 있으면 쿼리 없이 사용"""
+        if CommunityPost.author.is_cached(self):
+            return self.author.name
+        return User.objects.filter(pk=self.author_id).values_list('name', flat=True).first() or ''
+
     class Meta:
         db_table = 'community_post'
         verbose_name = '커뮤니티 게시글'
         verbose_name_plural = '커뮤니티 게시글 목록'
+        indexes = [
+            # 커서 페이지네이션 (created_at, post_id)
+            models.Index(fields=['created_at', 'post_id']),
+        ]
 
     def __str__(self):
         return self.post_title
@@ -0,0 +1,118 @@
+# board/pagination.py
+
+import base64
+import hashlib
+import math
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import Q
+
+
+class KeysetPage:
+    """커서(keyset) 페이지 - OFFSET 없이 (created_at, pk) 기준으로 다음/이전 페이지를 가져옴
+
+    cursor에는 기준 행의 (created_at, pk)와 지금까지 넘긴 행 수(offset)를 담습니다.
+    offset은 SQL에 쓰지 않고 게시글 번호/페이지 번호 표시에만 사용합니다.
+    """
+
+    def __init__(self, items, offset, per_page, has_next, has_previous, total=None):
+        self.object_list = items
+        self.offset = offset
+        self.per_page = per_page
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.total = total
+        self.next_cursor = encode_cursor(items[-1], offset + len(items)) if has_next else None
+        self.previous_cursor = encode_cursor(items[0], offset, backward=True) if has_previous else None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def number(self):
+        return self.offset // self.per_page + 1
+
+    @property
+    def num_pages(self):
+        if self.total is None:
+            return None
+        return max(1, math.ceil(self.total / self.per_page))
+
+
+def encode_cursor(obj, offset, backward=False):
+    raw = f"{'b' if backward else 'f'}|{obj.created_at.isoformat()}|{obj.pk}|{offset}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """잘못된 커서는 첫 페이지로 처리"""
+    try:
+        direction, created_at, pk, offset = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return direction == 'b', datetime.fromisoformat(created_at), int(pk), max(int(offset), 0)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _keyset_query(queryset, cursor, per_page):
+    """커서에 맞는 조회 쿼리셋 (per_page + 1개) → (쿼리셋, 해석한 커서)"""
+    pk_name = queryset.model._meta.pk.name
+    decoded = decode_cursor(cursor) if cursor else None
+
+    if decoded is None:
+        return queryset.order_by('-created_at', f'-{pk_name}')[:per_page + 1], None
+
+    backward, created_at, pk, _ = decoded
+    if backward:
+        # 이전 페이지: 기준 행보다 최신인 행을 오래된 순으로 가져와서 뒤집음
+        return queryset.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, **{f'{pk_name}__gt': pk})
+        ).order_by('created_at', pk_name)[:per_page + 1], decoded
+
+    return queryset.filter(
+        Q(created_at__lt=created_at) | Q(created_at=created_at, **{f'{pk_name}__lt': pk})
+    ).order_by('-created_at', f'-{pk_name}')[:per_page + 1], decoded
+
+
+def _keyset_page(rows, decoded, per_page, total):
+    if decoded is None:
+        return KeysetPage(rows[:per_page], 0, per_page, len(rows) > per_page, False, total)
+
+    backward, _, _, offset = decoded
+    if backward:
+        has_previous = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        offset = max(offset - len(rows), 0)
+        return KeysetPage(rows, offset, per_page, True, has_previous, total)
+
+    return KeysetPage(rows[:per_page], offset, per_page, len(rows) > per_page, True, total)
+
+
+def keyset_paginate(queryset, cursor=None, per_page=10, total=None):
+    """created_at, pk 내림차순(최신순) 커서 페이지네이션
+
+    페이지 깊이와 상관없이 (created_at, pk) 인덱스 범위 조회 한 번이면 됩니다.
+    """
+    query, decoded = _keyset_query(queryset, cursor, per_page)
+    return _keyset_page(list(query), decoded, per_page, total)
+
+
+async def akeyset_paginate(queryset, cursor=None, per_page=10, total=None):
+    """keyset_paginate의 async 버전 (async 뷰에서 사용)"""
+    query, decoded = _keyset_query(queryset, cursor, per_page)
+    return _keyset_page([row async for row in query], decoded, per_page, total)
+
+
+def cached_count(queryset, key_parts, timeout=60):
+    """COUNT(*) 결과를 잠깐 캐시한 대략적인 전체 개수 (게시글 번호/페이지 수 표시용)"""
+    digest = hashlib.md5('|'.join(str(p) for p in key_parts).encode()).hexdigest()
+    key = f'board:count:{digest}'
+
+    total = cache.get(key)
+    if total is None:
+        total = queryset.count()
+        cache.set(key, total, timeout)
+    return total
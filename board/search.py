@@ -0,0 +1,119 @@
+# board/search.py
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Q, Value
+
+from core.text import normalize, tokenize  # 한글 정규화/조사 제거는 FAQ 검색과 공유 (core/text.py)
+
+
+# 이 길이 미만의 토큰은 부분 일치 대신 단어 앞부분 일치로 검색 (token_condition 참고)
+TRIGRAM_MIN_LENGTH = 3
+
+
+def candidate_limit():
+    """관련도 순위를 매길 최대 후보 수 (일치하는 글 중 최신순) - 흔한 검색어도 순위 계산 비용이 일정"""
+    return getattr(settings, 'BOARD_SEARCH_CANDIDATES', 1000)
+
+
+def candidates(queryset, condition):
+    """조건에 맞는 글 중 최신 candidate_limit()개의 pk 서브쿼리 ((created_at, post_id) 인덱스 역순 탐색)"""
+    return queryset.filter(condition).order_by('-created_at', '-post_id').values('pk')[:candidate_limit()]
+
+
+def token_condition(token):
+    """토큰 하나의 검색 조건
+
+    pg_trgm은 세 글자(trigram) 미만 검색어로는 trigram을 만들지 못해 '%토큰%' 검색에 인덱스를 못 쓰고
+    전체를 훑습니다. 조사를 뗀 "장고", "자바" 같은 두 글자 토큰이 많아서
+    짧은 토큰은 단어 앞부분 일치(문서 시작 또는 ' 토큰')로 검색 → 앞 공백 덕분에 trigram("  장", " 장고")이 생겨 인덱스 사용
+    """
+    if len(token) >= TRIGRAM_MIN_LENGTH:
+        return Q(search_document__contains=token)
+    return Q(search_document__startswith=token) | Q(search_document__contains=f' {token}')
+
+
+def match_condition(tokens):
+    """모든 토큰을 포함하는 글 (AND)"""
+    condition = Q()
+    for token in tokens:
+        condition &= token_condition(token)
+    return condition
+
+
+def build_search_document(title, content, author_name):
+    """게시글 저장 시 search_document 컬럼에 넣을 문자열"""
+    return normalize(f"{title} {author_name} {content}")
+
+
+class PostgresSearchBackend:
+    """PostgreSQL - pg_trgm GIN 인덱스(search_document) + 유사도 순위
+
+    한국어는 형태소 분석 없이도 글자 단위 trigram으로 부분 일치가 되기 때문에
+    tsvector 대신 trigram을 사용합니다.
+
+    유사도(TrigramWordSimilarity)는 인덱스로 계산할 수 없어 일치하는 글 전체에 계산하면
+    흔한 검색어에서 느려지므로, 먼저 인덱스 조건으로 후보를 좁힙니다.
+    - 세 글자 이상 토큰은 부분 일치에 더해 %> 연산자(TrigramWordSimilar)로 GIN 인덱스에서 거름
+    - 그중 최신 candidate_limit()개만 순위 계산
+    """
+
+    def search(self, queryset, query):
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        tokens = tokenize(query)
+        if not tokens:
+            return queryset.none()
+
+        condition = match_condition(tokens)
+        for token in tokens:
+            if len(token) >= TRIGRAM_MIN_LENGTH:
+                # django.contrib.postgres가 INSTALLED_APPS에 없어도 되도록 lookup을 직접 사용
+                condition &= Q(TrigramWordSimilar(F('search_document'), Value(token)))
+
+        text = ' '.join(tokens)
+        return queryset.filter(pk__in=candidates(queryset, condition)).annotate(
+            rank=TrigramWordSimilarity(text, 'post_title') * 2
+            + TrigramWordSimilarity(text, 'search_document')
+        ).order_by('-rank', '-created_at')
+
+
+class PythonSearchBackend:
+    """순수 파이썬 구현 (SQLite 등) - 부분 일치로 거른 최신 후보만 불러와 파이썬에서 점수 계산"""
+
+    def search(self, queryset, query):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        posts = list(queryset.filter(pk__in=candidates(queryset, match_condition(tokens))))
+        for post in posts:
+            post.rank = self.score(post, tokens)
+
+        posts.sort(key=lambda p: (p.rank, p.created_at), reverse=True)
+        return posts
+
+    @staticmethod
+    def score(post, tokens):
+        """제목 일치는 3점, 본문/작성자 일치는 1점 (토큰이 단어 앞부분이면 가산점)"""
+        title = normalize(post.post_title)
+        document = post.search_document
+        score = 0.0
+        for token in tokens:
+            score += 3 * title.count(token) + document.count(token)
+            if f' {token}' in f' {document}':
+                score += 0.5
+        return score
+
+
+def get_backend():
+    """settings.BOARD_SEARCH_BACKEND('postgres' / 'python')가 없으면 DB 종류로 결정"""
+    name = getattr(settings, 'BOARD_SEARCH_BACKEND', None)
+    if name is None:
+        name = 'postgres' if connection.vendor == 'postgresql' else 'python'
+    return PostgresSearchBackend() if name == 'postgres' else PythonSearchBackend()
+
+
+def search_posts(queryset, query):
+    return get_backend().search(queryset, query)
@@ -0,0 +1,37 @@
+# board/signals.py
+
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from user.models import User
+from .models import CommunityPost
+from .search import build_search_document
+
+
+@receiver(pre_save, sender=User)
+def remember_author_name(sender, instance, update_fields=None, **kwargs):
+    """이름이 바뀌는지 확인 (로그인 시각 저장처럼 name이 없는 update_fields 저장은 건너뜀)"""
+    instance._board_name_changed = False
+    if instance.pk is None or (update_fields is not None and 'name' not in update_fields):
+        return
+    old_name = User.objects.filter(pk=instance.pk).values_list('name', flat=True).first()
+    instance._board_name_changed = old_name is not None and old_name != instance.name
+
+
+@receiver(post_save, sender=User)
+def refresh_author_search_documents(sender, instance, **kwargs):
+    """작성자 이름이 바뀌면 그 사람 게시글의 search_document 갱신 (save() 대신 bulk_update)"""
+    if not getattr(instance, '_board_name_changed', False):
+        return
+    instance._board_name_changed = False
+
+    posts = CommunityPost.objects.filter(author=instance).only('post_id', 'post_title', 'content')
+    batch = []
+    for post in posts.iterator(chunk_size=1000):
+        post.search_document = build_search_document(post.post_title, post.content, instance.name)
+        batch.append(post)
+        if len(batch) >= 1000:
+            CommunityPost.objects.bulk_update(batch, ['search_document'])
+            batch = []
+    if batch:
+        CommunityPost.objects.bulk_update(batch, ['search_document'])
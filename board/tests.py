@@ -1,3 +1,103 @@
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from user.models import User
+from .models import CommunityBoard, CommunityComment, CommunityPost, Notice
+
+
+class CommentCountQueryTests(TestCase):
+    """댓글 수 비정규화 (active_comment_count) - 목록/댓글 작성/삭제의 쿼리 수 고정"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(
+            email='author@example.com', password='pw', name='작성자', phone_number='010-0000-0001'
+        )
+        cls.board = CommunityBoard.objects.create(board_title='자유게시판', board_type='free')
+
+    def setUp(self):
+        cache.clear()  # 목록 전체 개수 캐시 (board.pagination.cached_count)
+        self.client.force_login(self.author)
+
+    def make_posts(self, count):
+        return [
+            CommunityPost.objects.create(
+                board=self.board, author=self.author, post_title=f'글 {i}', content='내용'
+            )
+            for i in range(count)
+        ]
+
+    def test_list_query_count_does_not_depend_on_posts(self):
+        # 세션 + 사용자 + 전체 개수 + 글 목록(게시판/작성자 JOIN) - 댓글 수는 글마다 COUNT 하지 않음
+        for post in self.make_posts(3):
+            CommunityComment.objects.create(post=post, author=self.author, comment_content='댓글')
+        with self.assertNumQueries(4):
+            self.client.get(reverse('board:community_list'))
+
+        cache.clear()
+        self.make_posts(20)
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('board:community_list'))
+        self.assertEqual(len(response.context['posts']), 10)
+
+    def test_list_shows_stored_comment_count(self):
+        post = self.make_posts(1)[0]
+        CommunityPost.objects.filter(pk=post.pk).update(active_comment_count=7)
+        response = self.client.get(reverse('board:community_list'))
+        self.assertEqual(list(response.context['posts'])[0].active_comment_count, 7)
+
+    def test_comment_create_increments_counter(self):
+        post = self.make_posts(1)[0]
+        # 세션 + 사용자 + 글 + (SAVEPOINT) 댓글 INSERT + 댓글 수 UPDATE (RELEASE)
+        with self.assertNumQueries(7):
+            self.client.post(reverse('board:comment_create', args=[post.pk]), {'comment_content': '댓글'})
+        post.refresh_from_db()
+        self.assertEqual(post.active_comment_count, 1)
+
+    def test_comment_delete_decrements_counter_once(self):
+        post = self.make_posts(1)[0]
+        self.client.post(reverse('board:comment_create', args=[post.pk]), {'comment_content': '댓글'})
+        comment = CommunityComment.objects.get(post=post)
+        url = reverse('board:comment_delete', args=[comment.pk])
+
+        # 세션 + 사용자 + 댓글 + (SAVEPOINT) 삭제 표시 UPDATE + 댓글 수 UPDATE (RELEASE)
+        with self.assertNumQueries(7):
+            self.client.post(url)
+        post.refresh_from_db()
+        self.assertEqual(post.active_comment_count, 0)
+
+        # 이미 삭제된 댓글 - 댓글 수 UPDATE 없음
+        with self.assertNumQueries(6):
+            self.client.post(url)
+        post.refresh_from_db()
+        self.assertEqual(post.active_comment_count, 0)
+
+
+class NoticeListPaginationTests(TestCase):
+    """공지 목록 커서 페이지네이션 - 상단 고정 공지는 첫 페이지에만"""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(
+            email='manager@example.com', password='pw', name='관리자', phone_number='010-0000-0002'
+        )
+        Notice.objects.bulk_create(
+            [Notice(author=author, title=f'고정 {i}', content='내용', is_pinned=True) for i in range(2)]
+            + [Notice(author=author, title=f'공지 {i}', content='내용') for i in range(25)]
+        )
+
+    def titles(self, response):
+        return [notice.title for notice in response.context['notices']]
+
+    def test_pinned_notices_return_when_navigating_back_to_first_page(self):
+        url = reverse('board:notice_list')
+        first = self.client.get(url)
+        self.assertEqual(len(self.titles(first)), 22)  # 고정 2 + 20
+
+        second = self.client.get(url, {'cursor': first.context['page_obj'].next_cursor})
+        self.assertNotIn('고정 0', self.titles(second))
+
+        back = self.client.get(url, {'cursor': second.context['page_obj'].previous_cursor})
+        self.assertFalse(back.context['page_obj'].has_previous)
+        self.assertEqual(self.titles(back), self.titles(first))
@@ -3,9 +3,15 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseForbidden, HttpResponse
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import F
 from .models import Notice, CommunityComment, CommunityBoard, CommunityPost
 from .forms import NoticeForm, CommunityPostForm, CommunityCommentForm
+from core.view_counter import view_counter
+from .comment_tree import load_comment_tree
+from .search import search_posts
+from .pagination import akeyset_paginate, keyset_paginate, cached_count
+from core.asyncviews import resolve_user
 from functools import wraps
 
 def staff_or_instructor_required(view_func):
@@ -22,10 +28,12 @@ def staff_or_instructor_required(view_func):
     return wrapper
 
 
-def notice_list_view(request):
-    """공지사항 목록 (필터링 기능 추가)"""
-    # 1. 모든 글 가져오기 (상단고정 우선, 그 다음 최신순)
-    notices = Notice.objects.all().order_by('-is_pinned', '-created_at')
+async def notice_list_view(request):
+    """공지사항 목록 (필터링 + 커서 페이지네이션, async 뷰)"""
+    await resolve_user(request)
+
+    # 1. 모든 글 가져오기
+    notices = Notice.objects.all()
 
     # 2. URL에서 '?target=...' 값 확인하기
     target_filter = request.GET.get('target')
@@ -35,16 +43,24 @@ def notice_list_view(request):
     if target_filter and target_filter != 'ALL':
         notices = notices.filter(target=target_filter)
 
+    # 4. 상단 고정 공지는 첫 페이지에만 따로 표시, 나머지는 최신순 커서 페이지네이션
+    # (커서 유무가 아니라 이전 페이지가 없는지로 판단 - '이전'으로 첫 페이지에 돌아와도 고정 공지 표시)
+    page_obj = await akeyset_paginate(notices.filter(is_pinned=False), request.GET.get('cursor'), 20)
+    pinned = [] if page_obj.has_previous else [
+        n async for n in notices.filter(is_pinned=True).order_by('-created_at')
+    ]
+
     context = {
-        'notices': notices,
+        'notices': pinned + page_obj.object_list,
+        'page_obj': page_obj,
+        'target_filter': target_filter,
     }
     return render(request, 'board/notice_list.html', context)
 
 def notice_detail_view(request, notice_id):
     """공지사항 상세"""
     notice = get_object_or_404(Notice, notice_id=notice_id)
-    notice.views += 1
-    notice.save()
+    view_counter.hit(notice, 'views')
     return render(request, 'board/notice_detail.html', {'notice': notice})
 
 
@@ -107,7 +123,7 @@ def community_view(request):
 # 1. 게시글 목록
 def community_list(request):
     # 1. 모든 글 가져오기 (최신순)
-    posts = CommunityPost.objects.all().order_by('-created_at')
+    posts = CommunityPost.objects.select_related('board', 'author').order_by('-created_at')
 
     board_type = request.GET.get('board', '') # URL에서 '?board=xxx' 값을 가져옴
     if board_type:
@@ -117,26 +133,24 @@ def community_list(request):
     if filter_mode == 'my' and request.user.is_authenticated:
         posts = posts.filter(author=request.user)
 
-    # 2. 검색어 처리 (기존 코드 유지)
+    # 2. 검색어 처리 (PostgreSQL: trigram 인덱스 / 그 외: 파이썬 검색, 관련도 순)
     q = request.GET.get('q', '')
     if q:
-        posts = posts.filter(
-            Q(post_title__icontains=q) |
-            Q(content__icontains=q) |
-            Q(author__name__icontains=q)
-        ).distinct()
-
-    # 3. 페이지네이션 (기존 코드 유지)
-    paginator = Paginator(posts, 10)
-    page = request.GET.get('page')
-    page_obj = paginator.get_page(page)
-
-    # 번호 매기기 로직 (기존 코드 유지)
-    if page_obj.paginator.count > 0:
-        start_num = page_obj.paginator.count - page_obj.start_index() + 1
-        for post in page_obj:
-            post.number = start_num
-            start_num -= 1
+        # 검색 결과는 관련도 순이라 기존 페이지 번호 방식 사용
+        paginator = Paginator(search_posts(posts, q), 10)
+        page_obj = paginator.get_page(request.GET.get('page'))
+        total = paginator.count
+        offset = page_obj.start_index() - 1 if total else 0
+    else:
+        # 3. 커서 페이지네이션 - 몇 번째 페이지든 같은 비용 (전체 개수는 캐시된 값 사용)
+        owner = request.user.pk if filter_mode == 'my' else ''
+        total = cached_count(posts, ['community', board_type, filter_mode, owner])
+        page_obj = keyset_paginate(posts, request.GET.get('cursor'), 10, total)
+        offset = page_obj.offset
+
+    # 번호 매기기 (전체 개수 - 앞에서 넘긴 개수)
+    for i, post in enumerate(page_obj):
+        post.number = total - offset - i
 
     context = {
         'posts': page_obj,
@@ -159,16 +173,19 @@ def community_detail(request, post_id):
             return HttpResponse("<script>alert('비공개 게시글입니다.'); history.back();</script>")
 
     # 조회수 증가
-    post.view += 1
-    post.save()
+    view_counter.hit(post, 'view')
+
+    # 👇 [추가] 삭제되지 않은 댓글 수 (게시글에 저장된 값 사용)
+    active_count = post.active_comment_count
 
-    # 👇 [추가] 삭제되지 않은 댓글만 카운트하기
-    active_count = post.communitycomment_set.filter(is_deleted=False).count()
+    # 댓글/답글 트리를 한 번에 불러오기 (최상위 댓글 기준 페이지네이션)
+    comments = load_comment_tree(post, request.GET.get('cpage'))
 
     # 👇 [수정] active_count를 context에 담아서 전달
     context = {
         'post': post,
-        'active_count': active_count
+        'active_count': active_count,
+        'comments': comments,
     }
     return render(request, 'board/community_detail.html', context)
 
@@ -194,9 +211,10 @@ def community_create(request):
 def community_update(request, post_id):
     post = get_object_or_404(CommunityPost, pk=post_id)
 
-    # 작성자 본인 확인
-    if post.author != request.user:
+    # 작성자 본인 확인 (ID 비교 - 작성자 행을 따로 불러오지 않음)
+    if post.author_id != request.user.pk:
         return redirect('board:community_detail', post_id=post.post_id)
+    post.author = request.user  # 저장 시 검색 문서에 넣을 작성자 이름
 
     if request.method == 'POST':
         form = CommunityPostForm(request.POST, instance=post)
@@ -242,19 +260,31 @@ def comment_create(request, post_id):
                 parent_comment = get_object_or_404(CommunityComment, pk=parent_id)
                 comment.parent = parent_comment
 
-            comment.save()
+            # 댓글 저장과 댓글 수 증가를 한 트랜잭션으로 처리
+            with transaction.atomic():
+                comment.save()
+                CommunityPost.objects.filter(pk=post.pk).update(
+                    active_comment_count=F('active_comment_count') + 1
+                )
 
     return redirect('board:community_detail', post_id=post.post_id)
 
 @login_required
 def comment_delete(request, comment_id):
     comment = get_object_or_404(CommunityComment, pk=comment_id)
-    post_id = comment.post.post_id
-
-    # 권한 확인
-    if request.user == comment.author or request.user.role == 'manager':
-        comment.is_deleted = True
-        comment.save()
+    post_id = comment.post_id
+
+    # 권한 확인 (글/작성자 행은 다시 불러오지 않고 ID로 비교)
+    if request.user.pk == comment.author_id or request.user.role == 'manager':
+        # 이미 삭제된 댓글이면 댓글 수를 다시 줄이지 않음
+        with transaction.atomic():
+            deleted = CommunityComment.objects.filter(
+                pk=comment.pk, is_deleted=False
+            ).update(is_deleted=True)
+            if deleted:
+                CommunityPost.objects.filter(pk=post_id).update(
+                    active_comment_count=F('active_comment_count') - 1
+                )
     else:
         return redirect('board:community_detail', post_id=post_id)
 
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+
+from channels.db import database_sync_to_async
+from django.conf import settings
+from django.utils import timezone
+from chat.models import MessengerMessage
+
+
+logger = logging.getLogger(__name__)
+
+
+class MessageBuffer:
+    """채팅 메시지 write-behind 버퍼
+
+    프레임마다 INSERT 하지 않고, N ms가 지나거나 M개가 쌓이면 bulk_create로 한 번에 저장합니다.
+    워커 프로세스(이벤트 루프)마다 하나씩 두고 모든 ChatConsumer가 공유합니다.
+
+    저장에 실패하면 배치를 버리지 않고 대기열 앞에 되돌려 놓고 다음 주기에 다시 시도합니다.
+    CHAT_FLUSH_MAX_RETRIES번 연속 실패하면 (DB 장애가 계속되는 경우) 메모리가 계속 늘지 않도록
+    그 배치를 버리고 로그를 남깁니다.
+    """
+
+    def __init__(self, interval_ms=None, batch_size=None):
+        self.interval = (interval_ms or getattr(settings, 'CHAT_FLUSH_INTERVAL_MS', 200)) / 1000
+        self.batch_size = batch_size or getattr(settings, 'CHAT_FLUSH_BATCH_SIZE', 100)
+        self.max_retries = getattr(settings, 'CHAT_FLUSH_MAX_RETRIES', 5)
+        self.pending = []
+        self.failures = 0
+        self._timer = None
+        self._tasks = set()  # 실행 중인 flush 태스크 (참조를 잡아 두지 않으면 도중에 GC될 수 있음)
+
+    async def add(self, channel_id, sender_id, content):
+        """메시지를 대기열에 추가 → 저장 전 MessengerMessage (sent_at은 저장 시점이 아닌 지금)"""
+        message = MessengerMessage(
+            channel_id=channel_id,
+            sender_id=sender_id,
+            content=content,
+            sent_at=timezone.now(),
+        )
+        self.pending.append(message)
+
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._schedule(self.interval)
+        return message
+
+    def _schedule(self, delay):
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(delay, self._start_flush)
+
+    def _start_flush(self):
+        self._timer = None
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self.pending:
+            return 0
+
+        batch, self.pending = self.pending, []
+        try:
+            await self.write(batch)
+        except Exception:
+            self.failures += 1
+            if self.failures > self.max_retries:
+                logger.exception("채팅 메시지 %d개 저장 실패 (%d회 연속) - 배치를 버립니다", len(batch), self.failures)
+                self.failures = 0
+            else:
+                logger.exception("채팅 메시지 %d개 저장 실패 (%d회째) - 다시 시도합니다", len(batch), self.failures)
+                self.pending[:0] = batch  # 그 사이 들어온 메시지보다 앞에 (순서 유지)
+            if self.pending and self._timer is None:
+                self._schedule(self.interval * 2 ** self.failures)
+            return 0
+
+        self.failures = 0
+        return len(batch)
+
+    @database_sync_to_async
+    def write(self, batch):
+        MessengerMessage.objects.bulk_create(batch)
+
+
+message_buffer = MessageBuffer()
@@ -1,8 +1,17 @@
+import asyncio
 import json
+import time
 from channels.generic.websocket import AsyncWebsocketConsumer
-from channels.db import database_sync_to_async
-from django.utils import timezone
-from chat.models import MessengerMessage, MessengerChannel, ChannelMember
+from django.core.exceptions import PermissionDenied
+from chat import membership
+from chat.buffer import message_buffer
+from chat.history import afetch_history
+from chat.read_state import read_receipts
+from chat.presence import presence
+from chat.outbox import Outbox, counters
+
+RESYNC_CLOSE_CODE = 4008
+FORBIDDEN_CLOSE_CODE = 4003
 
 class ChatConsumer(AsyncWebsocketConsumer):
     async def connect(self):
@@ -12,30 +21,83 @@ class ChatConsumer(AsyncWebsocketConsumer):
             await self.close()
             return
 
-        self.channel_id = self.scope['url_route']['kwargs']['channel_id']
+        self.channel_id = int(self.scope['url_route']['kwargs']['channel_id'])
         self.channel_group_name = f"chat_{self.channel_id}"
 
+        # 채널 멤버만 접속 (없는 채널도 여기서 걸러짐)
+        if not await self.is_member():
+            await self.close(code=FORBIDDEN_CLOSE_CODE)
+            return
+
+        # 보낼 프레임은 연결별 큐에 넣고 전송 태스크가 보냄 (느린 클라이언트가 그룹 이벤트 처리를 막지 않도록)
+        self.outbox = Outbox()
+        self.sender_task = None
+        self.resync_task = None
+
         await self.channel_layer.group_add(
             self.channel_group_name,
             self.channel_name
         )
 
         await self.accept() # 연결 수락
+        self.sender_task = asyncio.create_task(self.drain_outbox())
+
+        # 접속자 등록 - 다른 사람들에게는 모아서 알리고, 나에게는 현재 상태를 바로 보냄
+        presence.join(self.channel_id, self.user)
+        await self.presence_update({'type': 'presence_update', **presence.snapshot(self.channel_id)})
 
     async def disconnect(self, close_code):
-        if self.user.is_authenticated: # 인증된 사용자만 그룹 탈퇴 처리
+        if self.user.is_authenticated and hasattr(self, 'channel_group_name'): # 인증된 사용자만 그룹 탈퇴 처리
+            presence.leave(self.channel_id, self.user)
+            for task in (getattr(self, 'sender_task', None), getattr(self, 'resync_task', None)):
+                if task is not None:
+                    task.cancel()
             await self.channel_layer.group_discard(
                 self.channel_group_name,
                 self.channel_name
             )
 
+        # 아직 저장 안 된 메시지/읽음 저장
+        await message_buffer.flush()
+        if self.user.is_authenticated and hasattr(self, 'channel_id'):
+            await read_receipts.flush_member(self.channel_id, self.user.pk)
+
     async def receive(self, text_data):
+        if not await self.still_member():
+            await self.close(code=FORBIDDEN_CLOSE_CODE)
+            return
+
         text_data_json = json.loads(text_data)
+
+        # 이전 대화 불러오기: {"type": "history", "before": <next_cursor>}
+        if text_data_json.get('type') == 'history':
+            await self.send_history(text_data_json.get('before'), text_data_json.get('limit'))
+            return
+
+        # 읽음: {"type": "read", "message_id": <선택, 없으면 최신까지>} - 멤버당 1초에 한 번으로 합쳐서 반영
+        if text_data_json.get('type') == 'read':
+            message_id = text_data_json.get('message_id')
+            if message_id:
+                try:
+                    message_id = int(message_id)
+                except (TypeError, ValueError):
+                    return  # 숫자가 아닌 값은 무시
+                if message_id <= 0:
+                    return
+            await read_receipts.mark(self.channel_id, self.user.pk, message_id or None)
+            return
+
+        # 입력 중: {"type": "typing", "active": true/false} - 상태가 바뀔 때만 모아서 알림
+        if text_data_json.get('type') == 'typing':
+            presence.set_typing(self.channel_id, self.user.pk, bool(text_data_json.get('active', True)))
+            return
+
         message = text_data_json['message']
+        presence.set_typing(self.channel_id, self.user.pk, False)
 
         sender_name = self.user.name
 
-        await self.save_message(message, self.user)
+        saved = await self.save_message(message, self.user)
 
         await self.channel_layer.group_send(
             self.channel_group_name,
@@ -43,41 +105,86 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 'type': 'chat_message',
                 'message': message,
                 'sender': sender_name,
-                'sent_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
+                'sent_at': saved.sent_at.strftime('%Y-%m-%d %H:%M:%S')  # 대화 기록과 같은 시각
             }
         )
 
+    def push(self, frame, key=None):
+        """보낼 프레임을 큐에 넣음 - 큐가 넘쳐 resync 상태가 되면 종료 처리를 따로 시작 (이벤트 처리는 막지 않음)"""
+        self.outbox.put(frame, key)
+        if self.outbox.needs_resync and self.resync_task is None:
+            self.resync_task = asyncio.create_task(self.resync())
+
     async def chat_message(self, event):
-        await self.send(text_data=json.dumps({
+        if not await self.still_member():
+            await self.close(code=FORBIDDEN_CLOSE_CODE)
+            return
+        self.push({
             'message': event['message'],
             'sender': event['sender'],
             'sent_at': event['sent_at'],
-        }))
+        })
+
+    async def presence_update(self, event):
+        # 접속자 상태는 최신 것 하나만 있으면 됨
+        self.push({
+            'type': 'presence',
+            'online': event['online'],
+            'typing': event['typing'],
+        }, key='presence')
 
-    @database_sync_to_async
-    def is_member(self):
-        # ...
-        return True
+    async def read_receipt(self, event):
+        # 읽음은 사람별 최신 위치 하나만 있으면 됨
+        self.push({
+            'type': 'read',
+            'user_id': event['user_id'],
+            'message_id': event['message_id'],
+        }, key=('read', event['user_id']))
 
-    @database_sync_to_async
-    def save_message(self, content, user):
+    async def membership_revoked(self, event):
+        # 채널에서 빠진 사람의 연결은 바로 끊음 (ChannelMember 삭제 시 signals에서 보냄)
+        if event['user_id'] == self.user.pk:
+            await self.close(code=FORBIDDEN_CLOSE_CODE)
+
+    async def drain_outbox(self):
+        """전송 태스크 - 큐에서 꺼내 순서대로 보냄 (resync 상태가 되면 종료)"""
+        while True:
+            frame = await self.outbox.get()
+            if frame is None:
+                return
+            await self.send(text_data=json.dumps(frame))
+
+    async def resync(self):
+        """클라이언트가 너무 못 받아서 메시지를 버린 경우 - 멈춰 있는 전송을 취소하고 resync 안내 후 연결 종료"""
+        counters['resyncs'] += 1
+        if self.sender_task is not None:
+            self.sender_task.cancel()
+        await self.send(text_data=json.dumps({'type': 'resync'}))
+        await self.close(code=RESYNC_CLOSE_CODE)
+
+    async def send_history(self, before, limit):
+        if not before:
+            # 첫 페이지는 버퍼에 남아 있는 최신 메시지까지 포함되도록 먼저 저장
+            await message_buffer.flush()
         try:
-            channel = MessengerChannel.objects.get(pk=self.channel_id)
+            page = await afetch_history(self.channel_id, self.user, before, limit)
+        except PermissionDenied:
+            # 재확인 주기 사이에 멤버에서 빠졌어도 기록은 DB 기준으로 막음
+            await self.close(code=FORBIDDEN_CLOSE_CODE)
+            return
+        self.push({'type': 'history', **page})
 
-            if user.is_authenticated:
-                sender_user = user
-            else:
-                sender_user = None
+    async def is_member(self):
+        """DB에서 확인 (membership.ahas_member)"""
+        self.member_checked_at = time.monotonic()
+        return await membership.ahas_member(self.channel_id, self.user.pk)
 
-            MessengerMessage.objects.create(
-                channel=channel,
-                sender=sender_user,
-                content=content
-            )
+    async def still_member(self):
+        """프레임마다 호출 - N초에 한 번만 DB로 다시 확인 (멤버에서 빠져도 최대 N초 뒤에는 끊김)"""
+        if time.monotonic() - self.member_checked_at < membership.recheck_interval():
             return True
-        except MessengerChannel.DoesNotExist:
-            print(f"Error: Channel with ID {self.channel_id} not found.")
-            return False
-        except Exception as e:
-            print(f"Error saving message: {e}")
-            return False
\ No newline at end of file
+        return await self.is_member()
+
+    async def save_message(self, content, user):
+        # DB에 바로 쓰지 않고 버퍼에 모아서 bulk_create
+        return await message_buffer.add(self.channel_id, user.pk, content)
@@ -1 +1,5 @@
-# $env:DJANGO_SETTINGS_MODULE="DoroDB.settings" ; daphne DoroDB.asgi:application -b 127.0.0.1 -p 8001
\ No newline at end of file
+# $env:DJANGO_SETTINGS_MODULE="DoroDB.settings" ; daphne DoroDB.asgi:application -b 127.0.0.1 -p 8001
+# 여러 워커로 띄우거나, 웹 서버에서 한 채팅 멤버 삭제로 daphne의 연결을 바로 끊으려면 (channels_redis 필요)
+# $env:CHANNEL_REDIS_URL="redis://127.0.0.1:6379/0" ; daphne DoroDB.asgi:application -b 127.0.0.1 -p 8001
+# 웹 서버(runserver/gunicorn)와 daphne가 캐시를 공유하도록 (redis 패키지 필요, 두 프로세스 모두 설정)
+# $env:CACHE_REDIS_URL="redis://127.0.0.1:6379/1"
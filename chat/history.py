@@ -0,0 +1,96 @@
+import base64
+from datetime import datetime
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+
+from chat.models import ChannelMember, MessengerMessage
+
+
+def page_size():
+    return getattr(settings, 'CHAT_HISTORY_PAGE_SIZE', 50)
+
+
+def encode_cursor(message):
+    raw = f"{message.sent_at.isoformat()}|{message.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """잘못된 커서는 최신 메시지부터로 처리"""
+    try:
+        sent_at, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(sent_at), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def serialize(message):
+    """실시간 메시지(chat_message 이벤트)와 같은 형식"""
+    return {
+        'id': message.pk,
+        'message': message.content,
+        'sender': message.sender.name,
+        'sender_id': message.sender_id,
+        'sent_at': message.sent_at.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+def _query(channel_id, before, limit):
+    """before(커서)보다 오래된 메시지를 최신순으로 limit + 1개
+
+    (channel, sent_at, id) 인덱스를 channel 고정 + sent_at 범위로 역순 탐색하다가 limit에서 멈춤
+    → 테이블 크기나 얼마나 오래된 페이지인지와 상관없이 인덱스 항목 limit + 1개만 읽습니다.
+    (sent_at < t OR (sent_at = t AND id < n)) 대신 'sent_at <= t AND NOT (sent_at = t AND id >= n)'으로
+    써야 DB가 OR을 풀지 않고 인덱스 범위 조회 한 번으로 처리합니다.
+    """
+    messages = MessengerMessage.objects.filter(channel_id=channel_id)
+    decoded = decode_cursor(before) if before else None
+    if decoded is not None:
+        sent_at, pk = decoded
+        messages = messages.filter(sent_at__lte=sent_at).exclude(sent_at=sent_at, pk__gte=pk)
+    return (
+        messages.select_related('sender')
+        .only('id', 'content', 'sent_at', 'sender_id', 'sender__name')
+        .order_by('-sent_at', '-id')[:limit + 1]
+    )
+
+
+def _page(rows, limit):
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        'messages': [serialize(m) for m in reversed(rows)],  # 화면에는 오래된 것부터
+        'next_cursor': encode_cursor(rows[-1]) if has_more else None,
+    }
+
+
+def _limit(limit):
+    try:
+        limit = int(limit or page_size())
+    except (TypeError, ValueError):
+        limit = page_size()
+    return max(1, min(limit, 100))
+
+
+def _members(channel_id, user):
+    return ChannelMember.objects.filter(channel_id=channel_id, user_id=user.pk)
+
+
+def fetch_history(channel_id, user, before=None, limit=None):
+    """채널 대화 기록 한 페이지 → {'messages': [...], 'next_cursor': 더 오래된 페이지 커서 또는 None}
+
+    user가 채널 멤버인지 DB에서 확인 - 아니면 PermissionDenied
+    """
+    if not _members(channel_id, user).exists():
+        raise PermissionDenied
+    limit = _limit(limit)
+    return _page(list(_query(channel_id, before, limit)), limit)
+
+
+async def afetch_history(channel_id, user, before=None, limit=None):
+    """fetch_history의 async 버전 (async 뷰 / ChatConsumer)"""
+    if not await _members(channel_id, user).aexists():
+        raise PermissionDenied
+    limit = _limit(limit)
+    return _page([m async for m in _query(channel_id, before, limit)], limit)
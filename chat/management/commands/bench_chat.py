@@ -0,0 +1,182 @@
+import asyncio
+import json
+import random
+import time
+
+from asgiref.sync import async_to_sync
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from chat import outbox
+from chat.buffer import message_buffer
+from chat.models import ChannelMember, MessengerChannel, MessengerMessage
+from chat.routing import websocket_urlpatterns
+from user.models import User
+
+
+BENCH_PREFIX = 'bench:'
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = ('방 N개 × 클라이언트 M명이 초당 R개씩 메시지를 보낼 때 ChatConsumer의 지연/처리량/메시지당 DB 쿼리를 측정합니다. '
+            '(WebsocketCommunicator로 프로세스 안에서 실행, 데이터는 롤백됨)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rooms', type=int, default=10)
+        parser.add_argument('--clients', type=int, default=20, help='방마다 접속하는 클라이언트 수')
+        parser.add_argument('--rate', type=float, default=1.0, help='클라이언트 한 명이 초당 보내는 메시지 수')
+        parser.add_argument('--duration', type=float, default=5.0, help='전송 시간(초)')
+        parser.add_argument('--drain', type=float, default=5.0, help='전송이 끝난 뒤 남은 메시지를 기다리는 최대 시간(초)')
+
+    def handle(self, *args, **options):
+        # async 코드의 DB 작업(thread_sensitive)이 이 스레드에서 실행되도록 async_to_sync 사용
+        # → 같은 연결/트랜잭션이라 시드 데이터와 저장된 메시지를 끝나고 롤백할 수 있고 쿼리 수도 셀 수 있음
+        self.queries = {'total': 0, 'sending': 0, 'inserts': 0}
+        self.sending = False
+        with transaction.atomic():
+            rooms = self.seed(options['rooms'], options['clients'])
+            with connection.execute_wrapper(self.count_query):
+                result = async_to_sync(self.run)(rooms, options)
+            transaction.set_rollback(True)
+
+        self.report(result, options)
+
+    def count_query(self, execute, sql, params, many, context):
+        """전체 쿼리 수 + 메시지 전송 구간의 쿼리 / 메시지 INSERT 수"""
+        self.queries['total'] += 1
+        if self.sending:
+            self.queries['sending'] += 1
+            if sql.lstrip().upper().startswith('INSERT') and MessengerMessage._meta.db_table in sql:
+                self.queries['inserts'] += 1
+        return execute(sql, params, many, context)
+
+    def seed(self, room_count, client_count):
+        password = make_password(None)
+        users = User.objects.bulk_create([
+            User(email=f'bench-chat-{i}@example.com', name=f'bench{i}', phone_number=f'bench-chat-{i}', password=password)
+            for i in range(client_count)
+        ])
+        channels = MessengerChannel.objects.bulk_create([
+            MessengerChannel(channel_name=f'bench {i}', channel_type='bench') for i in range(room_count)
+        ])
+        ChannelMember.objects.bulk_create([
+            ChannelMember(channel=channel, user=user) for channel in channels for user in users
+        ])
+        return [(channel, users) for channel in channels]
+
+    async def run(self, rooms, options):
+        application = URLRouter(websocket_urlpatterns)
+        stats_before = dict(outbox.counters)
+
+        # 1) 모든 클라이언트 접속
+        clients = []
+        for channel, users in rooms:
+            for user in users:
+                communicator = WebsocketCommunicator(application, f'/ws/chat/{channel.pk}/')
+                communicator.scope['user'] = user
+                connected, _ = await communicator.connect()
+                if not connected:
+                    raise RuntimeError(f'접속 실패: channel {channel.pk}, user {user.pk}')
+                clients.append(communicator)
+
+        latencies = []
+        delivered = 0
+        closed = 0
+
+        async def reader(communicator):
+            nonlocal delivered, closed
+            while True:
+                output = await communicator.receive_output(timeout=3600)
+                if output['type'] == 'websocket.close':
+                    closed += 1
+                    return
+                frame = json.loads(output['text'])
+                messages = frame['messages'] if frame.get('type') == 'batch' else [frame]
+                now = time.perf_counter()
+                for message in messages:
+                    content = message.get('message') if 'type' not in message else None
+                    if content and content.startswith(BENCH_PREFIX):
+                        latencies.append(now - float(content[len(BENCH_PREFIX):]))
+                        delivered += 1
+
+        # 2) 클라이언트마다 초당 rate개씩 (시작 시점은 흩어서) duration 동안 전송
+        sent = 0
+
+        async def writer(communicator):
+            nonlocal sent
+            interval = 1 / options['rate']
+            await asyncio.sleep(random.uniform(0, interval))
+            deadline = time.perf_counter() + options['duration']
+            while time.perf_counter() < deadline:
+                await communicator.send_to(text_data=json.dumps({'message': f'{BENCH_PREFIX}{time.perf_counter()}'}))
+                sent += 1
+                await asyncio.sleep(interval)
+
+        readers = [asyncio.create_task(reader(c)) for c in clients]
+        self.sending = True  # 여기부터 버퍼 flush까지의 쿼리만 '메시지당'으로 계산 (접속/종료 제외)
+        started = time.perf_counter()
+        await asyncio.gather(*(writer(c) for c in clients))
+        send_elapsed = time.perf_counter() - started
+
+        # 3) 남은 메시지 도착 대기 (같은 방의 모든 클라이언트가 받아야 함)
+        expected = sent * options['clients']
+        drain_deadline = time.perf_counter() + options['drain']
+        while delivered < expected and time.perf_counter() < drain_deadline:
+            await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - started
+        await message_buffer.flush()
+        self.sending = False
+
+        for task in readers:
+            task.cancel()
+        for communicator in clients:
+            await communicator.disconnect()
+
+        return {
+            'clients': len(clients),
+            'sent': sent,
+            'expected': expected,
+            'delivered': delivered,
+            'closed': closed,
+            'latencies': latencies,
+            'send_elapsed': send_elapsed,
+            'elapsed': elapsed,
+            'outbox': {key: outbox.counters[key] - stats_before[key] for key in stats_before},
+        }
+
+    def report(self, result, options):
+        sent = result['sent'] or 1
+
+        self.stdout.write(
+            f"방 {options['rooms']} × 클라이언트 {options['clients']} (연결 {result['clients']}), "
+            f"클라이언트당 {options['rate']}/s, {options['duration']}s"
+        )
+        self.stdout.write(
+            f"전송 {result['sent']:,}개 ({result['sent'] / result['send_elapsed']:.0f} msg/s)  "
+            f"수신 {result['delivered']:,}/{result['expected']:,}개 ({result['delivered'] / result['elapsed']:.0f} msg/s)"
+        )
+        if result['latencies']:
+            self.stdout.write(
+                "지연: " + '  '.join(
+                    f"p{pct} {_percentile(result['latencies'], pct) * 1000:.1f}ms" for pct in (50, 95, 99)
+                ) + f"  max {max(result['latencies']) * 1000:.1f}ms"
+            )
+        self.stdout.write(
+            f"DB (전송 중): 쿼리 {self.queries['sending']:,}개 (메시지당 {self.queries['sending'] / sent:.3f}), "
+            f"메시지 INSERT {self.queries['inserts']}개 (메시지당 {self.queries['inserts'] / sent:.3f})  |  "
+            f"전체 {self.queries['total']:,}개 (접속/종료 포함)"
+        )
+        self.stdout.write(
+            f"전송 큐: batch로 합친 메시지 {result['outbox']['coalesced']}, 버린 프레임 {result['outbox']['dropped']}, "
+            f"resync {result['outbox']['resyncs']}, 끊긴 연결 {result['closed']}"
+        )
+        if result['delivered'] < result['expected']:
+            self.stdout.write(self.style.WARNING(f"⚠️ 수신 누락 {result['expected'] - result['delivered']:,}개"))
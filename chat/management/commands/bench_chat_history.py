@@ -0,0 +1,81 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from chat import history
+from chat.models import ChannelMember, MessengerChannel, MessengerMessage
+from user.models import User
+
+
+class Command(BaseCommand):
+    help = '메시지가 많은 테이블에서 대화 기록 커서 페이지네이션 시간을 OFFSET 방식과 비교합니다. (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=1_000_000, help='전체 메시지 수 (채널 10개에 나눠 넣음)')
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            channel, sender, total = self.seed(options['messages'])
+            self.stdout.write(f"메시지 {options['messages']:,}개 중 측정 채널 {total:,}개")
+
+            plan = history._query(channel.pk, None, history.page_size()).explain()
+            self.stdout.write(f"실행 계획: {plan}")
+
+            # 첫 페이지 / 중간 / 가장 오래된 쪽까지 커서로 내려간 위치에서 측정
+            first = history.fetch_history(channel.pk, sender)
+            middle = self.cursor_at(channel, total // 2)
+            oldest = self.cursor_at(channel, total - history.page_size() - 1)
+
+            for label, cursor, depth in (('첫 페이지', None, 0), ('중간', middle, total // 2),
+                                         ('마지막 근처', oldest, total - history.page_size() - 1)):
+                keyset = self.measure(lambda: history.fetch_history(channel.pk, sender, cursor), options['repeat'])
+                offset = self.measure(lambda: list(
+                    MessengerMessage.objects.filter(channel=channel).select_related('sender')
+                    .order_by('-sent_at', '-id')[depth:depth + history.page_size()]
+                ), options['repeat'])
+                self.stdout.write(f"{label:8}: keyset {keyset:7.2f} ms  |  OFFSET {depth:>9,} {offset:8.2f} ms")
+
+            assert len(first['messages']) == history.page_size()
+            transaction.set_rollback(True)
+
+    def measure(self, fn, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return timings[len(timings) // 2]
+
+    def cursor_at(self, channel, depth):
+        message = MessengerMessage.objects.filter(channel=channel).order_by('-sent_at', '-id')[depth]
+        return history.encode_cursor(message)
+
+    def seed(self, count, channel_count=10):
+        sender = User.objects.create_user(
+            email='bench-chat@example.com', password=None, name='bench', phone_number='bench-chat'
+        )
+        channels = MessengerChannel.objects.bulk_create([
+            MessengerChannel(channel_name=f'bench {i}', channel_type='bench') for i in range(channel_count)
+        ])
+        ChannelMember.objects.bulk_create([ChannelMember(channel=channel, user=sender) for channel in channels])
+
+        # ORM bulk_create는 수백만 건에서 느리므로 executemany로 직접 INSERT
+        table = MessengerMessage._meta.db_table
+        sql = f'INSERT INTO {table} (channel_id, sender_id, content, sent_at, is_read) VALUES (%s, %s, %s, %s, %s)'
+        start = timezone.now() - timedelta(seconds=count)
+        batch = 50_000
+        with connection.cursor() as cursor:
+            for offset in range(0, count, batch):
+                cursor.executemany(sql, [
+                    (channels[i % channel_count].pk, sender.pk, f'message {i}',
+                     # 채널마다 두 개씩 같은 시각 → 같은 시각끼리는 id로 순서 결정
+                     connection.ops.adapt_datetimefield_value(start + timedelta(seconds=i // (2 * channel_count))),
+                     False)
+                    for i in range(offset, min(offset + batch, count))
+                ])
+        return channels[0], sender, MessengerMessage.objects.filter(channel=channels[0]).count()
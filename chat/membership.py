@@ -0,0 +1,31 @@
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+
+from chat.models import ChannelMember
+
+
+def recheck_interval():
+    return getattr(settings, 'CHAT_MEMBERSHIP_RECHECK', 5)
+
+
+async def ahas_member(channel_id, user_id):
+    """DB에서 바로 확인 - ChatConsumer의 접속/주기적 재확인용 (channel_id, user_id 유니크 인덱스 조회 한 번)
+
+    캐시는 쓰지 않음 - daphne는 웹 서버와 다른 프로세스라 LocMem 캐시로는 웹 서버에서 한 멤버 변경이 전달되지 않음
+    """
+    return await ChannelMember.objects.filter(channel_id=channel_id, user_id=user_id).aexists()
+
+
+def revoke(channel_id, user_id):
+    """채널에서 빠진 멤버 - 이 채널에 연결된 그 사람의 웹소켓을 바로 끊게 함
+
+    다른 프로세스(daphne)의 연결까지 바로 끊으려면 CHANNEL_REDIS_URL(채널 레이어)이 필요합니다.
+    인메모리 채널 레이어면 그 연결은 ChatConsumer의 재확인(CHAT_MEMBERSHIP_RECHECK초)에서 끊깁니다.
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is not None:
+        async_to_sync(channel_layer.group_send)(f"chat_{channel_id}", {
+            'type': 'membership_revoked',
+            'user_id': user_id,
+        })
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="messengermessage",
+            index=models.Index(
+                fields=["channel", "sent_at", "id"], name="msg_channel_sent_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def mark_existing_read(apps, schema_editor):
+    """기존 메시지는 모두 읽은 것으로 시작 (배포 직후 전체 대화가 안 읽음으로 뜨지 않도록)"""
+    ChannelMember = apps.get_model("chat", "ChannelMember")
+    MessengerMessage = apps.get_model("chat", "MessengerMessage")
+    latest = (
+        MessengerMessage.objects.filter(channel_id=OuterRef("channel_id"))
+        .values("channel_id")
+        .annotate(latest=Max("id"))
+        .values("latest")
+    )
+    ChannelMember.objects.update(last_read_message_id=Coalesce(Subquery(latest), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0003_messengermessage_channel_sent_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="channelmember",
+            name="last_read_message_id",
+            field=models.BigIntegerField(
+                default=0, verbose_name="마지막으로 읽은 메시지 ID"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="messengermessage",
+            name="channel",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="chat.messengerchannel",
+                verbose_name="채널",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="messengermessage",
+            index=models.Index(fields=["channel", "id"], name="msg_channel_id_idx"),
+        ),
+        migrations.RunPython(mark_existing_read, migrations.RunPython.noop),
+    ]
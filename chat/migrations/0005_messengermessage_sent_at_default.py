@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:07
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0004_channelmember_last_read_message_id"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="messengermessage",
+            name="sent_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="전송 일시",
+            ),
+        ),
+    ]
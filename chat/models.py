@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from user.models import User  # users 앱의 User 모델 임포트
 # courses 앱에서 참조할 모델 임포트
 from courses.models import Class, ClassComment
@@ -28,6 +29,8 @@ class MessengerChannel(models.Model):
 class ChannelMember(models.Model):
     channel = models.ForeignKey(MessengerChannel, on_delete=models.CASCADE, verbose_name="채널")
     user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="사용자")
+    # 이 멤버가 마지막으로 읽은 메시지 ID (이보다 큰 ID의 메시지 = 안 읽은 메시지)
+    last_read_message_id = models.BigIntegerField(default=0, verbose_name="마지막으로 읽은 메시지 ID")
 
     class Meta:
         db_table = 'channel_member'
@@ -41,16 +44,24 @@ class ChannelMember(models.Model):
 
 # 메신저 메시지
 class MessengerMessage(models.Model):
-    channel = models.ForeignKey(MessengerChannel, on_delete=models.CASCADE, verbose_name="채널")
+    # 단일 channel 인덱스 대신 아래 (channel, id) 복합 인덱스 사용
+    channel = models.ForeignKey(MessengerChannel, on_delete=models.CASCADE, db_index=False, verbose_name="채널")
     sender = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="보낸 사람")
     content = models.TextField(verbose_name="내용")
-    sent_at = models.DateTimeField(auto_now_add=True, verbose_name="전송 일시")
-    is_read = models.BooleanField(default=False, verbose_name="읽음 여부")
+    # auto_now_add면 bulk_create 시점으로 덮어써지므로 default - 버퍼(chat/buffer.py)가 받은 시각을 넣음
+    sent_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name="전송 일시")
+    is_read = models.BooleanField(default=False, verbose_name="읽음 여부")  # 사용 안 함 - ChannelMember.last_read_message_id 사용
 
     class Meta:
         db_table = 'messenger_messages'
         verbose_name = '메신저 메시지'
         verbose_name_plural = '메신저 메시지 목록'
+        indexes = [
+            # 대화 기록 커서 페이지네이션 (채널별 sent_at, id 역순 범위 조회)
+            models.Index(fields=['channel', 'sent_at', 'id'], name='msg_channel_sent_idx'),
+            # 안 읽은 메시지 수 (채널별 id > last_read_message_id 범위 COUNT)
+            models.Index(fields=['channel', 'id'], name='msg_channel_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.sender.name}: {self.content[:20]}..."
\ No newline at end of file
@@ -0,0 +1,133 @@
+import asyncio
+import weakref
+from collections import deque
+
+from django.conf import settings
+
+
+# 프로세스 전체 누적 카운터 (chat_stats_view에서 조회)
+counters = {
+    'sent': 0,        # 클라이언트로 보낸 프레임
+    'coalesced': 0,   # 큐가 넘쳐서 batch 프레임 하나로 합친 메시지 수
+    'dropped': 0,     # resync로 버린 프레임 수 (batch 안의 메시지는 하나씩 셈)
+    'resyncs': 0,     # resync 후 연결을 끊은 횟수
+}
+_outboxes = weakref.WeakSet()
+
+
+def _is_message(frame):
+    # 채팅 메시지 프레임만 type 없이 {"message", "sender", "sent_at"} 형식 (기존 클라이언트 호환)
+    return 'type' not in frame and 'message' in frame
+
+
+class Outbox:
+    """연결 하나의 보낼 프레임 큐 (크기 제한)
+
+    그룹 이벤트 핸들러는 여기에 넣기만 하고 바로 돌아가서, 느린 클라이언트 하나 때문에
+    채널 레이어 inbox가 쌓이지 않게 합니다. 실제 전송은 연결마다 하나인 전송 태스크가 합니다.
+
+    - key가 있는 프레임(접속자 상태, 사람별 읽음)은 아직 안 보낸 같은 key 프레임을 최신 값으로 바꿈
+    - 큐가 max_size를 넘으면 대기 중인 채팅 메시지를 {"type": "batch"} 프레임 하나로 합침
+    - 합친 메시지까지 resync_at개를 넘으면 남은 프레임을 버리고 resync 상태가 됨
+      (전송 태스크가 {"type": "resync"}를 보내고 연결을 끊음 → 클라이언트는 다시 접속해서 기록을 불러옴)
+    """
+
+    def __init__(self, max_size=None, resync_at=None):
+        self.max_size = max_size or getattr(settings, 'CHAT_OUTBOX_SIZE', 100)
+        self.resync_at = resync_at or getattr(settings, 'CHAT_OUTBOX_RESYNC_AT', 1000)
+        self.frames = deque()
+        self.keyed = {}     # key → 큐에 있는 프레임
+        self._keys = {}     # id(프레임) → key
+        self.pending_messages = 0
+        self.max_depth = 0
+        self.needs_resync = False
+        self._ready = asyncio.Event()
+        _outboxes.add(self)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def put(self, frame, key=None):
+        if self.needs_resync:
+            counters['dropped'] += 1
+            return
+
+        if key is not None and key in self.keyed:
+            self.keyed[key].clear()
+            self.keyed[key].update(frame)   # 큐 안의 같은 프레임을 최신 값으로 (위치 그대로)
+            return
+
+        self.frames.append(frame)
+        if key is not None:
+            self.keyed[key] = frame
+            self._keys[id(frame)] = key
+        if _is_message(frame):
+            self.pending_messages += 1
+
+        if len(self.frames) > self.max_size:
+            self._coalesce()
+        if self.pending_messages > self.resync_at:
+            self._start_resync()
+
+        self.max_depth = max(self.max_depth, len(self.frames))
+        self._ready.set()
+
+    def _coalesce(self):
+        """대기 중인 채팅 메시지(및 이전 batch)를 첫 메시지 위치의 batch 프레임 하나로 합침"""
+        messages = []
+        rest = deque()
+        position = None
+        for frame in self.frames:
+            if frame.get('type') == 'batch':
+                messages.extend(frame['messages'])
+            elif _is_message(frame):
+                messages.append(frame)
+                counters['coalesced'] += 1
+            else:
+                rest.append(frame)
+                continue
+            if position is None:
+                position = len(rest)
+        if messages:
+            rest.insert(position, {'type': 'batch', 'messages': messages})
+        self.frames = rest
+
+    def _start_resync(self):
+        counters['dropped'] += sum(len(f['messages']) if f.get('type') == 'batch' else 1 for f in self.frames)
+        self.frames.clear()
+        self.keyed.clear()
+        self._keys.clear()
+        self.pending_messages = 0
+        self.needs_resync = True
+        self._ready.set()
+
+    async def get(self):
+        """다음에 보낼 프레임 - resync 상태면 None"""
+        while not self.frames and not self.needs_resync:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.needs_resync:
+            return None
+
+        frame = self.frames.popleft()
+        key = self._keys.pop(id(frame), None)
+        if key is not None:
+            del self.keyed[key]
+        if frame.get('type') == 'batch':
+            self.pending_messages -= len(frame['messages'])
+        elif _is_message(frame):
+            self.pending_messages -= 1
+        counters['sent'] += 1
+        return frame
+
+
+def stats():
+    """현재 연결들의 큐 길이 + 누적 카운터"""
+    depths = [len(outbox) for outbox in _outboxes]
+    return {
+        'connections': len(depths),
+        'queued_frames': sum(depths),
+        'max_queue_depth': max(depths, default=0),
+        'max_depth_seen': max((outbox.max_depth for outbox in _outboxes), default=0),
+        **counters,
+    }
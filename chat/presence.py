@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+from channels.layers import get_channel_layer
+from django.conf import settings
+
+
+class PresenceTracker:
+    """채널별 접속자 / 입력 중 상태 (메모리)
+
+    상태가 바뀔 때마다 group_send 하지 않고 채널을 '변경됨'으로 표시해 두었다가,
+    채널당 N초(기본 0.25초)에 한 번 현재 상태 전체를 presence_update 이벤트 하나로 보냅니다.
+    40명이 동시에 입력해도 채널당 초당 몇 번의 알림만 나갑니다.
+    - 같은 사람이 계속 입력 중이면 만료 시각만 늘리고 알림은 보내지 않음
+    - 입력 표시는 TYPING_TTL초 동안 새 입력이 없으면 자동으로 사라짐
+
+    워커 프로세스(이벤트 루프)마다 하나씩 두고 모든 ChatConsumer가 공유합니다.
+    (워커를 여러 개 띄우면 각 워커는 자기에게 연결된 접속자만 압니다)
+    """
+
+    def __init__(self, interval=None, typing_ttl=None):
+        self.interval = interval or getattr(settings, 'CHAT_PRESENCE_INTERVAL', 0.25)
+        self.typing_ttl = typing_ttl or getattr(settings, 'CHAT_TYPING_TTL', 5)
+        self.online = {}   # channel_id → {user_id: [이름, 연결 수]}
+        self.typing = {}   # channel_id → {user_id: 만료 시각 (monotonic)}
+        self._timers = {}  # channel_id → 예약된 알림
+        self._sent = {}    # channel_id → 마지막으로 보낸 상태 (같으면 다시 보내지 않음)
+
+    # --- 상태 변경 ---
+
+    def join(self, channel_id, user):
+        members = self.online.setdefault(channel_id, {})
+        if user.pk in members:
+            members[user.pk][1] += 1   # 같은 사람의 다른 탭 - 알림 없음
+        else:
+            members[user.pk] = [user.name, 1]
+            self._changed(channel_id)
+
+    def leave(self, channel_id, user):
+        members = self.online.get(channel_id, {})
+        if user.pk not in members:
+            return
+        members[user.pk][1] -= 1
+        if members[user.pk][1] > 0:
+            return
+        del members[user.pk]
+        self.typing.get(channel_id, {}).pop(user.pk, None)
+        if not members:
+            self.online.pop(channel_id, None)
+            self.typing.pop(channel_id, None)
+        self._changed(channel_id)
+
+    def set_typing(self, channel_id, user_id, active=True):
+        typing = self.typing.setdefault(channel_id, {})
+        if active:
+            was_typing = user_id in typing
+            typing[user_id] = time.monotonic() + self.typing_ttl
+            if not was_typing:
+                self._changed(channel_id)
+        elif typing.pop(user_id, None) is not None:
+            self._changed(channel_id)
+
+    # --- 조회 ---
+
+    def snapshot(self, channel_id):
+        """현재 접속자 / 입력 중인 사람 (만료된 입력 표시는 정리)"""
+        now = time.monotonic()
+        typing = self.typing.get(channel_id, {})
+        for user_id in [u for u, expires in typing.items() if expires <= now]:
+            del typing[user_id]
+        members = self.online.get(channel_id, {})
+        return {
+            'online': [{'id': user_id, 'name': name} for user_id, (name, _) in members.items()],
+            'typing': [user_id for user_id in typing if user_id in members],
+        }
+
+    # --- 알림 ---
+
+    def _changed(self, channel_id, delay=None):
+        """알림 예약 - 이미 예약돼 있으면 그 알림에 합쳐짐"""
+        if channel_id in self._timers:
+            return
+        loop = asyncio.get_running_loop()
+        self._timers[channel_id] = loop.call_later(
+            self.interval if delay is None else delay,
+            lambda: loop.create_task(self.flush(channel_id)),
+        )
+
+    async def flush(self, channel_id):
+        timer = self._timers.pop(channel_id, None)
+        if timer is not None:
+            timer.cancel()
+
+        state = self.snapshot(channel_id)
+        if state != self._sent.get(channel_id):
+            if state['online']:
+                self._sent[channel_id] = state
+            else:
+                self._sent.pop(channel_id, None)
+            await get_channel_layer().group_send(f"chat_{channel_id}", {'type': 'presence_update', **state})
+
+        # 입력 표시가 남아 있으면 가장 먼저 만료되는 시각에 한 번 더 알림 (사라진 표시 반영)
+        typing = self.typing.get(channel_id)
+        if typing:
+            self._changed(channel_id, delay=max(min(typing.values()) - time.monotonic(), self.interval))
+
+
+presence = PresenceTracker()
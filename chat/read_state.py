@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import time
+
+from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db.models import Count, F, Max, Q
+
+from chat.buffer import message_buffer
+from chat.models import ChannelMember, MessengerMessage
+
+
+logger = logging.getLogger(__name__)
+
+def _unread_query(user):
+    # 채널 멤버 행 기준 LEFT JOIN 메시지 + GROUP BY → 채널 수와 상관없이 쿼리 1번
+    # 내가 보낸 메시지는 안 읽은 수에서 제외
+    return ChannelMember.objects.filter(user=user).annotate(
+        unread=Count(
+            'channel__messengermessage',
+            filter=Q(channel__messengermessage__id__gt=F('last_read_message_id'))
+            & ~Q(channel__messengermessage__sender=user),
+        )
+    ).values_list('channel_id', 'unread')
+
+
+def unread_counts(user):
+    """사용자가 참여한 모든 채널의 안 읽은 메시지 수 → {channel_id: count}"""
+    return dict(_unread_query(user))
+
+
+async def aunread_counts(user):
+    """unread_counts의 async 버전"""
+    return {channel_id: unread async for channel_id, unread in _unread_query(user)}
+
+
+def mark_read(channel_id, user_id, message_id=None):
+    """읽음 위치를 message_id(없으면 채널의 최신 메시지)까지 올림 → 실제로 반영된 message_id 또는 None
+
+    뒤로 가지는 않도록 현재 값보다 클 때만 UPDATE (행 하나, 메시지 행은 건드리지 않음)
+    message_id는 클라이언트가 보낸 값이므로 채널의 최신 메시지 ID를 넘지 않게 자름
+    (없는 큰 값으로 읽음 위치가 앞질러 가면 이후 메시지가 계속 읽은 것으로 계산됨)
+    """
+    latest = MessengerMessage.objects.filter(channel_id=channel_id).aggregate(latest=Max('id'))['latest']
+    if latest is None:
+        return None
+    message_id = latest if message_id is None else min(message_id, latest)
+
+    updated = ChannelMember.objects.filter(
+        channel_id=channel_id, user_id=user_id, last_read_message_id__lt=message_id
+    ).update(last_read_message_id=message_id)
+    return message_id if updated else None
+
+
+class ReadReceiptBuffer:
+    """읽음 표시 모아 보내기
+
+    메시지를 받을 때마다 클라이언트가 읽음을 보내도, 멤버 한 명당 N초(기본 1초)에 한 번만
+    DB에 반영하고 채널 그룹에 read_receipt 이벤트를 보냅니다. 그 사이 들어온 읽음은 가장 큰 위치 하나로 합칩니다.
+    워커 프로세스(이벤트 루프)마다 하나씩 두고 모든 ChatConsumer가 공유합니다.
+    """
+
+    LATEST = 0  # message_id를 지정하지 않은 읽음 (= 반영 시점의 최신 메시지까지)
+
+    def __init__(self, interval=None):
+        self.interval = interval or getattr(settings, 'CHAT_READ_RECEIPT_INTERVAL', 1.0)
+        self.pending = {}      # (channel_id, user_id) → message_id (LATEST면 최신까지)
+        self.last_sent = {}    # (channel_id, user_id) → 마지막 반영 시각 (monotonic)
+        self._timers = {}
+        self._tasks = set()  # 실행 중인 flush 태스크 (참조를 잡아 두지 않으면 도중에 GC될 수 있음)
+
+    async def mark(self, channel_id, user_id, message_id=None):
+        key = (channel_id, user_id)
+        message_id = self.LATEST if message_id is None else message_id
+        previous = self.pending.get(key)
+        if previous is None:
+            self.pending[key] = message_id
+        elif self.LATEST in (previous, message_id):
+            self.pending[key] = self.LATEST
+        else:
+            self.pending[key] = max(previous, message_id)
+
+        if key in self._timers:
+            return  # 이미 예약됨 - 위치만 합쳐 두고 끝
+
+        delay = self.last_sent.get(key, 0) + self.interval - time.monotonic()
+        if delay <= 0:
+            await self.flush(key)
+        else:
+            self._timers[key] = asyncio.get_running_loop().call_later(delay, self._start_flush, key)
+
+    def _start_flush(self, key):
+        self._timers.pop(key, None)
+        task = asyncio.get_running_loop().create_task(self.flush(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self, key):
+        """멤버 한 명의 읽음을 반영하고 채널에 알림"""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        message_id = self.pending.pop(key, None)
+        if message_id is None:
+            return None
+        self.last_sent[key] = time.monotonic()
+
+        channel_id, user_id = key
+        if message_id == self.LATEST:
+            # 최신 위치는 버퍼에 남아 있는 메시지까지 저장한 뒤에 계산
+            await message_buffer.flush()
+        try:
+            message_id = await self.write(channel_id, user_id, None if message_id == self.LATEST else message_id)
+        except Exception:
+            logger.exception("읽음 위치 저장 실패 (channel %s, user %s)", channel_id, user_id)
+            return None
+
+        if message_id is not None:
+            await get_channel_layer().group_send(f"chat_{channel_id}", {
+                'type': 'read_receipt',
+                'user_id': user_id,
+                'message_id': message_id,
+            })
+        return message_id
+
+    async def flush_member(self, channel_id, user_id):
+        """연결이 끊길 때 - 기다리는 읽음이 있으면 바로 반영"""
+        await self.flush((channel_id, user_id))
+        self.last_sent.pop((channel_id, user_id), None)
+
+    @database_sync_to_async
+    def write(self, channel_id, user_id, message_id):
+        return mark_read(channel_id, user_id, message_id)
+
+
+read_receipts = ReadReceiptBuffer()
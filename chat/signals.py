@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from chat.models import ChannelMember
+from chat import membership
+
+
+@receiver(post_delete, sender=ChannelMember)
+def revoke_membership(sender, instance, **kwargs):
+    """멤버 삭제 - 열려 있는 연결을 끊음 (추가/변경은 ChatConsumer가 DB로 확인하므로 따로 할 일 없음)"""
+    transaction.on_commit(lambda: membership.revoke(instance.channel_id, instance.user_id))
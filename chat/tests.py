@@ -1,3 +1,127 @@
+import asyncio
+from datetime import timedelta
+from unittest import mock
+
+from django.db import DatabaseError
 from django.test import TestCase
 
-# Create your tests here.
+from user.models import User
+from .buffer import MessageBuffer
+from .models import ChannelMember, MessengerChannel, MessengerMessage
+from .read_state import mark_read, unread_counts
+
+
+class MarkReadTests(TestCase):
+    """읽음 위치 - 클라이언트가 보낸 message_id는 채널의 최신 메시지를 넘지 않음"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.reader = User.objects.create_user(
+            email='reader@example.com', password='pw', name='읽는 사람', phone_number='010-0000-0011'
+        )
+        cls.sender = User.objects.create_user(
+            email='sender@example.com', password='pw', name='보낸 사람', phone_number='010-0000-0012'
+        )
+        cls.channel = MessengerChannel.objects.create(channel_name='상담', channel_type='counslation')
+        for user in (cls.reader, cls.sender):
+            ChannelMember.objects.create(channel=cls.channel, user=user)
+
+    def send(self, content='안녕하세요'):
+        return MessengerMessage.objects.create(channel=self.channel, sender=self.sender, content=content)
+
+    def test_message_id_past_latest_is_clamped(self):
+        latest = self.send()
+        self.assertEqual(mark_read(self.channel.pk, self.reader.pk, 10 ** 12), latest.pk)
+
+        self.send()
+        self.assertEqual(unread_counts(self.reader), {self.channel.pk: 1})
+
+    def test_does_not_move_backwards(self):
+        first = self.send()
+        second = self.send()
+        self.assertEqual(mark_read(self.channel.pk, self.reader.pk), second.pk)
+        self.assertIsNone(mark_read(self.channel.pk, self.reader.pk, first.pk))
+        self.assertEqual(unread_counts(self.reader), {self.channel.pk: 0})
+
+    def test_empty_channel(self):
+        self.assertIsNone(mark_read(self.channel.pk, self.reader.pk, 5))
+
+
+class MessageBufferTests(TestCase):
+    """채팅 메시지 write-behind 버퍼 - 받은 시각 기록, 저장 실패 시 재시도"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sender = User.objects.create_user(
+            email='buffer@example.com', password='pw', name='보낸 사람', phone_number='010-0000-0013'
+        )
+        cls.channel = MessengerChannel.objects.create(channel_name='상담', channel_type='counslation')
+
+    def bulk_create_failing(self, times):
+        """처음 times번은 DatabaseError, 그 다음부터는 실제 bulk_create"""
+        real = MessengerMessage.objects.bulk_create
+        calls = {'count': 0}
+
+        def bulk_create(*args, **kwargs):
+            calls['count'] += 1
+            if calls['count'] <= times:
+                raise DatabaseError('connection lost')
+            return real(*args, **kwargs)
+        return mock.patch.object(MessengerMessage.objects, 'bulk_create', side_effect=bulk_create), calls
+
+    async def test_sent_at_is_when_the_message_arrived(self):
+        buffer = MessageBuffer(interval_ms=60_000)
+        message = await buffer.add(self.channel.pk, self.sender.pk, '안녕하세요')
+        arrived = message.sent_at
+
+        with mock.patch('django.utils.timezone.now', return_value=arrived + timedelta(seconds=5)):
+            await buffer.flush()
+
+        saved = await MessengerMessage.objects.aget(channel=self.channel)
+        self.assertEqual(saved.sent_at, arrived)
+
+    async def test_failed_batch_is_requeued_in_order(self):
+        buffer = MessageBuffer(interval_ms=60_000)
+        await buffer.add(self.channel.pk, self.sender.pk, '첫 번째')
+        patcher, calls = self.bulk_create_failing(1)
+        with patcher, self.assertLogs('chat.buffer', 'ERROR'):
+            self.assertEqual(await buffer.flush(), 0)
+            self.assertEqual([m.content for m in buffer.pending], ['첫 번째'])
+            self.assertIsNotNone(buffer._timer)  # 다음 주기에 다시 시도하도록 예약됨
+
+            await buffer.add(self.channel.pk, self.sender.pk, '두 번째')
+            self.assertEqual(await buffer.flush(), 2)
+
+        self.assertEqual(calls['count'], 2)
+        self.assertEqual(buffer.failures, 0)
+        contents = [m.content async for m in MessengerMessage.objects.filter(channel=self.channel).order_by('id')]
+        self.assertEqual(contents, ['첫 번째', '두 번째'])
+
+    async def test_batch_is_dropped_after_max_retries(self):
+        buffer = MessageBuffer(interval_ms=60_000)
+        buffer.max_retries = 2
+        await buffer.add(self.channel.pk, self.sender.pk, '안녕하세요')
+        patcher, _ = self.bulk_create_failing(10)
+        with patcher, self.assertLogs('chat.buffer', 'ERROR') as logs:
+            for _ in range(3):
+                await buffer.flush()
+
+        self.assertEqual(buffer.pending, [])
+        self.assertIn('배치를 버립니다', logs.output[-1])
+        self.assertFalse(await MessengerMessage.objects.filter(channel=self.channel).aexists())
+
+    async def test_timer_flush_task_is_kept_until_done(self):
+        buffer = MessageBuffer(interval_ms=50)
+        patcher, calls = self.bulk_create_failing(1)
+        with patcher, self.assertLogs('chat.buffer', 'ERROR'):
+            await buffer.add(self.channel.pk, self.sender.pk, '안녕하세요')
+            await asyncio.sleep(0.1)    # 50ms: 첫 flush 실패 → 100ms 뒤(150ms) 재시도 예약
+            self.assertEqual(calls['count'], 1)
+            self.assertEqual(len(buffer.pending), 1)
+            self.assertIsNotNone(buffer._timer)
+
+            await asyncio.sleep(0.15)   # 재시도 flush 성공
+        self.assertEqual(calls['count'], 2)
+        self.assertEqual(buffer.pending, [])
+        self.assertEqual(buffer._tasks, set())  # 끝난 태스크는 정리됨
+        self.assertTrue(await MessengerMessage.objects.filter(channel=self.channel).aexists())
@@ -2,5 +2,8 @@ from django.urls import path
 from . import views
 
 urlpatterns = [
+    path('unread/', views.unread_counts_view, name='unread_counts'),
+    path('stats/', views.chat_stats_view, name='chat_stats'),
     path('<int:channel_id>/', views.chat_room, name='chat_room'),
-]
\ No newline at end of file
+    path('<int:channel_id>/history/', views.chat_history_view, name='chat_history'),
+]
@@ -1,6 +1,10 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-# from chat.models import MessengerChannel
+from django.core.exceptions import PermissionDenied
+from django.http import JsonResponse
+from chat import outbox
+from chat.history import afetch_history
+from chat.read_state import aunread_counts
 # Create your views here.
 
 # @login_required
@@ -10,3 +14,34 @@ def chat_room(request, channel_id):
     }
 
     return render(request, 'chat/chat_room.html', context)
+
+
+@login_required
+async def chat_history_view(request, channel_id):
+    """대화 기록 (커서 페이지네이션) - ?before=<next_cursor>&limit=50"""
+    try:
+        page = await afetch_history(
+            channel_id, await request.auser(), request.GET.get('before'), request.GET.get('limit')
+        )
+    except PermissionDenied:  # 채널 멤버가 아님 (chat.history에서 DB로 확인)
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+    return JsonResponse(page)
+
+
+@login_required
+async def unread_counts_view(request):
+    """내가 참여한 채널별 안 읽은 메시지 수 (쿼리 1번)"""
+    counts = await aunread_counts(await request.auser())
+    return JsonResponse({
+        'channels': {str(channel_id): count for channel_id, count in counts.items()},
+        'total': sum(counts.values()),
+    })
+
+
+@login_required
+async def chat_stats_view(request):
+    """이 워커의 웹소켓 전송 큐 상태 (연결 수, 큐 길이, 합친/버린 프레임 수) - 관리자 전용"""
+    user = await request.auser()
+    if not user.is_staff:
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+    return JsonResponse(outbox.stats())
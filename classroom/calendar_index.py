@@ -0,0 +1,140 @@
+# classroom/calendar_index.py
+
+from collections import defaultdict
+from datetime import timedelta
+from functools import lru_cache
+
+from django.urls import get_script_prefix, reverse
+from django.utils import timezone
+
+from .models import Assignment, CalendarEntry
+
+
+# 강의 일정에 영향을 주는 필드 (이 필드가 바뀔 때만 다시 펼침)
+SCHEDULE_FIELDS = {'weekday', 'start_date', 'end_date'}
+
+EMPTY_BUCKET = {'courses': (), 'assignments': ()}
+
+
+def detail_url(viewname, pk):
+    """reverse() 결과를 (뷰 이름, ID)별로 프로세스에 기억
+
+    reverse()는 한 번에 수십 μs라 한 달 화면의 링크 수백 개를 매번 만들면 그것만으로 10ms 넘게 걸립니다.
+    """
+    return _reverse(viewname, pk, get_script_prefix())
+
+
+@lru_cache(maxsize=20000)
+def _reverse(viewname, pk, script_prefix):
+    # script_prefix는 캐시 키로만 사용 (reverse()가 현재 요청의 prefix를 붙임)
+    return reverse(viewname, args=[pk])
+
+
+def expand_session_dates(course):
+    """강의 요일/기간으로 실제 수업 날짜 목록 계산 (weekday: 0=월 ~ 6=일)"""
+    if course.weekday is None or not course.start_date or not course.end_date:
+        return []
+
+    offset = (course.weekday - course.start_date.weekday()) % 7
+    day = course.start_date + timedelta(days=offset)
+
+    dates = []
+    while day <= course.end_date:
+        dates.append(day)
+        day += timedelta(days=7)
+    return dates
+
+
+def sync_course(course):
+    """강의 일정 인덱스 갱신 - 바뀐 날짜만 추가/삭제"""
+    expected = set(expand_session_dates(course))
+    sessions = CalendarEntry.objects.filter(course=course, kind='session')
+    existing = set(sessions.values_list('date', flat=True))
+
+    stale = existing - expected
+    if stale:
+        sessions.filter(date__in=stale).delete()
+
+    missing = expected - existing
+    if missing:
+        CalendarEntry.objects.bulk_create([
+            CalendarEntry(course=course, kind='session', date=day)
+            for day in sorted(missing)
+        ])
+
+
+def sync_assignment(assignment):
+    """과제 마감일 인덱스 갱신"""
+    due = timezone.localdate(assignment.due_date)
+
+    updated = CalendarEntry.objects.filter(assignment=assignment).update(
+        course_id=assignment.course_id, date=due
+    )
+    if not updated:
+        CalendarEntry.objects.create(
+            course_id=assignment.course_id,
+            assignment=assignment,
+            kind='assignment',
+            date=due,
+        )
+
+
+def rebuild(courses):
+    """주어진 강의들의 인덱스를 통째로 다시 생성"""
+    courses = list(courses)
+    CalendarEntry.objects.filter(course__in=courses).delete()
+
+    entries = []
+    for course in courses:
+        for day in expand_session_dates(course):
+            entries.append(CalendarEntry(course=course, kind='session', date=day))
+
+    for assignment in Assignment.objects.filter(course__in=courses):
+        entries.append(CalendarEntry(
+            course_id=assignment.course_id,
+            assignment=assignment,
+            kind='assignment',
+            date=timezone.localdate(assignment.due_date),
+        ))
+
+    CalendarEntry.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+def month_buckets(courses, first_day, last_day):
+    """수강 중인 강의의 일정/과제를 날짜 범위로 한 번에 조회해서 날짜별로 묶음
+
+    강의 객체는 이미 불러온 것을 재사용하고, 과제는 화면에 필요한 값만 가져옵니다.
+    링크와 시간 문자열은 강의/과제마다 한 번만 만들어 두고 템플릿(classroom/calendar_events.html)은 그대로 출력만 합니다.
+    """
+    course_map = {}
+    for course in courses:
+        course.calendar_url = detail_url('classroom:my_course_detail', course.course_id)
+        # 템플릿 변수 조회는 dict 키를 먼저 시도하므로 모델 객체 대신 dict로 넘김 (일정 수백 개라 차이가 큼)
+        course_map[course.course_id] = {
+            'url': course.calendar_url,
+            'time': course.start_time.strftime('%H:%M') if course.start_time else '',
+            'title': course.title,
+            'category': course.category,
+        }
+
+    rows = CalendarEntry.objects.filter(
+        course_id__in=course_map,
+        date__range=(first_day, last_day),
+    ).order_by('date', 'entry_id').values_list(
+        'date', 'kind', 'course_id', 'assignment_id', 'assignment__title'
+    )
+
+    assignments = {}
+    buckets = defaultdict(lambda: {'courses': [], 'assignments': []})
+    for day, kind, course_id, assignment_id, title in rows:
+        if kind == 'assignment':
+            if assignment_id not in assignments:
+                assignments[assignment_id] = {
+                    'url': detail_url('classroom:assignment_detail', assignment_id),
+                    'title': title,
+                }
+            buckets[day]['assignments'].append(assignments[assignment_id])
+        else:
+            buckets[day]['courses'].append(course_map[course_id])
+    return buckets
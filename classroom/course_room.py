@@ -0,0 +1,74 @@
+# classroom/course_room.py
+
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef
+
+from core.cache import bounded_timeout
+from .models import (
+    Assignment, Submission, CourseNotice, WeeklyContent, CourseQuestion
+)
+from . import snapshot_cache
+
+
+SNAPSHOT_TIMEOUT = 300  # 5분
+
+
+def _version_key(course_id):
+    return f'classroom:room-version:{course_id}'
+
+
+def invalidate(course_id):
+    """강의 하위 데이터(공지/자료/과제/제출/질문/답변)가 바뀌면 호출 - 이 강의의 모든 스냅샷 무효화"""
+    if course_id is not None:
+        snapshot_cache.bump(_version_key(course_id))
+
+
+def course_id_of(model, pk):
+    """과제/질문 ID → 강의 ID (제출/답변 행마다 부모를 불러오지 않도록 캐시, 부모의 강의는 바뀌지 않음)"""
+    key = f'classroom:course-of:{model._meta.model_name}:{pk}'
+    course_id = cache.get(key)
+    if course_id is None:
+        course_id = model.objects.filter(pk=pk).values_list('course_id', flat=True).first()
+        if course_id is not None:
+            cache.set(key, course_id, 60 * 60)
+    return course_id
+
+
+def build_snapshot(course, user):
+    """강의실 화면에 필요한 데이터를 한 번에 계산
+
+    - 과제: 내 제출 여부(is_submitted)를 EXISTS로 같이 가져옴
+    - 질문: 작성자 + 답변 수(answer_count)를 같이 가져옴
+    """
+    my_submission = Submission.objects.filter(
+        assignment=OuterRef('pk'), student=user
+    )
+    assignments = list(
+        Assignment.objects.filter(course=course)
+        .annotate(is_submitted=Exists(my_submission))
+        .order_by('-due_date')
+    )
+
+    return {
+        'notices': list(CourseNotice.objects.filter(course=course).order_by('-is_pinned', '-created_at')),
+        'weekly_contents': list(WeeklyContent.objects.filter(course=course).order_by('week_number')),
+        'assignments': assignments,
+        'submitted_ids': [a.assignment_id for a in assignments if a.is_submitted],
+        'questions': list(
+            CourseQuestion.objects.filter(course=course)
+            .select_related('author')
+            .annotate(answer_count=Count('answers'))
+            .order_by('-created_at')
+        ),
+    }
+
+
+def get_snapshot(course, user):
+    """(강의, 사용자)별 강의실 스냅샷 - 캐시에 있으면 그대로 사용"""
+    version = snapshot_cache.get_version(_version_key(course.course_id))
+    key = f'classroom:room:{course.course_id}:{user.pk}:v{version}'
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_snapshot(course, user)
+        cache.set(key, snapshot, bounded_timeout(SNAPSHOT_TIMEOUT))
+    return snapshot
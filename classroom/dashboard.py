@@ -0,0 +1,179 @@
+# classroom/dashboard.py
+
+from datetime import datetime, timedelta
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.cache import bounded_timeout, is_shared
+from .models import Enrollment, Assignment
+from . import snapshot_cache
+
+
+SNAPSHOT_TIMEOUT = 300  # 5분 (예정된 강의의 '오늘' 표시가 늦어도 5분 안에 갱신됨)
+
+WEEKDAY_NAMES = ['월요일 (Mon)', '화요일 (Tue)', '수요일 (Wed)',
+                 '목요일 (Thu)', '금요일 (Fri)', '토요일 (Sat)', '일요일 (Sun)']
+
+
+def _version_key(user_id):
+    return f'classroom:dashboard-version:{user_id}'
+
+
+def invalidate_user(user_id):
+    """수강 신청/취소, 과제 제출 등 - 해당 학생의 대시보드 무효화"""
+    snapshot_cache.bump(_version_key(user_id))
+
+
+def invalidate_course(course_id):
+    """과제 등록/수정, 강의 정보 변경 - 이 강의 수강생 전체의 대시보드 무효화"""
+    student_ids = Enrollment.objects.filter(course_id=course_id).values_list('student_id', flat=True)
+    snapshot_cache.bump(*[_version_key(student_id) for student_id in student_ids])  # 수강생 수와 상관없이 한 번
+
+
+def _ongoing_enrollments(user):
+    # ✅ 현재 수강 중(완료 안 된) 강의만 사용
+    return Enrollment.objects.filter(
+        student=user,
+        is_completed=False
+    ).select_related('course', 'course__instructor').order_by('-enrolled_at')
+
+
+def _pending_assignments(user):
+    # 미제출 과제
+    return Assignment.objects.filter(
+        course__enrollments__student=user,
+        course__enrollments__is_completed=False,
+        due_date__gte=timezone.now()
+    ).exclude(
+        submissions__student=user
+    ).select_related('course').order_by('due_date')[:5]
+
+
+def _completed_enrollments(user):
+    return Enrollment.objects.filter(student=user, is_completed=True)
+
+
+def build_snapshot(user, now):
+    """대시보드 데이터 계산 (주간 시간표 + 예정된 강의 + 강의 목록 + 미제출 과제)"""
+    return _compose(
+        now,
+        list(_ongoing_enrollments(user)),
+        list(_completed_enrollments(user)),
+        list(_pending_assignments(user)),
+    )
+
+
+async def abuild_snapshot(user, now):
+    """build_snapshot의 async 버전 - 쿼리만 async ORM으로, 계산은 같은 함수 사용"""
+    return _compose(
+        now,
+        [e async for e in _ongoing_enrollments(user)],
+        [e async for e in _completed_enrollments(user)],
+        [a async for a in _pending_assignments(user)],
+    )
+
+
+def _compose(now, ongoing_courses, completed_courses, pending_assignments):
+    """조회한 목록으로 화면 데이터 계산 (DB 조회 없음)"""
+    # 이번 주 기준 데이터 (주간 카드/예정 강의용)
+    weekday = now.weekday()          # 0=월, 6=일
+    current_time = now.time()
+    monday = now - timedelta(days=weekday)
+
+    # 요일별로 한 번만 나눠 담기 (7 x 수강 강의 반복 대신)
+    courses_by_day = [[] for _ in range(7)]
+    upcoming_courses = []
+    for e in ongoing_courses:
+        c = e.course
+        if c.weekday is None:
+            continue
+
+        courses_by_day[c.weekday].append({
+            'title': c.title,
+            'start_time': c.start_time,
+            'end_time': c.end_time,
+            'category': c.category,
+        })
+
+        if not c.start_time:
+            continue
+        d = (c.weekday - weekday) % 7
+        if d == 0 and c.start_time <= current_time:
+            d = 7  # 오늘 수업이 이미 시작했으면 다음 주
+        if d == 7:
+            continue
+        upcoming_courses.append({
+            'course': c,
+            'enrollment': e,
+            'days_until': d,
+            'date_str': '오늘' if d == 0 else f'{d}일 후',
+        })
+
+    weekly_schedule = []
+    for i in range(7):
+        day_courses = courses_by_day[i]
+        day_courses.sort(key=lambda x: x['start_time'] if x['start_time'] else datetime.max.time())
+        weekly_schedule.append({
+            'weekday_name': WEEKDAY_NAMES[i],
+            'date': (monday + timedelta(days=i)).strftime('%m/%d'),
+            'courses': day_courses,
+        })
+
+    # 예정된 강의 (최대 3개)
+    upcoming_courses.sort(key=lambda x: (x['days_until'], x['course'].start_time))
+    upcoming_courses = upcoming_courses[:3]
+
+    return {
+        'ongoing_courses': ongoing_courses,           # 강의 테이블 + 사이드바
+        'weekly_schedule': weekly_schedule,           # 주간 카드
+        'upcoming_courses': upcoming_courses,         # 예정된 강의 카드
+        'completed_courses': completed_courses,
+        'pending_assignments': pending_assignments,   # 미제출 과제
+    }
+
+
+def _snapshot_key(user, now):
+    version = snapshot_cache.get_version(_version_key(user.pk))
+    return f'classroom:dashboard:{user.pk}:{now.date().isoformat()}:v{version}'
+
+
+def get_snapshot(user, now=None):
+    """사용자별 대시보드 스냅샷 - 5분 캐시 + 이벤트 발생 시 버전 변경으로 무효화
+
+    날짜를 키에 넣어서 날짜가 바뀌면 주간 카드가 새로 계산되게 합니다.
+    """
+    now = now or datetime.now()
+    key = _snapshot_key(user, now)
+
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_snapshot(user, now)
+        cache.set(key, snapshot, bounded_timeout(SNAPSHOT_TIMEOUT))
+    return snapshot
+
+
+async def aget_snapshot(user, now=None):
+    """get_snapshot의 async 버전 (async 대시보드 뷰)
+
+    로컬 메모리 캐시는 그대로 동기 호출 - cache.aget()은 매번 스레드를 거치므로 쓰지 않음.
+    Redis 등 공유 캐시는 네트워크 I/O라 이벤트 루프를 막지 않도록 스레드에서 조회합니다.
+    캐시가 없을 때만 async ORM으로 계산합니다.
+    """
+    now = now or datetime.now()
+    shared = is_shared()
+    if shared:
+        key = await sync_to_async(_snapshot_key)(user, now)
+        snapshot = await cache.aget(key)
+    else:
+        key = _snapshot_key(user, now)
+        snapshot = cache.get(key)
+
+    if snapshot is None:
+        snapshot = await abuild_snapshot(user, now)
+        if shared:
+            await cache.aset(key, snapshot, bounded_timeout(SNAPSHOT_TIMEOUT))
+        else:
+            cache.set(key, snapshot, bounded_timeout(SNAPSHOT_TIMEOUT))
+    return snapshot
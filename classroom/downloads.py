@@ -0,0 +1,141 @@
+# classroom/downloads.py
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse, Http404
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+
+READ_BLOCK = 64 * 1024
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def serve(request, fieldfile, as_attachment=False):
+    """권한 확인이 끝난 FileField 파일을 전송
+
+    PROTECTED_MEDIA_SERVER 설정에 따라
+    - 'nginx'  : X-Accel-Redirect로 nginx에 전송을 넘김 (internal location 필요)
+    - 'apache' : X-Sendfile로 넘김 (mod_xsendfile)
+    - 그 외    : Django가 직접 전송 (Range/206, ETag, Last-Modified 지원)
+    """
+    if not fieldfile:
+        raise Http404('파일이 없습니다.')
+    try:
+        path = fieldfile.path
+        stat = os.stat(path)
+    except (OSError, NotImplementedError):
+        raise Http404('파일을 찾을 수 없습니다.')
+
+    filename = os.path.basename(fieldfile.name)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    server = getattr(settings, 'PROTECTED_MEDIA_SERVER', '')
+
+    # 헤더 값은 퍼센트 인코딩 - 한글 등 비ASCII 그대로 넣으면 Django가 =?utf-8?b?...?=로 바꿔서
+    # nginx/mod_xsendfile이 파일을 못 찾음 (둘 다 받은 값을 URL 디코딩해서 사용)
+    if server == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        internal_url = getattr(settings, 'PROTECTED_MEDIA_INTERNAL_URL', '/protected-media/')
+        response['X-Accel-Redirect'] = quote(internal_url + fieldfile.name)
+    elif server == 'apache':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = quote(path)  # XSendFileUnescape On (기본값)
+    else:
+        response = _serve_with_range(request, path, stat, content_type)
+
+    response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    return response
+
+
+def _etag(stat):
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _not_modified(request, etag, mtime):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+    since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return since is not None and int(mtime) <= since
+
+
+def _parse_range(header, size):
+    """단일 구간 Range만 처리 → (start, end) / 형식 오류면 None(전체 전송) / 범위 밖이면 False(416)
+
+    여러 구간(bytes=0-1,5-9) 요청은 전체 파일로 응답해도 되므로 None으로 처리합니다.
+    """
+    match = RANGE_RE.match(header.replace(' ', ''))
+    if not match:
+        return None
+    first, last = match.groups()
+    if first == '' and last == '':
+        return None
+    if first == '':
+        # bytes=-500 → 마지막 500바이트
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _file_iterator(path, start, length):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            block = f.read(min(READ_BLOCK, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+
+def _serve_with_range(request, path, stat, content_type):
+    size = stat.st_size
+    etag = _etag(stat)
+    last_modified = http_date(stat.st_mtime)
+
+    if _not_modified(request, etag, stat.st_mtime):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        response['Last-Modified'] = last_modified
+        return response
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if range_header and request.method in ('GET', 'HEAD'):
+        # If-Range: 파일이 그 사이 바뀌었으면 일부 대신 전체를 보냄
+        if_range = request.headers.get('If-Range')
+        if if_range is None or if_range in (etag, last_modified):
+            byte_range = _parse_range(range_header, size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    if byte_range:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _file_iterator(path, start, end - start + 1), status=206, content_type=content_type
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    else:
+        response = StreamingHttpResponse(_file_iterator(path, 0, size), content_type=content_type)
+        response['Content-Length'] = str(size)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = last_modified
+    # 권한 확인을 거친 파일이므로 공유 캐시에는 저장하지 않음
+    response['Cache-Control'] = 'private, max-age=0, must-revalidate'
+    return response
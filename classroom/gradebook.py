@@ -0,0 +1,128 @@
+# classroom/gradebook.py
+
+import csv
+import math
+from array import array
+
+from .models import Enrollment, Assignment, Submission
+
+
+MISSING = math.nan  # 미제출 / 미채점 칸
+
+
+class Gradebook:
+    """강의 성적부 - 학생 × 과제 점수 행렬
+
+    점수는 dict 중첩 대신 array('d') 하나에 행 우선(row-major)으로 담습니다.
+    칸 (i, j)의 점수 = scores[i * 과제 수 + j], 비어 있으면 NaN.
+    """
+
+    def __init__(self, course, students, assignments, scores):
+        self.course = course
+        self.students = students
+        self.assignments = assignments
+        self.scores = scores
+        self.width = len(assignments)
+        self.max_total = sum(max_score for _, _, max_score in assignments)
+
+    @classmethod
+    def build(cls, course):
+        """수강생 / 과제 / 제출 점수를 각각 쿼리 1번씩(총 3번)으로 불러와 행렬 생성"""
+        students = list(
+            Enrollment.objects.filter(course=course)
+            .order_by('student__name', 'student_id')
+            .values_list('student_id', 'student__name', 'student__email')
+        )
+        assignments = list(
+            Assignment.objects.filter(course=course)
+            .order_by('due_date', 'assignment_id')
+            .values_list('assignment_id', 'title', 'max_score')
+        )
+
+        row_of = {student_id: i for i, (student_id, _, _) in enumerate(students)}
+        col_of = {assignment_id: j for j, (assignment_id, _, _) in enumerate(assignments)}
+        width = len(assignments)
+        scores = array('d', [MISSING]) * (len(students) * width)
+
+        submitted = Submission.objects.filter(
+            assignment__course=course, score__isnull=False
+        ).values_list('student_id', 'assignment_id', 'score')
+        for student_id, assignment_id, score in submitted.iterator(chunk_size=5000):
+            i = row_of.get(student_id)
+            if i is not None:  # 수강 취소한 학생의 제출물은 제외
+                scores[i * width + col_of[assignment_id]] = score
+
+        return cls(course, students, assignments, scores)
+
+    def row(self, i):
+        return self.scores[i * self.width:(i + 1) * self.width]
+
+    def column(self, j):
+        return self.scores[j::self.width]
+
+    # ---------- 집계 ----------
+
+    @staticmethod
+    def _summary(values):
+        graded = [v for v in values if not math.isnan(v)]
+        if not graded:
+            return {'count': 0, 'total': 0.0, 'average': None, 'min': None, 'max': None}
+        total = math.fsum(graded)
+        return {
+            'count': len(graded),
+            'total': total,
+            'average': total / len(graded),
+            'min': min(graded),
+            'max': max(graded),
+        }
+
+    def student_summary(self, i):
+        """학생 한 명: 채점된 과제 수, 총점, 평균, 만점 대비 백분율"""
+        summary = self._summary(self.row(i))
+        summary['percent'] = summary['total'] / self.max_total * 100 if self.max_total else None
+        return summary
+
+    def assignment_summary(self, j):
+        """과제 하나: 채점된 학생 수, 평균, 최저/최고점"""
+        return self._summary(self.column(j))
+
+    # ---------- 내보내기 ----------
+
+    def iter_rows(self):
+        """CSV 한 줄씩 생성 (헤더 → 학생별 점수 + 합계 → 과제별 평균/최저/최고)"""
+        yield ['이름', '이메일'] + [title for _, title, _ in self.assignments] + ['채점 수', '총점', '백분율(%)']
+
+        for i, (_, name, email) in enumerate(self.students):
+            summary = self.student_summary(i)
+            yield (
+                [name, email]
+                + [_fmt(v) for v in self.row(i)]
+                + [summary['count'], _fmt(summary['total']), _fmt(summary['percent'])]
+            )
+
+        column_summaries = [self.assignment_summary(j) for j in range(self.width)]
+        for label, key in (('평균', 'average'), ('최저', 'min'), ('최고', 'max'), ('채점 수', 'count')):
+            yield [label, ''] + [_fmt(s[key]) for s in column_summaries]
+
+
+def _fmt(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    if isinstance(value, float):
+        return f'{value:.2f}'.rstrip('0').rstrip('.')
+    return value
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 가짜 파일 (StreamingHttpResponse용)"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(gradebook):
+    """성적부를 CSV 문자열 조각으로 스트리밍 - 엑셀에서 한글이 깨지지 않도록 BOM을 먼저 보냄"""
+    writer = csv.writer(_Echo())
+    yield '\ufeff'
+    for row in gradebook.iter_rows():
+        yield writer.writerow(row)
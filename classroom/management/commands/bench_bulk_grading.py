@@ -0,0 +1,93 @@
+import io
+import time
+from datetime import date, time as dtime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from course.models import Course
+from user.models import User
+from classroom.models import Assignment, Submission
+from classroom import grading
+
+
+class Command(BaseCommand):
+    help = 'CSV 일괄 채점(파싱 → 검사 → bulk_update) 시간을 행 단위 save()와 비교합니다. (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--min-speedup', type=float, default=3.0,
+                            help='행 단위 save() 대비 최소 몇 배 빨라야 하는지')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            assignment = self.seed(options['rows'])
+            csv_file = self.build_csv(assignment)
+
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                rows = grading.parse_grade_csv(csv_file)
+                parsed = time.perf_counter()
+                updates, errors = grading.validate_grades(assignment, rows)
+                validated = time.perf_counter()
+                grading.apply_grades(updates)
+                applied = time.perf_counter()
+
+            # 비교: 한 행씩 save()
+            submissions = list(Submission.objects.filter(assignment=assignment))
+            row_started = time.perf_counter()
+            for submission in submissions:
+                submission.score = 50
+                submission.save(update_fields=['score'])
+            row_elapsed = time.perf_counter() - row_started
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"rows: {len(rows)} (errors {len(errors)})")
+        self.stdout.write(f"parse: {(parsed - started) * 1000:.1f} ms")
+        self.stdout.write(f"validate: {(validated - parsed) * 1000:.1f} ms")
+        self.stdout.write(f"apply (executemany UPDATE): {(applied - validated) * 1000:.1f} ms")
+        self.stdout.write(f"total: {(applied - started) * 1000:.1f} ms ({len(queries)} queries)")
+        self.stdout.write(f"row-by-row save(): {row_elapsed * 1000:.1f} ms ({len(submissions)} queries)")
+        speedup = row_elapsed / (applied - started)
+        if speedup >= options['min_speedup']:
+            self.stdout.write(self.style.SUCCESS(f"✅ {speedup:.1f}x faster (목표 {options['min_speedup']}x 이상)"))
+        else:
+            self.stdout.write(self.style.ERROR(f"❌ {speedup:.1f}x (목표 {options['min_speedup']}x 미달)"))
+
+    def build_csv(self, assignment):
+        buffer = io.StringIO()
+        buffer.write('email,score,feedback\n')
+        for i, email in enumerate(
+            Submission.objects.filter(assignment=assignment).values_list('student__email', flat=True)
+        ):
+            buffer.write(f'{email},{i % (assignment.max_score + 1)},"잘했습니다, {i}"\n')
+        return io.BytesIO(buffer.getvalue().encode('utf-8'))
+
+    def seed(self, row_count):
+        password = make_password(None)
+        instructor = User.objects.create_user(
+            email='bench-instructor@example.com', password=None, name='bench', phone_number='bench-0'
+        )
+        students = User.objects.bulk_create([
+            User(email=f'bench-student-{i}@example.com', password=password, name='bench', phone_number=f'bench-{i + 1}')
+            for i in range(row_count)
+        ], batch_size=1000)
+
+        today = date.today()
+        course = Course.objects.create(
+            instructor=instructor, title='bench course', description='',
+            weekday=0, start_time=dtime(9), end_time=dtime(10),
+            start_date=today, end_date=today + timedelta(days=90),
+        )
+        assignment = Assignment.objects.create(
+            course=course, title='bench assignment', description='',
+            due_date=timezone.now() + timedelta(days=7), max_score=100,
+        )
+        Submission.objects.bulk_create(
+            [Submission(assignment=assignment, student=student) for student in students], batch_size=1000
+        )
+        return assignment
@@ -0,0 +1,87 @@
+import time
+from datetime import date, time as dtime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from django.utils import timezone
+
+from course.models import Course
+from user.models import User
+from classroom.models import Enrollment, Assignment
+from classroom.views import calendar_view
+
+
+class Command(BaseCommand):
+    help = '강의 50개 / 과제 500개를 수강하는 학생의 월간 캘린더 렌더링 시간을 측정합니다. (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--courses', type=int, default=50)
+        parser.add_argument('--assignments', type=int, default=500)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--budget-ms', type=float, default=20.0)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            student = self.seed(options['courses'], options['assignments'])
+
+            today = date.today()
+            request = RequestFactory().get('/classroom/calendar/', {'year': today.year, 'month': today.month})
+            request.user = student
+
+            # 워밍업 - 첫 요청은 템플릿 로딩 + 링크 URL 계산(calendar_index.detail_url 캐시)이 포함돼 따로 표시
+            started = time.perf_counter()
+            calendar_view(request)
+            cold = (time.perf_counter() - started) * 1000
+
+            timings = []
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                calendar_view(request)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            transaction.set_rollback(True)
+
+        timings.sort()
+        median = timings[len(timings) // 2]
+        self.stdout.write(f"median {median:.2f} ms / min {timings[0]:.2f} ms / max {timings[-1]:.2f} ms")
+        self.stdout.write(f"첫 요청 {cold:.2f} ms (템플릿 로딩/URL 캐시 채우기 포함)")
+
+        if median <= options['budget_ms']:
+            self.stdout.write(self.style.SUCCESS(f"✅ 목표({options['budget_ms']} ms) 이내"))
+        else:
+            self.stdout.write(self.style.ERROR(f"❌ 목표({options['budget_ms']} ms) 초과"))
+
+    def seed(self, course_count, assignment_count):
+        instructor = User.objects.create_user(
+            email='bench-instructor@example.com', password=None, name='bench', phone_number='bench-0'
+        )
+        student = User.objects.create_user(
+            email='bench-student@example.com', password=None, name='bench', phone_number='bench-1'
+        )
+
+        today = date.today()
+        courses = []
+        for i in range(course_count):
+            courses.append(Course.objects.create(
+                instructor=instructor,
+                title=f'bench course {i}',
+                description='',
+                weekday=i % 7,
+                start_time=dtime(9 + i % 8),
+                end_time=dtime(10 + i % 8),
+                start_date=today - timedelta(days=90),
+                end_date=today + timedelta(days=90),
+            ))
+        Enrollment.objects.bulk_create([Enrollment(student=student, course=c) for c in courses])
+
+        now = timezone.now()
+        for i in range(assignment_count):
+            Assignment.objects.create(
+                course=courses[i % course_count],
+                title=f'bench assignment {i}',
+                description='',
+                due_date=now + timedelta(days=i % 60 - 30),
+                max_score=100,
+            )
+        return student
@@ -0,0 +1,100 @@
+import time
+from datetime import date, time as dtime, timedelta
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from course.models import Course
+from user.models import User
+from classroom.models import Enrollment, Assignment
+from classroom.views import dashboard_view
+from classroom import dashboard
+
+
+class Command(BaseCommand):
+    help = '대시보드 렌더링 시간을 캐시 없음(cold) / 캐시 있음(warm)으로 비교합니다. (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--courses', type=int, default=30)
+        parser.add_argument('--assignments', type=int, default=300)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            student = self.seed(options['courses'], options['assignments'])
+
+            request = RequestFactory().get('/classroom/')
+            request.user = student
+            request.auser = self.auser(student)
+            self.view(request)  # 워밍업 (템플릿 로딩)
+
+            cold, cold_queries = self.measure(request, options['repeat'], invalidate=True)
+            warm, warm_queries = self.measure(request, options['repeat'], invalidate=False)
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"cold: median {cold:.2f} ms ({cold_queries} queries)")
+        self.stdout.write(f"warm: median {warm:.2f} ms ({warm_queries} queries)")
+        self.stdout.write(self.style.SUCCESS(f"✅ warm / cold = {warm / cold:.2f}"))
+
+    # dashboard_view는 async 뷰 - 같은 스레드(같은 DB 연결/트랜잭션)에서 실행
+    view = staticmethod(async_to_sync(dashboard_view))
+
+    @staticmethod
+    def auser(user):
+        async def auser():
+            return user
+        return auser
+
+    def measure(self, request, repeat, invalidate):
+        timings = []
+        for _ in range(repeat):
+            if invalidate:
+                dashboard.invalidate_user(request.user.pk)
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                self.view(request)
+                timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return timings[len(timings) // 2], len(queries)
+
+    def seed(self, course_count, assignment_count):
+        instructor = User.objects.create_user(
+            email='bench-instructor@example.com', password=None, name='bench', phone_number='bench-0'
+        )
+        student = User.objects.create_user(
+            email='bench-student@example.com', password=None, name='bench', phone_number='bench-1'
+        )
+
+        today = date.today()
+        courses = Course.objects.bulk_create([
+            Course(
+                instructor=instructor,
+                title=f'bench course {i}',
+                description='',
+                weekday=i % 7,
+                start_time=dtime(9 + i % 8),
+                end_time=dtime(10 + i % 8),
+                start_date=today - timedelta(days=30),
+                end_date=today + timedelta(days=90),
+            )
+            for i in range(course_count)
+        ])
+        Enrollment.objects.bulk_create([Enrollment(student=student, course=c) for c in courses])
+
+        now = timezone.now()
+        Assignment.objects.bulk_create([
+            Assignment(
+                course=courses[i % course_count],
+                title=f'bench assignment {i}',
+                description='',
+                due_date=now + timedelta(days=i % 30),
+                max_score=100,
+            )
+            for i in range(assignment_count)
+        ])
+        return student
@@ -0,0 +1,81 @@
+import random
+import time
+from datetime import date, time as dtime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from course.models import Course
+from user.models import User
+from classroom.models import Enrollment, Assignment, Submission
+from classroom.views import gradebook_export_view
+
+
+class Command(BaseCommand):
+    help = '학생 × 과제 성적부 CSV 내보내기 시간을 측정합니다. (데이터는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=2000)
+        parser.add_argument('--assignments', type=int, default=40)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            course = self.seed(options['students'], options['assignments'])
+
+            request = RequestFactory().get('/')
+            request.user = course.instructor
+
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = gradebook_export_view(request, course.course_id)
+                size = 0
+                lines = 0
+                for chunk in response.streaming_content:
+                    size += len(chunk)
+                    lines += 1
+                elapsed = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{options['students']} students x {options['assignments']} assignments")
+        self.stdout.write(f"export: {elapsed * 1000:.1f} ms, {lines} chunks, {size / 1024:.0f} KB ({len(queries)} queries)")
+        self.stdout.write(self.style.SUCCESS('✅ done'))
+
+    def seed(self, student_count, assignment_count):
+        password = make_password(None)
+        instructor = User.objects.create_user(
+            email='bench-instructor@example.com', password=None, name='bench', phone_number='bench-0'
+        )
+        students = User.objects.bulk_create([
+            User(email=f'bench-student-{i}@example.com', password=password, name=f'학생{i}', phone_number=f'bench-{i + 1}')
+            for i in range(student_count)
+        ], batch_size=1000)
+
+        today = date.today()
+        course = Course.objects.create(
+            instructor=instructor, title='bench course', description='',
+            weekday=0, start_time=dtime(9), end_time=dtime(10),
+            start_date=today, end_date=today + timedelta(days=90),
+        )
+        Enrollment.objects.bulk_create([Enrollment(student=s, course=course) for s in students], batch_size=1000)
+
+        now = timezone.now()
+        assignments = Assignment.objects.bulk_create([
+            Assignment(
+                course=course, title=f'과제 {i + 1}', description='',
+                due_date=now + timedelta(days=i), max_score=100,
+            )
+            for i in range(assignment_count)
+        ])
+
+        # 90% 정도 제출/채점된 상태
+        rng = random.Random(0)
+        Submission.objects.bulk_create([
+            Submission(assignment=a, student=s, score=rng.randint(0, 100))
+            for s in students for a in assignments if rng.random() < 0.9
+        ], batch_size=2000)
+        return course
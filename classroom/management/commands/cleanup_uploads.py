@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from classroom import uploads
+
+
+class Command(BaseCommand):
+    help = '오래 진행되지 않은 분할 업로드와 연결되지 않은 업로드 파일을 삭제합니다. (cron으로 주기 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, help='이 시간 이상 진행 없는 업로드 삭제 (기본 CHUNKED_UPLOAD_EXPIRE_HOURS)')
+
+    def handle(self, *args, **options):
+        count = uploads.cleanup(options['hours'])
+        self.stdout.write(self.style.SUCCESS(f"✅ 분할 업로드 {count}건을 정리했습니다."))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from course.models import Course
+from classroom import calendar_index
+
+
+class Command(BaseCommand):
+    help = '캘린더 인덱스(강의 일정/과제 마감)를 전체 강의 기준으로 다시 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', type=int, help='특정 강의 ID만 다시 생성')
+
+    def handle(self, *args, **options):
+        courses = Course.objects.all()
+        if options['course']:
+            courses = courses.filter(course_id=options['course'])
+
+        count = calendar_index.rebuild(courses)
+        self.stdout.write(self.style.SUCCESS(f"✅ 캘린더 인덱스 {count}건이 생성되었습니다."))
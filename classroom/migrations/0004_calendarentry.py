@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("classroom", "0003_initial"),
+        ("course", "0003_alter_course_category"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CalendarEntry",
+            fields=[
+                ("entry_id", models.AutoField(primary_key=True, serialize=False)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("session", "강의"), ("assignment", "과제 마감")],
+                        max_length=20,
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "assignment",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="calendar_entries",
+                        to="classroom.assignment",
+                    ),
+                ),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="calendar_entries",
+                        to="course.course",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "calendar_entry",
+                "ordering": ["date"],
+                "indexes": [
+                    models.Index(
+                        fields=["course", "date"], name="calendar_en_course__9ab936_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:21
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("classroom", "0004_calendarentry"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChunkedUpload",
+            fields=[
+                (
+                    "upload_id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "purpose",
+                    models.CharField(
+                        choices=[
+                            ("submission", "과제 제출"),
+                            ("weekly_content", "주차별 자료"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("target_id", models.IntegerField(verbose_name="과제 ID 또는 강의 ID")),
+                ("original_name", models.CharField(max_length=255)),
+                (
+                    "file_name",
+                    models.CharField(max_length=255, verbose_name="저장소 경로"),
+                ),
+                ("total_size", models.BigIntegerField()),
+                (
+                    "offset",
+                    models.BigIntegerField(default=0, verbose_name="받은 바이트 수"),
+                ),
+                ("sha256", models.CharField(blank=True, max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("uploading", "업로드 중"), ("complete", "완료")],
+                        default="uploading",
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunked_uploads",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "chunked_upload",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "purpose", "target_id"],
+                        name="chunked_upl_user_id_60019a_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,5 +1,7 @@
 # classroom/models.py
 
+import uuid
+
 from django.db import models
 from django.utils import timezone
 from user.models import User
@@ -152,3 +154,74 @@ class QuestionAnswer(models.Model):
     def __str__(self):
         return f"{self.question.title}에 대한 답변"
 
+
+
+class CalendarEntry(models.Model):
+    """캘린더 인덱스 - 강의 일정/과제 마감을 날짜별로 미리 펼쳐 둔 테이블
+
+    수강생별로 따로 저장하지 않고 강의 단위로만 저장합니다.
+    월별 조회는 수강 중인 강의와 조인해서 날짜 범위로 한 번에 가져옵니다.
+    """
+    KIND_CHOICES = [
+        ('session', '강의'),
+        ('assignment', '과제 마감'),
+    ]
+
+    entry_id = models.AutoField(primary_key=True)
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='calendar_entries')
+    assignment = models.ForeignKey(
+        Assignment,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='calendar_entries'
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    date = models.DateField(verbose_name="날짜")
+
+    class Meta:
+        db_table = 'calendar_entry'
+        ordering = ['date']
+        indexes = [
+            models.Index(fields=['course', 'date']),
+        ]
+
+    def __str__(self):
+        return f"[{self.course.title}] {self.date} ({self.get_kind_display()})"
+
+
+class ChunkedUpload(models.Model):
+    """분할 업로드 진행 상태 - 조각을 최종 저장 위치(file_name)에 바로 이어 씀
+
+    업로드가 끝나면 Submission.file / WeeklyContent.file에 이름만 연결하고 이 행은 삭제합니다.
+    """
+    PURPOSE_CHOICES = [
+        ('submission', '과제 제출'),
+        ('weekly_content', '주차별 자료'),
+    ]
+    STATUS_CHOICES = [
+        ('uploading', '업로드 중'),
+        ('complete', '완료'),
+    ]
+
+    upload_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='chunked_uploads')
+    purpose = models.CharField(max_length=20, choices=PURPOSE_CHOICES)
+    target_id = models.IntegerField(verbose_name="과제 ID 또는 강의 ID")
+    original_name = models.CharField(max_length=255)
+    file_name = models.CharField(max_length=255, verbose_name="저장소 경로")
+    total_size = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0, verbose_name="받은 바이트 수")
+    sha256 = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='uploading')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'chunked_upload'
+        indexes = [
+            models.Index(fields=['user', 'purpose', 'target_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.original_name} ({self.offset}/{self.total_size})"
@@ -0,0 +1,122 @@
+# classroom/schedule.py
+
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.db.models import Q
+
+from .models import Enrollment
+
+
+def times_overlap(a, b):
+    """같은 요일에서 수업 시간이 겹치는지 (끝나는 시각 = 시작 시각은 겹침 아님)"""
+    return a.start_time < b.end_time and b.start_time < a.end_time
+
+
+def dates_overlap(a, b):
+    """강의 기간이 겹치는지 (기간이 없으면 겹치는 것으로 봄)"""
+    if not (a.start_date and a.end_date and b.start_date and b.end_date):
+        return True
+    return a.start_date <= b.end_date and b.start_date <= a.end_date
+
+
+def has_schedule(course):
+    return course.weekday is not None and course.start_time and course.end_time
+
+
+class ScheduleIndex:
+    """요일별 시간 구간 인덱스 - 강의 목록을 요일마다 시작 시각 순으로 정렬해 둠
+
+    겹침 검사는 시작 시각이 상대 강의의 종료 시각보다 빠른 구간만 bisect로 잘라서 봅니다.
+    """
+
+    def __init__(self, courses=()):
+        self._starts = defaultdict(list)
+        self._courses = defaultdict(list)
+        for course in sorted((c for c in courses if has_schedule(c)), key=lambda c: c.start_time):
+            self._starts[course.weekday].append(course.start_time)
+            self._courses[course.weekday].append(course)
+
+    @classmethod
+    def for_student(cls, student):
+        """학생의 현재 수강 중(완료 안 된) 강의로 인덱스 생성 - 쿼리 1번"""
+        enrollments = Enrollment.objects.filter(
+            student=student, is_completed=False
+        ).select_related('course')
+        return cls(e.course for e in enrollments)
+
+    @classmethod
+    async def afor_student(cls, student):
+        """for_student의 async 버전"""
+        enrollments = Enrollment.objects.filter(
+            student=student, is_completed=False
+        ).select_related('course')
+        return cls([e.course async for e in enrollments])
+
+    def conflicts(self, course):
+        """course와 시간/기간이 겹치는 강의 목록 (자기 자신 제외)"""
+        if not has_schedule(course):
+            return []
+
+        starts = self._starts.get(course.weekday, [])
+        candidates = self._courses.get(course.weekday, [])[:bisect_left(starts, course.end_time)]
+
+        return [
+            existing for existing in candidates
+            if existing.course_id != course.course_id
+            and times_overlap(existing, course)
+            and dates_overlap(existing, course)
+        ]
+
+    def first_conflict(self, course):
+        conflicts = self.conflicts(course)
+        return conflicts[0] if conflicts else None
+
+
+def conflicts_for_student(student, courses):
+    """학생 한 명 기준으로 여러 강의를 한 번에 검사 → {course_id: 겹치는 기존 강의}"""
+    return _first_conflicts(ScheduleIndex.for_student(student), courses)
+
+
+async def aconflicts_for_student(student, courses):
+    """conflicts_for_student의 async 버전"""
+    return _first_conflicts(await ScheduleIndex.afor_student(student), courses)
+
+
+def _first_conflicts(index, courses):
+    result = {}
+    for course in courses:
+        existing = index.first_conflict(course)
+        if existing is not None:
+            result[course.course_id] = existing
+    return result
+
+
+def students_in_conflict(course, students=None):
+    """강의 하나 기준으로 여러 학생을 한 번에 검사 → {student_id: 겹치는 기존 강의}
+
+    겹침 조건을 DB 조건으로 바꿔서 쿼리 1번으로 처리합니다.
+    """
+    if not has_schedule(course):
+        return {}
+
+    enrollments = Enrollment.objects.filter(
+        is_completed=False,
+        course__weekday=course.weekday,
+        course__start_time__lt=course.end_time,
+        course__end_time__gt=course.start_time,
+    ).exclude(course=course).select_related('course')
+
+    if course.start_date and course.end_date:
+        enrollments = enrollments.filter(
+            Q(course__start_date__lte=course.end_date, course__end_date__gte=course.start_date)
+            | Q(course__start_date__isnull=True)
+            | Q(course__end_date__isnull=True)
+        )
+    if students is not None:
+        enrollments = enrollments.filter(student__in=students)
+
+    result = {}
+    for enrollment in enrollments.order_by('course__start_time'):
+        result.setdefault(enrollment.student_id, enrollment.course)
+    return result
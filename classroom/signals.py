@@ -0,0 +1,76 @@
+# classroom/signals.py
+
+from functools import partial
+
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from course.models import Course
+from .models import (
+    Enrollment, Assignment, Submission, CourseNotice, WeeklyContent, CourseQuestion, QuestionAnswer
+)
+from . import calendar_index, course_room, dashboard
+
+
+@receiver(post_save, sender=Course)
+def sync_course_calendar(sender, instance, update_fields=None, **kwargs):
+    """강의 요일/기간이 바뀌면 캘린더 인덱스 갱신"""
+    if update_fields is not None and not calendar_index.SCHEDULE_FIELDS & set(update_fields):
+        return
+    calendar_index.sync_course(instance)
+
+
+@receiver(post_save, sender=Assignment)
+def sync_assignment_calendar(sender, instance, **kwargs):
+    """과제 마감일이 바뀌면 캘린더 인덱스 갱신"""
+    calendar_index.sync_assignment(instance)
+
+
+@receiver([post_save, post_delete], sender=CourseNotice)
+@receiver([post_save, post_delete], sender=WeeklyContent)
+@receiver([post_save, post_delete], sender=Assignment)
+@receiver([post_save, post_delete], sender=CourseQuestion)
+def invalidate_course_room(sender, instance, **kwargs):
+    """강의실 스냅샷 무효화"""
+    course_room.invalidate(instance.course_id)
+
+
+@receiver([post_save, post_delete], sender=Submission)
+def invalidate_course_room_by_submission(sender, instance, **kwargs):
+    # instance.assignment를 쓰면 (과제 삭제로 제출이 연쇄 삭제될 때) 행마다 과제를 조회하게 됨
+    course_room.invalidate(course_room.course_id_of(Assignment, instance.assignment_id))
+
+
+@receiver([post_save, post_delete], sender=QuestionAnswer)
+def invalidate_course_room_by_answer(sender, instance, **kwargs):
+    course_room.invalidate(course_room.course_id_of(CourseQuestion, instance.question_id))
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+@receiver([post_save, post_delete], sender=Submission)
+def invalidate_student_dashboard(sender, instance, **kwargs):
+    """수강 신청/취소/완료, 과제 제출 - 해당 학생 대시보드 무효화"""
+    dashboard.invalidate_user(instance.student_id)
+
+
+@receiver(post_save, sender=Course)
+@receiver([post_save, post_delete], sender=Assignment)
+def invalidate_course_dashboards(sender, instance, **kwargs):
+    """강의 정보 변경, 과제 등록/수정/삭제 - 수강생 전체 대시보드 무효화"""
+    dashboard.invalidate_course(instance.pk if sender is Course else instance.course_id)
+
+
+@receiver(post_delete, sender=Assignment)
+@receiver(post_delete, sender=Submission)
+@receiver(post_delete, sender=WeeklyContent)
+def release_files(sender, instance, **kwargs):
+    """행이 삭제되면 파일 참조도 해제 - 같은 내용을 다른 곳에서 쓰고 있으면 blob은 남음
+
+    삭제는 커밋 후에 - 트랜잭션이 롤백되면 행은 남으므로 파일도 남아야 함
+    """
+    for field in instance._meta.fields:
+        if isinstance(field, models.FileField):
+            fieldfile = getattr(instance, field.name)
+            if fieldfile:
+                transaction.on_commit(partial(fieldfile.storage.delete, fieldfile.name))
@@ -0,0 +1,29 @@
+# classroom/snapshot_cache.py
+
+import time
+
+from django.core.cache import cache
+
+
+def get_version(key):
+    """캐시 버전 번호 조회 - 버전이 바뀌면 이전 버전으로 저장된 스냅샷은 더 이상 안 읽힘
+
+    버전 키가 없으면 (처음이거나 캐시에서 밀려남) 1이 아니라 현재 시각으로 시작
+    → 버전 키만 사라지고 예전 v1 스냅샷이 남아 있어도 다시 읽히지 않음
+    """
+    version = cache.get(key)
+    if version is None:
+        initial = time.time_ns()
+        cache.add(key, initial, None)
+        version = cache.get(key, initial)
+    return version
+
+
+def bump(*keys):
+    """버전 바꾸기 (= 해당 스냅샷 무효화) - 키가 여러 개여도 set_many 한 번
+
+    이전 값을 읽어서 올리지 않고 새 값(현재 시각)으로 덮어씀 → 키 수와 상관없이 캐시 왕복 한 번
+    """
+    if keys:
+        version = time.time_ns()
+        cache.set_many({key: version for key in keys}, None)
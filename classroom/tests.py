@@ -1,3 +1,316 @@
-from django.test import TestCase
+import hashlib
+import io
+import shutil
+import tempfile
+from datetime import date, time
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from course.models import Course
+from user.models import User
+from . import uploads
+from .models import ChunkedUpload, Enrollment, WeeklyContent
+
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix='classroom-tests-')
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+def make_course(instructor, title='파이썬 기초'):
+    return Course.objects.create(
+        instructor=instructor, title=title, description='설명', weekday=0,
+        start_time=time(10), end_time=time(12), start_date=date(2026, 3, 2), end_date=date(2026, 6, 30),
+    )
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PROTECTED_MEDIA_SERVER='')
+class ProtectedDownloadTests(TestCase):
+    """보호된 파일 다운로드 (classroom.downloads) - Range/206/416, ETag, 수강 여부 확인"""
+
+    BODY = bytes(range(256)) * 4  # 1024바이트
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = User.objects.create_user(
+            email='teacher@example.com', password='pw', name='강사', phone_number='010-0000-0021'
+        )
+        cls.student = User.objects.create_user(
+            email='student@example.com', password='pw', name='수강생', phone_number='010-0000-0022'
+        )
+        cls.outsider = User.objects.create_user(
+            email='outsider@example.com', password='pw', name='외부인', phone_number='010-0000-0023'
+        )
+        cls.course = make_course(cls.instructor)
+        Enrollment.objects.create(student=cls.student, course=cls.course)
+        cls.content = WeeklyContent(course=cls.course, week_number=1, title='1주차 자료')
+        cls.content.file.save('lecture.pdf', ContentFile(cls.BODY))
+        cls.url = reverse('classroom:weekly_file', args=[cls.content.content_id])
+
+    def setUp(self):
+        self.client.force_login(self.student)
+
+    def get(self, **headers):
+        return self.client.get(self.url, headers=headers)
+
+    def test_full_download(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.BODY)
+        self.assertEqual(response['Content-Length'], '1024')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Cache-Control'], 'private, max-age=0, must-revalidate')
+
+    def test_byte_range(self):
+        response = self.get(Range='bytes=100-199')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 100-199/1024')
+        self.assertEqual(response['Content-Length'], '100')
+        self.assertEqual(b''.join(response.streaming_content), self.BODY[100:200])
+
+    def test_open_ended_range_stops_at_end_of_file(self):
+        response = self.get(Range='bytes=1000-5000')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 1000-1023/1024')
+        self.assertEqual(b''.join(response.streaming_content), self.BODY[1000:])
+
+    def test_suffix_range(self):
+        response = self.get(Range='bytes=-24')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 1000-1023/1024')
+        self.assertEqual(b''.join(response.streaming_content), self.BODY[-24:])
+
+        # 파일보다 긴 suffix → 파일 전체
+        response = self.get(Range='bytes=-5000')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 0-1023/1024')
+
+    def test_multiple_ranges_fall_back_to_full_file(self):
+        response = self.get(Range='bytes=0-9,20-29')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.BODY)
+
+    def test_malformed_range_is_ignored(self):
+        response = self.get(Range='items=0-9')
+        self.assertEqual(response.status_code, 200)
+
+    def test_unsatisfiable_range(self):
+        for header in ('bytes=1024-', 'bytes=500-100', 'bytes=-0'):
+            with self.subTest(header=header):
+                response = self.get(Range=header)
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], 'bytes */1024')
+
+    def test_if_none_match(self):
+        etag = self.get()['ETag']
+        response = self.get(If_None_Match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        self.assertEqual(self.get(If_None_Match=f'"other", {etag}').status_code, 304)
+        self.assertEqual(self.get(If_None_Match='*').status_code, 304)
+        self.assertEqual(self.get(If_None_Match='"other"').status_code, 200)
+
+    def test_if_modified_since(self):
+        last_modified = self.get()['Last-Modified']
+        self.assertEqual(self.get(If_Modified_Since=last_modified).status_code, 304)
+
+    def test_stale_if_range_sends_full_file(self):
+        response = self.get(Range='bytes=0-9', If_Range='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        self.assertEqual(self.get(Range='bytes=0-9', If_Range=etag).status_code, 206)
+
+    def test_instructor_can_download(self):
+        self.client.force_login(self.instructor)
+        self.assertEqual(self.get().status_code, 200)
+
+    def test_not_enrolled_user_gets_404(self):
+        self.client.force_login(self.outsider)
+        self.assertEqual(self.get().status_code, 404)
+        self.assertEqual(self.get(Range='bytes=0-9').status_code, 404)
+
+    def test_anonymous_user_is_redirected_to_login(self):
+        self.client.logout()
+        response = self.get()
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse('user:login'), response['Location'])
+
+
+@override_settings(CHUNKED_UPLOAD_MAX_CHUNK_SIZE=1024)
+class ChunkedUploadTests(TestCase):
+    """분할 업로드 (classroom.uploads) - 조각 순서, 이어 받기, 완료 확인, 교체된 파일 정리"""
+
+    BODY = b'0123456789' * 300  # 3000바이트 → 1024바이트 조각 3개
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = User.objects.create_user(
+            email='uploader@example.com', password='pw', name='강사', phone_number='010-0000-0024'
+        )
+        cls.other = User.objects.create_user(
+            email='other-uploader@example.com', password='pw', name='다른 강사', phone_number='010-0000-0025'
+        )
+        cls.course = make_course(cls.instructor)
+
+    def setUp(self):
+        # 테스트마다 빈 MEDIA_ROOT - 같은 내용의 파일이 다른 테스트의 blob에 연결되지 않도록
+        media_root = tempfile.mkdtemp(dir=MEDIA_ROOT)
+        media_settings = self.settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+    def start(self, sha256=''):
+        return uploads.start(
+            self.instructor, 'weekly_content', self.course.course_id, 'lecture.pdf', len(self.BODY), sha256
+        )
+
+    def send(self, upload, offset, size=1024, body=None):
+        chunk = (body or self.BODY)[offset:offset + size]
+        return uploads.write_chunk(upload.upload_id, self.instructor, offset, io.BytesIO(chunk), len(chunk))
+
+    def send_all(self, upload, body=None):
+        for offset in range(upload.offset, len(self.BODY), 1024):
+            upload = self.send(upload, offset, body=body)
+        return upload
+
+    def read(self, name):
+        with default_storage.open(name) as f:
+            return f.read()
+
+    def test_chunks_are_written_in_order(self):
+        upload = self.send_all(self.start())
+        self.assertEqual(upload.offset, len(self.BODY))
+        self.assertEqual(self.read(upload.file_name), self.BODY)
+
+    def test_out_of_order_chunk_is_rejected(self):
+        upload = self.start()
+        with self.assertRaises(uploads.UploadError) as error:
+            self.send(upload, 1024)
+        self.assertEqual(error.exception.status, 409)
+        self.assertEqual(error.exception.upload.offset, 0)  # 클라이언트는 이 위치부터 다시 보냄
+
+        upload = self.send(upload, 0)
+        with self.assertRaises(uploads.UploadError) as error:
+            self.send(upload, 0)  # 같은 조각을 두 번 보냄
+        self.assertEqual(error.exception.status, 409)
+        self.assertEqual(error.exception.upload.offset, 1024)
+
+    def test_corrupt_or_oversized_chunk_is_not_written(self):
+        upload = self.start()
+        with self.assertRaises(uploads.UploadError):
+            uploads.write_chunk(
+                upload.upload_id, self.instructor, 0, io.BytesIO(self.BODY[:1024]), 1024, chunk_sha256='0' * 64
+            )
+        with self.assertRaises(uploads.UploadError) as error:
+            uploads.write_chunk(upload.upload_id, self.instructor, 0, io.BytesIO(self.BODY[:2000]), 2000)
+        self.assertEqual(error.exception.status, 413)
+        upload.refresh_from_db()
+        self.assertEqual(upload.offset, 0)
+
+    def test_other_user_cannot_write(self):
+        upload = self.start()
+        with self.assertRaises(uploads.UploadError) as error:
+            uploads.write_chunk(upload.upload_id, self.other, 0, io.BytesIO(self.BODY[:10]), 10)
+        self.assertEqual(error.exception.status, 404)
+
+    def test_start_again_resumes_from_received_offset(self):
+        sha256 = hashlib.sha256(self.BODY).hexdigest()
+        upload = self.send(self.start(sha256), 0)
+
+        resumed = self.start(sha256)
+        self.assertEqual(resumed.upload_id, upload.upload_id)
+        self.assertEqual(resumed.offset, 1024)
+
+        upload = uploads.complete(self.send_all(resumed).upload_id, self.instructor)
+        self.assertEqual(upload.status, 'complete')
+        self.assertEqual(self.read(upload.file_name), self.BODY)
+
+        # 다른 파일(체크섬이 다름)은 새 업로드
+        self.assertNotEqual(self.start('f' * 64).upload_id, upload.upload_id)
+
+    def test_chunk_view_reports_offset_for_resume(self):
+        upload = self.send(self.start(), 0)
+        self.client.force_login(self.instructor)
+        url = reverse('classroom:upload_chunk', args=[upload.upload_id])
+
+        self.assertEqual(self.client.get(url).json()['offset'], 1024)
+
+        response = self.client.put(
+            url, self.BODY[2048:], content_type='application/octet-stream', headers={'X-Upload-Offset': '2048'}
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['offset'], 1024)
+
+        response = self.client.put(
+            url, self.BODY[1024:2048], content_type='application/octet-stream', headers={'X-Upload-Offset': '1024'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['offset'], 2048)
+
+    def test_complete_requires_all_chunks(self):
+        upload = self.send(self.start(), 0)
+        with self.assertRaises(uploads.UploadError) as error:
+            uploads.complete(upload.upload_id, self.instructor)
+        self.assertEqual(error.exception.status, 409)
+
+    def test_complete_checks_sha256(self):
+        upload = self.start(hashlib.sha256(self.BODY).hexdigest())
+        upload = self.send_all(upload, body=self.BODY[::-1])
+
+        with self.assertRaises(uploads.UploadError):
+            uploads.complete(upload.upload_id, self.instructor)
+        upload.refresh_from_db()
+        self.assertEqual((upload.offset, upload.status), (0, 'uploading'))  # 처음부터 다시
+        self.assertEqual(self.read(upload.file_name), b'')
+
+        upload = uploads.complete(self.send_all(upload).upload_id, self.instructor)
+        self.assertEqual(upload.status, 'complete')
+        self.assertEqual(uploads.complete(upload.upload_id, self.instructor), upload)  # 다시 불러도 그대로
+
+    def test_complete_deduplicates_against_existing_file(self):
+        existing = default_storage.save('course_materials/existing.pdf', ContentFile(self.BODY))
+        upload = uploads.complete(self.send_all(self.start()).upload_id, self.instructor)
+        self.assertEqual(default_storage.ref_count(existing), 2)
+        self.assertEqual(default_storage.ref_count(upload.file_name), 2)
+
+    def test_claim_hands_over_the_name(self):
+        upload = self.send_all(self.start())
+        with self.assertRaises(uploads.UploadError):
+            uploads.claim(upload.upload_id, self.instructor, 'weekly_content', self.course.course_id)
+
+        uploads.complete(upload.upload_id, self.instructor)
+        name = uploads.claim(upload.upload_id, self.instructor, 'weekly_content', self.course.course_id)
+        self.assertEqual(name, upload.file_name)
+        self.assertFalse(ChunkedUpload.objects.filter(pk=upload.pk).exists())
+
+    def test_replaced_file_is_released_on_commit(self):
+        content = WeeklyContent(course=self.course, week_number=1, title='1주차 자료')
+        content.file.save('old.pdf', ContentFile(b'old lecture'))
+        old_name = content.file.name
+
+        upload = uploads.complete(self.send_all(self.start()).upload_id, self.instructor)
+        content.file = uploads.claim(upload.upload_id, self.instructor, 'weekly_content', self.course.course_id)
+        with self.captureOnCommitCallbacks() as callbacks:
+            content.save()
+            uploads.release_replaced(content.file, old_name)
+        self.assertTrue(default_storage.exists(old_name))  # 커밋 전에는 그대로
+
+        for callback in callbacks:
+            callback()
+        self.assertFalse(default_storage.exists(old_name))
+        self.assertEqual(self.read(content.file.name), self.BODY)
+
+    def test_unchanged_file_is_not_released(self):
+        content = WeeklyContent(course=self.course, week_number=1, title='1주차 자료')
+        content.file.save('same.pdf', ContentFile(b'lecture'))
+        with self.captureOnCommitCallbacks() as callbacks:
+            uploads.release_replaced(content.file, content.file.name)
+            uploads.release_replaced(content.file, None)
+        self.assertEqual(callbacks, [])
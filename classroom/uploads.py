@@ -0,0 +1,225 @@
+# classroom/uploads.py
+
+import hashlib
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from .models import ChunkedUpload, Submission, WeeklyContent
+
+
+READ_BLOCK = 64 * 1024
+
+# purpose → 파일이 최종적으로 연결될 FileField
+TARGET_FIELDS = {
+    'submission': Submission._meta.get_field('file'),
+    'weekly_content': WeeklyContent._meta.get_field('file'),
+}
+
+
+class UploadError(Exception):
+    """분할 업로드 요청 오류 - status는 그대로 HTTP 응답 코드로 사용"""
+
+    def __init__(self, message, status=400, upload=None):
+        super().__init__(message)
+        self.status = status
+        self.upload = upload
+
+
+def max_size():
+    return getattr(settings, 'CHUNKED_UPLOAD_MAX_SIZE', 2 * 1024 ** 3)
+
+
+def max_chunk_size():
+    return getattr(settings, 'CHUNKED_UPLOAD_MAX_CHUNK_SIZE', 8 * 1024 ** 2)
+
+
+def as_dict(upload):
+    return {
+        'upload_id': str(upload.upload_id),
+        'offset': upload.offset,
+        'total_size': upload.total_size,
+        'status': upload.status,
+    }
+
+
+def start(user, purpose, target_id, filename, total_size, sha256=''):
+    """업로드 시작 - 같은 파일(이름/크기/체크섬)로 진행 중인 업로드가 있으면 그대로 이어서 받음
+
+    새 업로드면 FileField의 upload_to 규칙으로 최종 경로를 정하고 빈 파일을 만들어 둡니다.
+    """
+    if purpose not in TARGET_FIELDS:
+        raise UploadError('알 수 없는 업로드 종류입니다.')
+    if not filename:
+        raise UploadError('파일 이름이 필요합니다.')
+    if not 0 < total_size <= max_size():
+        raise UploadError(f'파일 크기는 {max_size() // 1024 ** 2}MB 이하여야 합니다.', status=413)
+
+    sha256 = (sha256 or '').lower()
+    existing = ChunkedUpload.objects.filter(
+        user=user, purpose=purpose, target_id=target_id,
+        original_name=filename, total_size=total_size, sha256=sha256,
+    ).order_by('-updated_at').first()
+    if existing is not None and os.path.exists(default_storage.path(existing.file_name)):
+        return existing
+
+    field = TARGET_FIELDS[purpose]
+    name = default_storage.get_available_name(field.generate_filename(None, os.path.basename(filename)))
+    path = default_storage.path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'xb').close()  # 이름 선점
+
+    return ChunkedUpload.objects.create(
+        user=user, purpose=purpose, target_id=target_id,
+        original_name=filename, file_name=name,
+        total_size=total_size, sha256=sha256,
+    )
+
+
+def _check_position(upload, offset, length):
+    if upload is None:
+        raise UploadError('업로드를 찾을 수 없습니다.', status=404)
+    if upload.status != 'uploading':
+        raise UploadError('이미 완료된 업로드입니다.', status=409, upload=upload)
+    if offset != upload.offset:
+        raise UploadError('업로드 위치가 맞지 않습니다.', status=409, upload=upload)
+    if offset + length > upload.total_size:
+        raise UploadError('파일 크기를 넘는 조각입니다.')
+
+
+def _receive(stream, length):
+    """요청 본문(조각)을 임시 파일로 받으면서 해시 계산 → (임시 파일, 받은 바이트 수, sha256)
+
+    1MB까지는 메모리, 넘으면 디스크 (조각 최대 크기는 CHUNKED_UPLOAD_MAX_CHUNK_SIZE)
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=READ_BLOCK * 16)
+    digest = hashlib.sha256()
+    received = 0
+    while received < length:
+        block = stream.read(min(READ_BLOCK, length - received))
+        if not block:
+            break
+        buffer.write(block)
+        digest.update(block)
+        received += len(block)
+    buffer.seek(0)
+    return buffer, received, digest.hexdigest()
+
+
+def write_chunk(upload_id, user, offset, stream, length, chunk_sha256=''):
+    """조각 하나를 최종 파일의 offset 위치에 씀
+
+    서버가 받은 위치(upload.offset)와 다른 offset이 오면 409와 함께 현재 위치를 알려줘서
+    클라이언트가 그 지점부터 다시 보내게 합니다.
+    클라이언트에게서 본문을 받는 동안(느린 네트워크면 수 초)은 행 잠금을 잡지 않고,
+    다 받고 검증한 뒤에만 select_for_update로 위치 확인 + 파일 쓰기를 합니다.
+    """
+    if length <= 0:
+        raise UploadError('빈 조각입니다.')
+    if length > max_chunk_size():
+        raise UploadError('조각이 너무 큽니다.', status=413)
+
+    # 본문을 받기 전에 잠금 없이 먼저 확인 (위치가 틀린 조각은 받지 않고 바로 409)
+    _check_position(ChunkedUpload.objects.filter(upload_id=upload_id, user=user).first(), offset, length)
+
+    buffer, received, digest = _receive(stream, length)
+    with buffer:
+        if received != length or (chunk_sha256 and digest != chunk_sha256.lower()):
+            # 잘못 받은 조각은 쓰지 않음 - 다음 요청이 같은 위치부터 다시 보냄
+            upload = ChunkedUpload.objects.filter(upload_id=upload_id, user=user).first()
+            raise UploadError('조각이 손상되었습니다. 다시 보내주세요.', upload=upload)
+
+        with transaction.atomic():
+            # 그 사이 같은 위치의 다른 요청이 먼저 썼을 수 있으므로 잠근 뒤 다시 확인
+            upload = ChunkedUpload.objects.select_for_update().filter(upload_id=upload_id, user=user).first()
+            _check_position(upload, offset, length)
+
+            with open(default_storage.path(upload.file_name), 'r+b') as f:
+                f.seek(offset)
+                shutil.copyfileobj(buffer, f, READ_BLOCK)
+
+            upload.offset = offset + received
+            upload.save(update_fields=['offset', 'updated_at'])
+    return upload
+
+
+def release_replaced(fieldfile, old_name):
+    """FileField의 파일이 다른 것으로 바뀌었으면 이전 파일을 커밋 후에 삭제
+
+    중복 제거 저장소에서는 이름(하드링크)만 지워지고, 같은 내용을 쓰는 다른 파일이 있으면 blob은 남습니다.
+    """
+    if old_name and fieldfile.name != old_name:
+        storage = fieldfile.storage
+        transaction.on_commit(lambda: storage.delete(old_name))
+
+
+def complete(upload_id, user):
+    """모든 조각을 받았는지 확인하고, 시작할 때 받은 체크섬이 있으면 파일 전체와 비교"""
+    upload = ChunkedUpload.objects.filter(upload_id=upload_id, user=user).first()
+    if upload is None:
+        raise UploadError('업로드를 찾을 수 없습니다.', status=404)
+    if upload.status == 'complete':
+        return upload
+    if upload.offset != upload.total_size:
+        raise UploadError('아직 받지 못한 조각이 있습니다.', status=409, upload=upload)
+
+    if upload.sha256:
+        digest = hashlib.sha256()
+        with open(default_storage.path(upload.file_name), 'rb') as f:
+            for block in iter(lambda: f.read(READ_BLOCK * 16), b''):
+                digest.update(block)
+        if digest.hexdigest() != upload.sha256:
+            # 처음부터 다시 받도록 초기화
+            with open(default_storage.path(upload.file_name), 'r+b') as f:
+                f.truncate(0)
+            upload.offset = 0
+            upload.save(update_fields=['offset', 'updated_at'])
+            raise UploadError('체크섬이 일치하지 않습니다. 다시 업로드해주세요.', upload=upload)
+
+    # 중복 제거 저장소면 같은 내용의 기존 파일과 합침
+    if hasattr(default_storage, 'adopt'):
+        default_storage.adopt(upload.file_name, upload.sha256 or None)
+
+    upload.status = 'complete'
+    upload.save(update_fields=['status', 'updated_at'])
+    return upload
+
+
+def claim(upload_id, user, purpose, target_id):
+    """완료된 업로드를 FileField에 연결할 이름으로 넘겨줌 (파일 복사 없음)
+
+    사용 예: submission.file = uploads.claim(...)  (이전 파일은 release_replaced로 정리)
+    """
+    try:
+        upload_id = uuid.UUID(str(upload_id))
+    except ValueError:
+        raise UploadError('잘못된 업로드 ID입니다.')
+
+    upload = ChunkedUpload.objects.filter(
+        upload_id=upload_id, user=user, purpose=purpose, target_id=target_id, status='complete'
+    ).first()
+    if upload is None:
+        raise UploadError('업로드가 완료되지 않았거나 찾을 수 없습니다.', status=404)
+    name = upload.file_name
+    upload.delete()
+    return name
+
+
+def cleanup(hours=None):
+    """오래된(기본 24시간) 미완료/미연결 업로드와 파일 삭제 → 삭제한 개수"""
+    hours = hours or getattr(settings, 'CHUNKED_UPLOAD_EXPIRE_HOURS', 24)
+    expired = ChunkedUpload.objects.filter(updated_at__lt=timezone.now() - timedelta(hours=hours))
+
+    count = 0
+    for upload in expired:
+        default_storage.delete(upload.file_name)
+        upload.delete()
+        count += 1
+    return count
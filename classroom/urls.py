@@ -46,6 +46,18 @@ urlpatterns = [
 
     path('assignment/<int:assignment_id>/submissions/', views.submission_list_view, name='submission_list'),
     path('submission/<int:submission_id>/feedback/', views.submission_feedback_view, name='submission_feedback'),
+    path('assignment/<int:assignment_id>/grade/bulk/', views.bulk_grade_view, name='bulk_grade'),
+    path('course/<int:course_id>/gradebook.csv', views.gradebook_export_view, name='gradebook_export'),
+
+    # 분할 업로드
+    path('upload/', views.upload_start_view, name='upload_start'),
+    path('upload/<uuid:upload_id>/', views.upload_chunk_view, name='upload_chunk'),
+    path('upload/<uuid:upload_id>/complete/', views.upload_complete_view, name='upload_complete'),
+
+    # 보호된 파일 다운로드
+    path('weekly/<int:content_id>/file/', views.weekly_content_file_view, name='weekly_file'),
+    path('assignment/<int:assignment_id>/attachment/', views.assignment_attachment_view, name='assignment_attachment'),
+    path('submission/<int:submission_id>/file/', views.submission_file_view, name='submission_file'),
 
     path('assignment/<int:assignment_id>/submit/', views.submit_assignment_view, name='submit_assignment'),
 
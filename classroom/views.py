@@ -2,19 +2,25 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.utils import timezone
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse, Http404
+from django.views.decorators.http import require_POST
+import json
 from datetime import datetime, timedelta
 import calendar as cal
 
 from course.models import Course
 from .models import (
     Enrollment, Assignment, Submission, CourseNotice, WeeklyContent,
-    CourseQuestion, QuestionAnswer
+    CourseQuestion, QuestionAnswer, ChunkedUpload
 )
 from .forms import (
     AssignmentForm, SubmissionForm, QuestionForm, AnswerForm,
     NoticeForm, WeeklyContentForm, SubmissionFeedbackForm
 )
+from . import calendar_index, course_room, dashboard, downloads, grading, uploads
+from .gradebook import Gradebook, iter_csv
+from .schedule import ScheduleIndex
+from core.asyncviews import resolve_user
 
 
 
@@ -31,40 +37,6 @@ def unenroll_course_view(request, enrollment_id):
     return redirect('classroom:my_classroom')
 
 
-@login_required
-def my_course_detail_view(request, course_id):
-    """강의별 전용 강의실"""
-    course = get_object_or_404(Course, course_id=course_id)
-
-    # 수강 중인지 확인
-    enrollment = get_object_or_404(Enrollment, student=request.user, course=course)
-
-    # 공지사항
-    notices = CourseNotice.objects.filter(course=course).order_by('-is_pinned', '-created_at')
-
-    # 주차별 자료
-    weekly_contents = WeeklyContent.objects.filter(course=course).order_by('week_number')
-
-    # 과제 목록
-    assignments = Assignment.objects.filter(course=course).order_by('-due_date')
-
-    # 내 제출 상태
-    my_submissions = Submission.objects.filter(
-        assignment__course=course,
-        student=request.user
-    ).values_list('assignment_id', flat=True)
-
-    context = {
-        'course': course,
-        'enrollment': enrollment,
-        'notices': notices,
-        'weekly_contents': weekly_contents,
-        'assignments': assignments,
-        'submitted_ids': list(my_submissions),
-    }
-    return render(request, 'classroom/course_room.html', context)
-
-
 @login_required
 def assignment_create_view(request, course_id):
     """과제 생성 (강사/관리자만)"""
@@ -186,14 +158,26 @@ def submit_assignment_view(request, assignment_id):
     ).first()
 
     if request.method == 'POST':
+        # 재제출이면 이전 파일 이름 기억 (폼 검증 중에 instance의 파일이 새 것으로 바뀜)
+        old_file = submission.file.name if submission else ''
         form = SubmissionForm(request.POST, request.FILES, instance=submission)
         if form.is_valid():
             submission = form.save(commit=False)
             submission.assignment = assignment
             submission.student = request.user
-            submission.save()
-            messages.success(request, '과제가 제출되었습니다!')
-            return redirect('classroom:assignment_detail', assignment_id=assignment.assignment_id)
+            try:
+                # 분할 업로드로 이미 저장된 파일이면 이름만 연결 (복사 없음)
+                if request.POST.get('upload_id'):
+                    submission.file = uploads.claim(
+                        request.POST['upload_id'], request.user, 'submission', assignment.assignment_id
+                    )
+            except uploads.UploadError as e:
+                messages.error(request, str(e))
+            else:
+                submission.save()
+                uploads.release_replaced(submission.file, old_file)
+                messages.success(request, '과제가 제출되었습니다!')
+                return redirect('classroom:assignment_detail', assignment_id=assignment.assignment_id)
     else:
         form = SubmissionForm(instance=submission)
 
@@ -280,41 +264,20 @@ def calendar_view(request):
     cal_obj = cal.Calendar(firstweekday=6)
     month_days = cal_obj.monthdatescalendar(year, month)
 
+    # 2. 캘린더 인덱스에서 화면에 보이는 날짜 범위를 한 번에 조회
     user_courses = [e.course for e in ongoing_courses]
-
-    # [중요] 2. 과제 데이터를 여기서 미리 가져와야 합니다!
-    my_assignments = Assignment.objects.filter(course__in=user_courses)
+    buckets = calendar_index.month_buckets(user_courses, month_days[0][0], month_days[-1][-1])
 
     calendar_weeks = []
     for week in month_days:
         week_data = []
         for day in week:
-            # (1) 강의 스케줄 로직
-            day_courses = []
-            weekday = day.weekday()
-            if weekday == 6:
-                weekday = 0
-            else:
-                weekday += 1
-
-            for course in user_courses:
-                if course.weekday == weekday:
-                    if course.start_date <= day <= course.end_date:
-                        day_courses.append(course)
-
-            # (2) 과제 마감일 로직 (여기가 수정되었습니다)
-            day_assignments_list = []  # 이름 변경 (혼동 방지)
-
-            # [중요] 빈 리스트가 아니라, 위에서 가져온 'my_assignments'를 반복해야 합니다.
-            for assignment in my_assignments:
-                if assignment.due_date and assignment.due_date.date() == day:
-                    day_assignments_list.append(assignment)
-
+            events = buckets.get(day, calendar_index.EMPTY_BUCKET)
             week_data.append({
                 'day': day.day,
                 'is_current_month': day.month == month,
-                'courses': day_courses,
-                'assignments': day_assignments_list,  # 템플릿으로 전달
+                'assignments': events['assignments'],
+                'courses': events['courses'],
             })
         calendar_weeks.append(week_data)
 
@@ -341,44 +304,25 @@ def enroll_course_view(request, course_id):
         messages.warning(request, '이미 수강 중인 강의입니다.')
         return redirect('course:course_detail', course_id=course_id)
 
-    # 시간표 겹침 체크
-    if course.weekday is not None and course.start_time and course.end_time:
-        my_enrollments = Enrollment.objects.filter(
-            student=request.user,
-            is_completed=False
-        ).select_related('course')
-
-        for enrollment in my_enrollments:
-            existing = enrollment.course
-
-            if existing.weekday == course.weekday:
-                if existing.start_time and existing.end_time:
-                    is_before = course.end_time <= existing.start_time
-                    is_after = course.start_time >= existing.end_time
-
-                    if not (is_before or is_after):
-                        # 기간 겹침도 검사
-                        if course.start_date and course.end_date and existing.start_date and existing.end_date:
-                            date_before = course.end_date < existing.start_date
-                            date_after = course.start_date > existing.end_date
-
-                            if not (date_before or date_after):
-                                messages.error(
-                                    request,
-                                    f'❌ 시간표 겹침: "{existing.title}" 강의와 시간/기간이 겹칩니다.\n'
-                                    f'📅 요일: {existing.get_weekday_display()}\n'
-                                    f'⏰ 기존 강의: {existing.start_time.strftime("%H:%M")} - {existing.end_time.strftime("%H:%M")}\n'
-                                    f'📆 기존 기간: {existing.start_date} ~ {existing.end_date}'
-                                )
-                                return redirect('course:course_detail', course_id=course_id)
-                        else:
-                            messages.error(
-                                request,
-                                f'❌ 시간표 겹침: "{existing.title}" 강의와 시간이 겹칩니다.\n'
-                                f'📅 요일: {existing.get_weekday_display()}\n'
-                                f'⏰ 기존 강의: {existing.start_time.strftime("%H:%M")} - {existing.end_time.strftime("%H:%M")}'
-                            )
-                            return redirect('course:course_detail', course_id=course_id)
+    # 시간표 겹침 체크 (요일별 시간 구간 인덱스)
+    existing = ScheduleIndex.for_student(request.user).first_conflict(course)
+    if existing is not None:
+        if course.start_date and course.end_date and existing.start_date and existing.end_date:
+            messages.error(
+                request,
+                f'❌ 시간표 겹침: "{existing.title}" 강의와 시간/기간이 겹칩니다.\n'
+                f'📅 요일: {existing.get_weekday_display()}\n'
+                f'⏰ 기존 강의: {existing.start_time.strftime("%H:%M")} - {existing.end_time.strftime("%H:%M")}\n'
+                f'📆 기존 기간: {existing.start_date} ~ {existing.end_date}'
+            )
+        else:
+            messages.error(
+                request,
+                f'❌ 시간표 겹침: "{existing.title}" 강의와 시간이 겹칩니다.\n'
+                f'📅 요일: {existing.get_weekday_display()}\n'
+                f'⏰ 기존 강의: {existing.start_time.strftime("%H:%M")} - {existing.end_time.strftime("%H:%M")}'
+            )
+        return redirect('course:course_detail', course_id=course_id)
 
     Enrollment.objects.create(student=request.user, course=course)
     messages.success(request, f'✅ "{course.title}" 수강 신청이 완료되었습니다!')
@@ -387,95 +331,11 @@ def enroll_course_view(request, course_id):
 
 
 @login_required
-def dashboard_view(request):
-    """내 강의실 - 대시보드 (주간 시간표 + 예정된 강의 + 강의 목록 + 미제출 과제)"""
-    user = request.user
-
-    # ✅ 현재 수강 중(완료 안 된) 강의만 사용
-    ongoing_courses = Enrollment.objects.filter(
-        student=user,
-        is_completed=False
-    ).select_related('course', 'course__instructor').order_by('-enrolled_at')
-
-    # 이번 주 기준 데이터 (주간 카드/예정 강의용)
-    now = datetime.now()
-    weekday = now.weekday()          # 0=월, 6=일
-    current_time = now.time()
-    monday = now - timedelta(days=weekday)
-
-    weekday_names = ['월요일 (Mon)', '화요일 (Tue)', '수요일 (Wed)',
-                     '목요일 (Thu)', '금요일 (Fri)', '토요일 (Sat)', '일요일 (Sun)']
-
-    weekly_schedule = []
-    for i in range(7):
-        day_date = monday + timedelta(days=i)
-        day_courses = []
-        for e in ongoing_courses:
-            c = e.course
-            if c.weekday == i:
-                day_courses.append({
-                    'title': c.title,
-                    'start_time': c.start_time,
-                    'end_time': c.end_time,
-                    'category': c.category,
-                })
-        day_courses.sort(key=lambda x: x['start_time'] if x['start_time'] else datetime.max.time())
-        weekly_schedule.append({
-            'weekday_name': weekday_names[i],
-            'date': day_date.strftime('%m/%d'),
-            'courses': day_courses,
-        })
-
-    # 예정된 강의 (최대 3개)
-    upcoming_courses = []
-    for e in ongoing_courses:
-        c = e.course
-        if c.weekday is not None and c.start_time:
-            if c.weekday == weekday:
-                if c.start_time > current_time:
-                    upcoming_courses.append({
-                        'course': c,
-                        'enrollment': e,
-                        'days_until': 0,
-                        'date_str': '오늘',
-                    })
-            elif c.weekday > weekday:
-                d = c.weekday - weekday
-                upcoming_courses.append({
-                    'course': c,
-                    'enrollment': e,
-                    'days_until': d,
-                    'date_str': f'{d}일 후',
-                })
-            else:
-                d = 7 - weekday + c.weekday
-                upcoming_courses.append({
-                    'course': c,
-                    'enrollment': e,
-                    'days_until': d,
-                    'date_str': f'{d}일 후',
-                })
-
-    upcoming_courses.sort(key=lambda x: (x['days_until'], x['course'].start_time))
-    upcoming_courses = upcoming_courses[:3]
-
-    # 미제출 과제
-    pending_assignments = Assignment.objects.filter(
-        course__in=[e.course for e in ongoing_courses],
-        due_date__gte=timezone.now()
-    ).exclude(
-        submissions__student=user
-    ).select_related('course').order_by('due_date')[:5]
-
-    context = {
-        'ongoing_courses': ongoing_courses,           # 강의 테이블 + 사이드바
-        'weekly_schedule': weekly_schedule,           # 주간 카드
-        'upcoming_courses': upcoming_courses,         # 예정된 강의 카드
-        'completed_courses': Enrollment.objects.filter(
-            student=user, is_completed=True
-        ),
-        'pending_assignments': pending_assignments,   # 미제출 과제
-    }
+async def dashboard_view(request):
+    """내 강의실 - 대시보드 (주간 시간표 + 예정된 강의 + 강의 목록 + 미제출 과제, async 뷰)"""
+    user = await resolve_user(request)
+    # 사용자별 스냅샷 (5분 캐시, 수강/과제/제출 변경 시 signals에서 무효화)
+    context = await dashboard.aget_snapshot(user)
     return render(request, 'classroom/dashboard.html', context)
 
 
@@ -490,35 +350,17 @@ def get_ongoing_enrollments(user):
 @login_required
 def my_course_detail_view(request, course_id):
     """강의별 전용 강의실"""
-    course = get_object_or_404(Course, course_id=course_id)
+    course = get_object_or_404(Course.objects.select_related('instructor'), course_id=course_id)
     enrollment = get_object_or_404(Enrollment, student=request.user, course=course)
 
-    # 공지사항
-    notices = CourseNotice.objects.filter(course=course).order_by('-is_pinned', '-created_at')
-
-    # 주차별 자료
-    weekly_contents = WeeklyContent.objects.filter(course=course).order_by('week_number')
-
-    # 과제 목록
-    assignments = Assignment.objects.filter(course=course).order_by('-due_date')
-
-    # 내 제출 상태
-    my_submissions = Submission.objects.filter(
-        assignment__course=course,
-        student=request.user
-    ).values_list('assignment_id', flat=True)
-
-    # 👇 질문 게시판 추가
-    questions = CourseQuestion.objects.filter(course=course).select_related('author').prefetch_related('answers')
+    # 공지사항 / 주차별 자료 / 과제(+내 제출 여부) / 질문(+답변 수)
+    # (강의, 사용자)별로 캐시되고, 하위 데이터가 바뀌면 signals에서 무효화
+    snapshot = course_room.get_snapshot(course, request.user)
 
     context = {
         'course': course,
         'enrollment': enrollment,
-        'notices': notices,
-        'weekly_contents': weekly_contents,
-        'assignments': assignments,
-        'submitted_ids': list(my_submissions),
-        'questions': questions,  # 👈 추가
+        **snapshot,
     }
     return render(request, 'classroom/course_room.html', context)
 
@@ -749,9 +591,18 @@ def weekly_content_create_view(request, course_id):
         if form.is_valid():
             content = form.save(commit=False)
             content.course = course
-            content.save()
-            messages.success(request, '주차별 자료가 등록되었습니다.')
-            return redirect('classroom:my_course_detail', course_id=course_id)
+            try:
+                if request.POST.get('upload_id'):
+                    # 문자열로 넣어야 폼에서 같이 올라온 파일(아직 저장 전)이 이 이름으로 저장되지 않음
+                    content.file = uploads.claim(
+                        request.POST['upload_id'], request.user, 'weekly_content', course.course_id
+                    )
+            except uploads.UploadError as e:
+                messages.error(request, str(e))
+            else:
+                content.save()
+                messages.success(request, '주차별 자료가 등록되었습니다.')
+                return redirect('classroom:my_course_detail', course_id=course_id)
     else:
         form = WeeklyContentForm()
 
@@ -774,11 +625,22 @@ def weekly_content_update_view(request, content_id):
         return redirect('classroom:my_course_detail', course_id=course.course_id)
 
     if request.method == 'POST':
+        old_file = content.file.name  # 자료 파일을 바꾸면 이전 파일 정리
         form = WeeklyContentForm(request.POST, request.FILES, instance=content)
         if form.is_valid():
-            form.save()
-            messages.success(request, '주차별 자료가 수정되었습니다.')
-            return redirect('classroom:my_course_detail', course_id=course.course_id)
+            content = form.save(commit=False)
+            try:
+                if request.POST.get('upload_id'):
+                    content.file = uploads.claim(
+                        request.POST['upload_id'], request.user, 'weekly_content', course.course_id
+                    )
+            except uploads.UploadError as e:
+                messages.error(request, str(e))
+            else:
+                content.save()
+                uploads.release_replaced(content.file, old_file)
+                messages.success(request, '주차별 자료가 수정되었습니다.')
+                return redirect('classroom:my_course_detail', course_id=course.course_id)
     else:
         form = WeeklyContentForm(instance=content)
 
@@ -811,6 +673,79 @@ def submission_list_view(request, assignment_id):
     return render(request, 'classroom/submission_list.html', context)
 
 
+@login_required
+@require_POST
+def bulk_grade_view(request, assignment_id):
+    """과제 일괄 채점 (강사/관리자만)
+
+    - CSV 업로드(csv_file): email, score, feedback
+    - JSON 요청: {"grades": [{"email": ..., "score": ..., "feedback": ...}]}
+
+    한 행이라도 오류가 있으면 아무것도 저장하지 않고 행별 오류를 돌려줍니다.
+    """
+    assignment = get_object_or_404(Assignment.objects.select_related('course'), assignment_id=assignment_id)
+    course = assignment.course
+    is_json = request.content_type == 'application/json'
+
+    if request.user != course.instructor and request.user.role != 'manager':
+        if is_json:
+            return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+        messages.error(request, '권한이 없습니다.')
+        return redirect('classroom:my_course_detail', course_id=course.course_id)
+
+    try:
+        if is_json:
+            rows = grading.parse_grade_json(json.loads(request.body))
+        elif request.FILES.get('csv_file'):
+            rows = grading.parse_grade_csv(request.FILES['csv_file'])
+        else:
+            raise ValueError('CSV 파일을 선택해주세요.')
+    except (ValueError, UnicodeDecodeError) as e:
+        if is_json:
+            return JsonResponse({'error': str(e)}, status=400)
+        messages.error(request, f'파일을 읽을 수 없습니다: {e}')
+        return redirect('classroom:submission_list', assignment_id=assignment_id)
+
+    updates, errors = grading.validate_grades(assignment, rows)
+
+    if errors:
+        if is_json:
+            return JsonResponse({'updated': 0, 'errors': [e.as_dict() for e in errors]}, status=400)
+        messages.error(request, f'{len(errors)}개 행에 오류가 있어 채점을 저장하지 않았습니다.')
+        context = {
+            'assignment': assignment,
+            'course': course,
+            'submissions': Submission.objects.filter(assignment=assignment).select_related('student').order_by('-submitted_at'),
+            'grade_errors': errors,
+        }
+        return render(request, 'classroom/submission_list.html', context)
+
+    updated = grading.apply_grades(updates)
+    # 일괄 UPDATE는 post_save 시그널을 보내지 않으므로 강의실 스냅샷을 직접 무효화
+    course_room.invalidate(course.course_id)
+
+    if is_json:
+        return JsonResponse({'updated': updated, 'errors': []})
+    messages.success(request, f'{updated}명의 채점이 저장되었습니다.')
+    return redirect('classroom:submission_list', assignment_id=assignment_id)
+
+
+@login_required
+def gradebook_export_view(request, course_id):
+    """강의 성적부 CSV 다운로드 (강사/관리자만) - 파일 전체를 메모리에 만들지 않고 한 줄씩 전송"""
+    course = get_object_or_404(Course, course_id=course_id)
+
+    if request.user != course.instructor and request.user.role != 'manager':
+        messages.error(request, '권한이 없습니다.')
+        return redirect('classroom:my_course_detail', course_id=course.course_id)
+
+    gradebook = Gradebook.build(course)
+    filename = f'gradebook_{course.course_id}_{timezone.localdate():%Y%m%d}.csv'
+    response = StreamingHttpResponse(iter_csv(gradebook), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 @login_required
 def submission_feedback_view(request, submission_id):
     """단일 제출물에 점수/피드백 남기기 (강사/관리자만)"""
@@ -852,3 +787,129 @@ def weekly_content_detail_view(request, content_id):
         'enrollment': enrollment,
     }
     return render(request, 'classroom/weekly_content_detail.html', context)
+
+
+# ---------- 분할 업로드 (과제 제출 파일 / 주차별 자료) ----------
+
+def _upload_error_response(error):
+    data = {'error': str(error)}
+    if error.upload is not None:
+        data.update(uploads.as_dict(error.upload))
+    return JsonResponse(data, status=error.status)
+
+
+@login_required
+@require_POST
+def upload_start_view(request):
+    """분할 업로드 시작/재개
+
+    요청: {"purpose": "submission" | "weekly_content", "target_id": 과제 ID 또는 강의 ID,
+           "filename": ..., "size": 바이트 수, "sha256": 전체 파일 체크섬(선택)}
+    응답: {"upload_id", "offset", ...} - offset부터 조각을 보내면 됨
+    """
+    try:
+        data = json.loads(request.body)
+        purpose = data.get('purpose')
+        target_id = int(data.get('target_id'))
+        total_size = int(data.get('size'))
+    except (ValueError, TypeError, AttributeError):
+        return JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+
+    # 권한 체크 - 제출은 수강생, 주차별 자료는 강사/관리자
+    if purpose == 'submission':
+        assignment = get_object_or_404(Assignment, assignment_id=target_id)
+        allowed = Enrollment.objects.filter(student=request.user, course_id=assignment.course_id).exists()
+    elif purpose == 'weekly_content':
+        course = get_object_or_404(Course, course_id=target_id)
+        allowed = request.user == course.instructor or request.user.role == 'manager'
+    else:
+        allowed = False
+    if not allowed:
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+
+    try:
+        upload = uploads.start(
+            request.user, purpose, target_id, data.get('filename', ''), total_size, data.get('sha256', '')
+        )
+    except uploads.UploadError as e:
+        return _upload_error_response(e)
+    return JsonResponse(uploads.as_dict(upload))
+
+
+@login_required
+def upload_chunk_view(request, upload_id):
+    """조각 전송 (PUT/POST, 본문 = 파일 바이트)
+
+    헤더: X-Upload-Offset(이 조각의 시작 위치), X-Chunk-SHA256(선택)
+    GET으로 부르면 현재 받은 위치만 알려줌 - 끊긴 업로드를 이어서 보낼 때 사용
+    """
+    if request.method == 'GET':
+        upload = get_object_or_404(ChunkedUpload, upload_id=upload_id, user=request.user)
+        return JsonResponse(uploads.as_dict(upload))
+    if request.method not in ('PUT', 'POST'):
+        return JsonResponse({'error': '허용되지 않는 요청입니다.'}, status=405)
+
+    try:
+        offset = int(request.headers.get('X-Upload-Offset', ''))
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return JsonResponse({'error': 'X-Upload-Offset 헤더가 필요합니다.'}, status=400)
+
+    try:
+        # request를 파일처럼 읽어 조각을 임시 파일로 받은 뒤 (행 잠금 없이) 최종 파일에 씀
+        upload = uploads.write_chunk(
+            upload_id, request.user, offset, request, length, request.headers.get('X-Chunk-SHA256', '')
+        )
+    except uploads.UploadError as e:
+        return _upload_error_response(e)
+    return JsonResponse(uploads.as_dict(upload))
+
+
+@login_required
+@require_POST
+def upload_complete_view(request, upload_id):
+    """모든 조각 전송 후 호출 - 크기/체크섬 확인"""
+    try:
+        upload = uploads.complete(upload_id, request.user)
+    except uploads.UploadError as e:
+        return _upload_error_response(e)
+    return JsonResponse(uploads.as_dict(upload))
+
+
+# ---------- 보호된 파일 다운로드 (주차별 자료 / 과제 첨부 / 제출 파일) ----------
+
+def _can_access_course(user, course):
+    """강사/관리자이거나 수강생이면 True - 수강 여부는 쿼리 1번"""
+    if user == course.instructor or user.role == 'manager':
+        return True
+    return Enrollment.objects.filter(student=user, course=course).exists()
+
+
+@login_required
+def weekly_content_file_view(request, content_id):
+    """주차별 자료 파일 (수강생/강사만) - PDF/동영상은 Range 요청으로 필요한 부분만 전송"""
+    content = get_object_or_404(WeeklyContent.objects.select_related('course'), content_id=content_id)
+    if not _can_access_course(request.user, content.course):
+        raise Http404('파일을 찾을 수 없습니다.')
+    return downloads.serve(request, content.file)
+
+
+@login_required
+def assignment_attachment_view(request, assignment_id):
+    """과제 첨부 파일 (수강생/강사만)"""
+    assignment = get_object_or_404(Assignment.objects.select_related('course'), assignment_id=assignment_id)
+    if not _can_access_course(request.user, assignment.course):
+        raise Http404('파일을 찾을 수 없습니다.')
+    return downloads.serve(request, assignment.attachment)
+
+
+@login_required
+def submission_file_view(request, submission_id):
+    """제출 파일 (제출한 학생 본인/강사/관리자만)"""
+    submission = get_object_or_404(
+        Submission.objects.select_related('assignment__course'), submission_id=submission_id
+    )
+    course = submission.assignment.course
+    if request.user != submission.student and request.user != course.instructor and request.user.role != 'manager':
+        raise Http404('파일을 찾을 수 없습니다.')
+    return downloads.serve(request, submission.file, as_attachment=True)
@@ -0,0 +1,12 @@
+# core/asyncviews.py
+
+
+async def resolve_user(request):
+    """async 뷰 시작 시 호출 - request.user를 실제 사용자 객체로 바꿔 둠
+
+    request.user는 처음 접근할 때 DB를 조회하는 지연 객체라서, 그대로 두면
+    템플릿(header의 user.is_authenticated 등)을 그리는 중에 이벤트 루프에서 동기 조회가 일어납니다.
+    auser()로 미리 읽어 두면 세션/사용자 조회가 async로 끝나고 템플릿은 DB를 건드리지 않습니다.
+    """
+    request.user = await request.auser()
+    return request.user
@@ -0,0 +1,22 @@
+# core/cache.py
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def is_shared():
+    """기본 캐시를 모든 프로세스가 같이 보는지 (Redis 등) - 프로세스별 LocMem이면 False"""
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache)
+
+
+def bounded_timeout(timeout):
+    """무효화에 의존하는 캐시 항목의 timeout
+
+    공유 캐시가 아니면 다른 프로세스(웹 워커 / daphne)에서 한 무효화가 전달되지 않으므로
+    LOCAL_CACHE_TIMEOUT초 안에 다시 계산되도록 줄입니다. (timeout=None, 만료 없음도 제한)
+    """
+    if is_shared():
+        return timeout
+    local = getattr(settings, 'LOCAL_CACHE_TIMEOUT', 15)
+    return local if timeout is None else min(timeout, local)
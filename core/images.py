@@ -0,0 +1,150 @@
+# core/images.py
+
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+
+logger = logging.getLogger(__name__)
+
+VARIANT_DIR = 'variants'
+FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpg': ('JPEG', 'image/jpeg'),
+}
+
+
+def widths():
+    return sorted(getattr(settings, 'IMAGE_VARIANT_WIDTHS', [160, 320, 640, 1280]))
+
+
+def quality():
+    return getattr(settings, 'IMAGE_VARIANT_QUALITY', 80)
+
+
+def variant_name(name, width, ext):
+    """원본 이름으로 정해지는 변환본 이름 - course_images/a.png → variants/course_images/a_320w.webp"""
+    stem, _ = os.path.splitext(name)
+    return f'{VARIANT_DIR}/{stem}_{width}w.{ext}'
+
+
+# 변환본이 있는 것으로 확인된 원본 이름 (프로세스별) - 렌더링할 때마다 파일시스템을 확인하지 않도록
+# 있다는 결과만 기록 (없으면 다른 프로세스가 곧 만들 수 있으므로 다음 렌더링 때 다시 확인)
+# 업로드 이름은 겹치지 않게 정해지므로(get_available_name) 원본이 바뀌면 이름도 바뀜
+_known = set()
+
+
+def has_variants(name, storage=default_storage):
+    """가장 작은 변환본이 있으면 생성된 것으로 봄 (이 프로세스에서 처음 확인할 때만 stat 1번)"""
+    if name in _known:
+        return True
+    if storage.exists(variant_name(name, widths()[0], 'webp')):
+        _known.add(name)
+        return True
+    return False
+
+
+def generate_variants(name, storage=default_storage, force=False):
+    """원본 이미지 하나로 너비별 WebP/JPEG 변환본 생성 → 만든 파일 수
+
+    - 원본은 한 번만 열고, 큰 너비부터 줄여 가며 이전 결과를 다음 축소의 입력으로 사용
+    - JPEG 원본은 draft()로 필요한 크기 근처까지만 디코딩
+    - 원본보다 큰 너비는 확대하지 않고 원본 크기로 저장 (srcset 이름이 항상 모두 존재하도록)
+    """
+    if not force and has_variants(name, storage):
+        return 0
+
+    with storage.open(name, 'rb') as f:
+        image = Image.open(f)
+        image.draft('RGB', (widths()[-1], widths()[-1]))
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() or image.mode == 'P' else 'RGB')
+
+    created = 0
+    current = image
+    for width in reversed(widths()):
+        if current.width > width:
+            height = max(1, round(current.height * width / current.width))
+            current = current.resize((width, height), Image.LANCZOS)
+
+        for ext, (pil_format, _) in FORMATS.items():
+            target = variant_name(name, width, ext)
+            if storage.exists(target):
+                if not force:
+                    continue
+                storage.delete(target)
+
+            frame = current
+            if pil_format == 'JPEG' and frame.mode != 'RGB':
+                # JPEG는 투명도가 없으므로 흰 배경에 합성
+                background = Image.new('RGB', frame.size, (255, 255, 255))
+                background.paste(frame, mask=frame.getchannel('A'))
+                frame = background
+
+            buffer = io.BytesIO()
+            frame.save(buffer, pil_format, quality=quality(), optimize=pil_format == 'JPEG', method=4)
+            storage.save(target, ContentFile(buffer.getvalue()))
+            created += 1
+    _known.add(name)
+    return created
+
+
+def delete_variants(name, storage=default_storage):
+    """원본이 다른 이미지로 바뀌었을 때 이전 원본의 변환본 삭제"""
+    _known.discard(name)
+    for width in widths():
+        for ext in FORMATS:
+            storage.delete(variant_name(name, width, ext))
+
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    # 첫 업로드 때 만듦 (fork된 워커에서는 새로 만듦 - core/view_counter.py와 같은 방식)
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='image-variants')
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def refresh_variants(name, storage=default_storage, old_name=None):
+    """원본 변경 처리 - 이전 원본의 변환본 삭제 + 새 원본 변환본 생성 (실패는 로그만 남김)"""
+    try:
+        if old_name:
+            delete_variants(old_name, storage)
+        if name:
+            generate_variants(name, storage)
+    except Exception:
+        # 이미지가 깨졌어도 저장 자체는 막지 않음 - 템플릿은 원본으로 표시
+        logger.exception("이미지 변환 실패 (%s)", name)
+    finally:
+        close_old_connections()
+
+
+def schedule_refresh(name, storage=default_storage, old_name=None):
+    """refresh_variants를 요청 스레드가 아닌 백그라운드 스레드에서 (IMAGE_VARIANT_BACKGROUND=False면 바로)"""
+    if getattr(settings, 'IMAGE_VARIANT_BACKGROUND', True):
+        _get_executor().submit(refresh_variants, name, storage, old_name)
+    else:
+        refresh_variants(name, storage, old_name)
+
+
+def srcset(name, ext='webp', storage=default_storage):
+    """'url 160w, url 320w, ...' 형식의 srcset 문자열"""
+    return ', '.join(f'{storage.url(variant_name(name, width, ext))} {width}w' for width in widths())
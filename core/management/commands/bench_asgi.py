@@ -0,0 +1,133 @@
+import asyncio
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.test import Client
+from django.urls import reverse
+
+from classroom.models import Enrollment
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = '홈/강의 목록/공지 목록/대시보드를 ASGI와 WSGI로 같은 동시성으로 호출해 처리량과 지연을 비교합니다. (현재 DB 데이터 사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=400, help='방식별 총 요청 수')
+        parser.add_argument('--concurrency', type=int, default=20, help='동시 요청 수 (WSGI는 스레드 수)')
+        parser.add_argument('--email', help='대시보드를 요청할 사용자 (기본: 수강 중인 첫 학생)')
+
+    def handle(self, *args, **options):
+        if options['email']:
+            enrollment = Enrollment.objects.filter(student__email=options['email']).select_related('student').first()
+        else:
+            enrollment = Enrollment.objects.filter(is_completed=False).select_related('student').first()
+        if enrollment is None:
+            raise CommandError('수강 중인 학생이 없습니다. 데이터를 먼저 만들어 주세요.')
+
+        # 로그인 세션 쿠키 하나를 모든 요청에 사용
+        client = Client()
+        client.force_login(enrollment.student)
+        cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+
+        paths = [
+            reverse('index'),
+            reverse('course:course_list'),
+            reverse('board:notice_list'),
+            reverse('classroom:my_classroom'),
+        ]
+        host = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+        jobs = [paths[i % len(paths)] for i in range(options['requests'])]
+
+        self.stdout.write(
+            f"요청 {len(jobs)}개 (경로 {len(paths)}개 순환), 동시성 {options['concurrency']}, 사용자 {enrollment.student.email}"
+        )
+        for label, runner in (('WSGI', self.run_wsgi), ('ASGI', self.run_asgi)):
+            runner(jobs, options['concurrency'], host, cookie)  # 워밍업 (캐시/연결)
+            elapsed, latencies, errors = runner(jobs, options['concurrency'], host, cookie)
+            self.stdout.write(
+                f"{label}: {len(jobs) / elapsed:8.1f} req/s  "
+                f"p50 {_percentile(latencies, 50) * 1000:6.1f}ms  "
+                f"p95 {_percentile(latencies, 95) * 1000:6.1f}ms  "
+                f"p99 {_percentile(latencies, 99) * 1000:6.1f}ms  "
+                f"오류 {errors}"
+            )
+
+    def run_wsgi(self, jobs, concurrency, host, cookie):
+        """WSGI 핸들러를 스레드 풀에서 호출 (gunicorn --threads와 같은 구조)"""
+        application = get_wsgi_application()
+
+        def call(path):
+            status = []
+            environ = {
+                'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SCRIPT_NAME': '',
+                'SERVER_NAME': host, 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+                'HTTP_HOST': host, 'HTTP_COOKIE': cookie,
+                'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr,
+                'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+                'wsgi.version': (1, 0),
+            }
+            started = time.perf_counter()
+            body = application(environ, lambda s, headers, exc_info=None: status.append(s))
+            try:
+                for _ in body:
+                    pass
+            finally:
+                body.close()
+            return time.perf_counter() - started, status[0].startswith('200')
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(call, jobs))
+        elapsed = time.perf_counter() - started
+        return elapsed, [r[0] for r in results], sum(1 for r in results if not r[1])
+
+    def run_asgi(self, jobs, concurrency, host, cookie):
+        """DoroDB.asgi.application(ProtocolTypeRouter)을 이벤트 루프 하나에서 동시에 호출"""
+        from DoroDB.asgi import application
+
+        async def call(path, semaphore):
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+                'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+                'query_string': b'', 'root_path': '',
+                'headers': [(b'host', host.encode()), (b'cookie', cookie.encode())],
+                'client': ('127.0.0.1', 50000), 'server': (host, 80),
+            }
+            status = []
+            body_sent = False
+
+            async def receive():
+                nonlocal body_sent
+                if body_sent:
+                    # 본문 이후에는 연결 끊김 대기 - 응답이 끝나면 Django가 취소함
+                    await asyncio.Future()
+                body_sent = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    status.append(message['status'])
+
+            async with semaphore:
+                started = time.perf_counter()
+                await application(scope, receive, send)
+                return time.perf_counter() - started, status[0] == 200
+
+        async def run():
+            semaphore = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*(call(path, semaphore) for path in jobs))
+
+        started = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - started
+        return elapsed, [r[0] for r in results], sum(1 for r in results if not r[1])
@@ -0,0 +1,51 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.management.base import BaseCommand
+
+from course.models import Course
+from user.models import User
+from core import images
+
+
+def _build(name, force):
+    """작업 프로세스에서 실행 - 실패해도 전체 작업은 계속"""
+    try:
+        return name, images.generate_variants(name, force=force), None
+    except (OSError, ValueError) as e:
+        return name, 0, str(e)
+
+
+class Command(BaseCommand):
+    help = '기존 강의 썸네일/프로필 사진의 WebP/JPEG 변환본을 프로세스 풀로 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='작업 프로세스 수')
+        parser.add_argument('--force', action='store_true', help='이미 있는 변환본도 다시 생성')
+
+    def handle(self, *args, **options):
+        names = sorted(
+            set(Course.objects.exclude(image='').exclude(image__isnull=True).values_list('image', flat=True))
+            | set(User.objects.exclude(profile_image='').exclude(profile_image__isnull=True)
+                  .values_list('profile_image', flat=True))
+        )
+        self.stdout.write(f"이미지 {len(names)}개, 작업 프로세스 {options['workers']}개")
+
+        started = time.perf_counter()
+        created = failed = 0
+        # spawn 방식(macOS/Windows)에서도 동작하도록 작업 프로세스마다 django.setup()
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=django.setup) as pool:
+            futures = [pool.submit(_build, name, options['force']) for name in names]
+            for future in as_completed(futures):
+                name, count, error = future.result()
+                if error:
+                    failed += 1
+                    self.stderr.write(f"⚠️ {name}: {error}")
+                created += count
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 변환본 {created}개 생성, 실패 {failed}개 ({elapsed:.1f}초)"
+        ))
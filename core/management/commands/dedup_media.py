@@ -0,0 +1,61 @@
+import os
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+from core.storage import BLOB_DIR, DeduplicatedFileSystemStorage, file_sha256
+
+
+class Command(BaseCommand):
+    help = 'MEDIA_ROOT의 기존 업로드 파일을 내용 해시 기준으로 중복 제거합니다. (파일을 하나씩 스트리밍으로 처리)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='변경 없이 줄일 수 있는 용량만 계산')
+        parser.add_argument('--gc', action='store_true', help='어떤 파일도 가리키지 않는 blob 삭제')
+
+    def handle(self, *args, **options):
+        storage = default_storage
+        if not isinstance(storage, DeduplicatedFileSystemStorage):
+            raise CommandError('STORAGES["default"]가 core.storage.DeduplicatedFileSystemStorage가 아닙니다.')
+
+        if options['gc']:
+            removed = 0
+            for blob_path in storage.orphan_blobs():
+                if options['dry_run'] or storage.collect_blob(blob_path):
+                    removed += 1
+            self.stdout.write(self.style.SUCCESS(f"✅ 참조 없는 blob {removed}개 삭제"))
+            return
+
+        files = saved = 0
+        seen = {}  # dry-run용: 해시 → 처음 본 파일 (실제 실행에서는 blob이 그 역할)
+        for name in self.iter_names(storage.location):
+            files += 1
+            try:
+                if options['dry_run']:
+                    path = storage.path(name)
+                    if os.stat(path).st_nlink > 1:
+                        continue
+                    digest = file_sha256(path)
+                    if digest in seen or os.path.exists(storage.path(storage.blob_name(digest))):
+                        saved += os.path.getsize(path)
+                    seen.setdefault(digest, name)
+                else:
+                    saved += storage.adopt(name)
+            except OSError as e:
+                self.stderr.write(f"⚠️ {name}: {e}")
+
+            if files % 1000 == 0:
+                self.stdout.write(f"... {files}개 처리 ({saved / 1024 ** 2:.1f} MB 절약)")
+
+        verb = '절약 가능' if options['dry_run'] else '절약'
+        self.stdout.write(self.style.SUCCESS(f"✅ 파일 {files}개 검사, {saved / 1024 ** 2:.1f} MB {verb}"))
+
+    def iter_names(self, root):
+        """MEDIA_ROOT 아래 파일 이름을 하나씩 돌려줌 (.blobs 와 임시 파일 제외)"""
+        for dirpath, dirnames, filenames in os.walk(root):
+            if dirpath == root:
+                dirnames[:] = [d for d in dirnames if d != BLOB_DIR]
+            for filename in filenames:
+                if filename.startswith('.') or filename.endswith('.dedup-tmp'):
+                    continue
+                yield os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, '/')
@@ -0,0 +1,52 @@
+# core/signals.py
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from course.models import Course
+from user.models import User
+from . import images
+
+
+IMAGE_FIELDS = {Course: 'image', User: 'profile_image'}
+
+
+@receiver(pre_save, sender=Course)
+@receiver(pre_save, sender=User)
+def remember_image_name(sender, instance, update_fields=None, **kwargs):
+    """이미지가 바뀌는지 확인하려고 저장 전 이름을 기억 (이미지가 없는 update_fields 저장은 건너뜀)"""
+    field_name = IMAGE_FIELDS[sender]
+    instance._previous_image_name = None
+    if instance.pk is None or (update_fields is not None and field_name not in update_fields):
+        return
+    instance._previous_image_name = (
+        sender._default_manager.filter(pk=instance.pk).values_list(field_name, flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=User)
+def build_image_variants(sender, instance, update_fields=None, **kwargs):
+    """강의 썸네일 / 프로필 사진이 올라오면 WebP/JPEG 변환본 생성, 바뀐 이미지의 이전 변환본은 삭제
+
+    Pillow 변환은 요청 스레드에서 하지 않고 커밋 후 백그라운드 스레드에서 (images.schedule_refresh)
+    """
+    field_name = IMAGE_FIELDS[sender]
+    if update_fields is not None and field_name not in update_fields:
+        return
+
+    fieldfile = getattr(instance, field_name)
+    name = fieldfile.name or None
+    old_name = getattr(instance, '_previous_image_name', None) or None
+    instance._previous_image_name = None
+    if old_name == name:
+        old_name = None
+        if not name or images.has_variants(name, fieldfile.storage):
+            return  # 이미지 그대로, 변환본도 있음
+    elif old_name and sender._default_manager.filter(**{field_name: old_name}).exists():
+        old_name = None  # 같은 원본을 다른 행이 아직 쓰고 있음 - 변환본 유지
+
+    transaction.on_commit(partial(images.schedule_refresh, name, fieldfile.storage, old_name))
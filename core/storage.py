@@ -0,0 +1,212 @@
+# core/storage.py
+
+import hashlib
+import os
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+
+BLOB_DIR = '.blobs'
+HASH_BLOCK = 1024 * 1024
+DIGEST_XATTR = 'user.sha256'
+
+
+def file_sha256(path):
+    """파일을 1MB씩 읽어서 SHA-256 계산 (큰 파일도 메모리 사용 일정)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _set_digest(path, sha256):
+    """blob inode에 해시를 기록 - 하드링크는 inode를 공유하므로 어떤 이름으로도 읽을 수 있음"""
+    try:
+        os.setxattr(path, DIGEST_XATTR, sha256.encode())
+    except (AttributeError, OSError):
+        pass  # xattr 미지원 (Windows/macOS, 일부 파일시스템) - 삭제 시 해시 계산으로 대체
+
+
+def _get_digest(path):
+    try:
+        return os.getxattr(path, DIGEST_XATTR).decode()
+    except (AttributeError, OSError):
+        return None
+
+
+class DeduplicatedFileSystemStorage(FileSystemStorage):
+    """내용 해시 기반 중복 제거 저장소
+
+    실제 내용은 MEDIA_ROOT/.blobs/ab/cd/<sha256> 에 한 번만 저장하고,
+    FileField가 쓰는 이름(upload_to 경로)은 그 blob에 대한 하드링크로 만듭니다.
+
+    - FileField API(name, url, path, open, size)는 그대로 - 이름은 기존과 같은 경로
+    - 참조 수 = blob의 링크 수 - 1 (파일시스템이 관리하므로 별도 테이블 없음)
+    - delete(name)은 링크만 지우고, 마지막 참조가 사라지면 blob도 삭제
+      (blob 위치는 inode의 user.sha256 xattr로 찾음 - 없을 때만 해시 계산)
+    - 참조 없는 blob 삭제는 먼저 .gc- 이름으로 rename해서 가져간 뒤 링크 수를 다시 확인
+      → 그 사이 _save/adopt가 링크를 걸었으면 되돌려 놓음 (collect_blob)
+    - 하드링크를 지원하지 않는 파일시스템이면 일반 파일로 저장 (중복 제거만 안 됨)
+    """
+
+    def blob_name(self, sha256):
+        return os.path.join(BLOB_DIR, sha256[:2], sha256[2:4], sha256)
+
+    def ref_count(self, name):
+        """이 파일의 내용을 가리키는 FileField 이름 수 (blob 자신은 제외)"""
+        try:
+            return os.stat(self.path(name)).st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def _save(self, name, content):
+        full_path = self.path(name)
+        blob_root = self.path(BLOB_DIR)
+        os.makedirs(blob_root, exist_ok=True)
+
+        # 1) 내용을 blob 임시 파일로 받으면서 해시 계산 (한 번만 읽음)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=blob_root, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    tmp.write(chunk)
+            if self.file_permissions_mode is not None:
+                os.chmod(tmp_path, self.file_permissions_mode)
+            _set_digest(tmp_path, digest.hexdigest())
+
+            # 2) FileField 이름을 blob에 하드링크
+            #    blob이 없으면(처음 보는 내용, 또는 gc가 방금 가져감) 임시 파일을 blob으로 등록하고 다시 시도
+            #    → 임시 파일은 이름이 연결될 때까지 남겨 둠
+            blob_path = self.path(self.blob_name(digest.hexdigest()))
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            while True:
+                try:
+                    os.link(blob_path, full_path)
+                    break
+                except FileExistsError:
+                    # 이름이 겹침 - 새 이름으로 다시 시도
+                    name = self.get_available_name(name)
+                    full_path = self.path(name)
+                except FileNotFoundError:
+                    os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    try:
+                        os.link(tmp_path, blob_path)
+                        continue
+                    except FileExistsError:
+                        continue  # 다른 요청이 같은 내용을 먼저 등록함
+                    except OSError:
+                        pass
+                except OSError:
+                    pass
+                # 하드링크 불가 (다른 파일시스템 등) - 복사본으로 저장
+                with open(tmp_path, 'rb') as src:
+                    return super()._save(name, File(src))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return str(name).replace('\\', '/')
+
+    def adopt(self, name, sha256=None):
+        """저장소를 거치지 않고 직접 쓴 파일(분할 업로드, 기존 MEDIA_ROOT 파일)을 blob에 등록
+
+        같은 내용의 blob이 이미 있으면 이 파일을 blob 링크로 바꿔서 중복을 없앱니다.
+        반환값: 줄어든 바이트 수
+        """
+        path = self.path(name)
+        stat = os.stat(path)
+        if stat.st_nlink > 1:
+            return 0  # 이미 blob에 연결된 파일
+
+        sha256 = sha256 or file_sha256(path)
+        blob_path = self.path(self.blob_name(sha256))
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        tmp_path = f'{path}.dedup-tmp'
+        while True:
+            try:
+                # 처음 보는 내용 - 파일 자체를 blob으로 등록 (복사 없음)
+                os.link(path, blob_path)
+                _set_digest(path, sha256)
+                return 0
+            except FileExistsError:
+                pass
+            try:
+                os.link(blob_path, tmp_path)
+                break
+            except FileNotFoundError:
+                continue  # 그 사이 gc가 blob을 가져감 - 이 파일을 blob으로 등록
+
+        # 임시 이름으로 링크를 만든 뒤 rename으로 바꿔치기 - 중간에 파일이 사라지는 순간이 없음
+        os.replace(tmp_path, path)
+        return stat.st_size
+
+    def orphan_blobs(self):
+        """어떤 이름도 가리키지 않는 blob 경로 목록 (링크 수 1)"""
+        for root, _, files in os.walk(self.path(BLOB_DIR)):
+            for filename in files:
+                blob_path = os.path.join(root, filename)
+                if not filename.startswith('.') and os.stat(blob_path).st_nlink == 1:
+                    yield blob_path
+
+    def collect_blob(self, blob_path):
+        """참조 없는 blob 삭제 - 삭제했으면 True
+
+        확인과 삭제 사이에 _save/adopt가 링크를 걸 수 있으므로 먼저 .gc- 이름으로 rename해서
+        가져간 뒤(이후의 링크 시도는 blob이 없다고 보고 새로 등록함) 링크 수를 다시 확인합니다.
+        """
+        directory, filename = os.path.split(blob_path)
+        claimed = os.path.join(directory, f'.gc-{filename}')
+        try:
+            os.rename(blob_path, claimed)
+        except FileNotFoundError:
+            return False
+        if os.stat(claimed).st_nlink == 1:
+            os.remove(claimed)
+            return True
+
+        # 그 사이 참조가 생김 - 되돌려 놓음 (이미 새 blob이 등록됐으면 그대로 두고 임시 이름만 정리)
+        try:
+            os.link(claimed, blob_path)
+        except FileExistsError:
+            pass
+        os.remove(claimed)
+        return False
+
+    def delete(self, name):
+        """이름(링크)만 삭제 - 마지막 참조였다면 blob도 함께 삭제"""
+        if not name:
+            raise ValueError('The name must be given to delete().')
+        path = self.path(name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+
+        blob_path = None
+        if stat.st_nlink == 2:
+            # 이 이름 + blob만 남은 경우 - blob 위치는 xattr의 해시로 (예전 파일이라 없으면 해시 계산)
+            candidate = self.path(self.blob_name(_get_digest(path) or file_sha256(path)))
+            try:
+                if os.stat(candidate).st_ino == stat.st_ino:
+                    blob_path = candidate
+            except FileNotFoundError:
+                pass
+
+        super().delete(name)
+        if blob_path is not None:
+            self.collect_blob(blob_path)
+
+    def listdir(self, path):
+        directories, files = super().listdir(path)
+        if path in ('', '.'):
+            directories = [d for d in directories if d != BLOB_DIR]
+        return directories, files
+
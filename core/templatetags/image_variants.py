@@ -0,0 +1,40 @@
+from django import template
+from django.utils.html import format_html
+
+from core import images
+
+register = template.Library()
+
+
+@register.filter
+def srcset(fieldfile, ext='webp'):
+    """{{ course.image|srcset }} / {{ course.image|srcset:"jpg" }}"""
+    if not fieldfile or not images.has_variants(fieldfile.name, fieldfile.storage):
+        return ''
+    return images.srcset(fieldfile.name, ext, fieldfile.storage)
+
+
+@register.simple_tag
+def responsive_image(fieldfile, alt='', sizes='100vw', **attrs):
+    """WebP + JPEG 변환본을 고르는 <picture> 태그
+
+    {% responsive_image course.image alt=course.title sizes="220px" class="course-image" %}
+    변환본이 아직 없으면 원본 <img>로 표시합니다.
+    """
+    if not fieldfile:
+        return ''
+
+    extra = format_html(''.join(f' {key.replace("_", "-")}="{{}}"' for key in attrs), *attrs.values())
+    if not images.has_variants(fieldfile.name, fieldfile.storage):
+        return format_html('<img src="{}" alt="{}" loading="lazy"{}>', fieldfile.url, alt, extra)
+
+    storage = fieldfile.storage
+    fallback = storage.url(images.variant_name(fieldfile.name, images.widths()[len(images.widths()) // 2], 'jpg'))
+    return format_html(
+        '<picture>'
+        '<source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}" loading="lazy"{}>'
+        '</picture>',
+        images.srcset(fieldfile.name, 'webp', storage), sizes,
+        fallback, images.srcset(fieldfile.name, 'jpg', storage), sizes, alt, extra,
+    )
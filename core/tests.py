@@ -1,3 +1,178 @@
-from django.test import TestCase
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import date, time
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from classroom.models import WeeklyContent
+from course.models import Course
+from user.models import User
+from . import storage as dedup
+from .storage import DeduplicatedFileSystemStorage
+
+
+class DeduplicatedStorageTests(SimpleTestCase):
+    """내용 해시 기반 중복 제거 저장소 - 참조 수, 마지막 참조 삭제 시 blob 정리, gc 경합"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='dedup-tests-')
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.storage = DeduplicatedFileSystemStorage(location=self.root)
+
+    def blob_path(self, content):
+        return self.storage.path(self.storage.blob_name(hashlib.sha256(content).hexdigest()))
+
+    def test_same_content_shares_one_blob(self):
+        first = self.storage.save('a/first.txt', ContentFile(b'hello'))
+        second = self.storage.save('b/second.txt', ContentFile(b'hello'))
+
+        self.assertEqual(os.stat(self.storage.path(first)).st_ino, os.stat(self.blob_path(b'hello')).st_ino)
+        self.assertEqual(self.storage.ref_count(first), 2)
+        self.assertEqual(self.storage.ref_count(second), 2)
+        self.assertEqual(self.storage.ref_count('missing.txt'), 0)
+        with self.storage.open(second) as f:
+            self.assertEqual(f.read(), b'hello')
+
+    def test_name_collision_gets_a_new_name(self):
+        first = self.storage.save('a.txt', ContentFile(b'one'))
+        second = self.storage.save('a.txt', ContentFile(b'two'))
+        self.assertNotEqual(first, second)
+        with self.storage.open(first) as f:
+            self.assertEqual(f.read(), b'one')
+
+    def test_delete_keeps_blob_while_other_names_use_it(self):
+        first = self.storage.save('first.txt', ContentFile(b'hello'))
+        second = self.storage.save('second.txt', ContentFile(b'hello'))
+
+        self.storage.delete(first)
+        self.assertFalse(self.storage.exists(first))
+        self.assertTrue(os.path.exists(self.blob_path(b'hello')))
+        self.assertEqual(self.storage.ref_count(second), 1)
+
+        self.storage.delete(second)
+        self.assertFalse(os.path.exists(self.blob_path(b'hello')))
+        self.assertEqual(list(self.storage.orphan_blobs()), [])
+
+    def test_delete_finds_blob_by_xattr_without_rehashing(self):
+        name = self.storage.save('doc.txt', ContentFile(b'hello'))
+        if dedup._get_digest(self.storage.path(name)) is None:
+            self.skipTest('xattr를 지원하지 않는 파일시스템')
+
+        with mock.patch.object(dedup, 'file_sha256', side_effect=AssertionError('해시를 다시 계산함')):
+            self.storage.delete(name)
+        self.assertFalse(os.path.exists(self.blob_path(b'hello')))
+
+    def test_delete_without_xattr_falls_back_to_hashing(self):
+        with mock.patch.object(dedup, '_set_digest'):
+            name = self.storage.save('doc.txt', ContentFile(b'hello'))
+        with mock.patch.object(dedup, '_get_digest', return_value=None):
+            self.storage.delete(name)
+        self.assertFalse(os.path.exists(self.blob_path(b'hello')))
+
+    def test_collect_blob_removes_orphan(self):
+        name = self.storage.save('doc.txt', ContentFile(b'hello'))
+        os.remove(self.storage.path(name))  # 저장소를 거치지 않고 이름만 사라짐
+
+        blob = self.blob_path(b'hello')
+        self.assertEqual(list(self.storage.orphan_blobs()), [blob])
+        self.assertTrue(self.storage.collect_blob(blob))
+        self.assertFalse(os.path.exists(blob))
+        self.assertFalse(self.storage.collect_blob(blob))  # 이미 다른 gc가 가져감
+
+    def test_collect_blob_restores_blob_linked_during_claim(self):
+        name = self.storage.save('doc.txt', ContentFile(b'hello'))
+        os.remove(self.storage.path(name))
+        blob = self.blob_path(b'hello')
+        late = self.storage.path('late.txt')
+        real_rename = os.rename
+
+        def rename(src, dst):
+            # .gc- 이름으로 가져간 직후 다른 요청이 링크를 건 상황
+            real_rename(src, dst)
+            os.link(dst, late)
+
+        with mock.patch('os.rename', side_effect=rename):
+            self.assertFalse(self.storage.collect_blob(blob))
+
+        self.assertEqual(os.stat(blob).st_ino, os.stat(late).st_ino)
+        self.assertEqual(self.storage.ref_count('late.txt'), 1)
+        self.assertEqual(os.listdir(os.path.dirname(blob)), [os.path.basename(blob)])  # .gc- 임시 이름 정리됨
+
+    def test_save_after_blob_was_claimed_registers_a_new_blob(self):
+        name = self.storage.save('doc.txt', ContentFile(b'hello'))
+        os.remove(self.storage.path(name))
+        self.assertTrue(self.storage.collect_blob(self.blob_path(b'hello')))
+
+        name = self.storage.save('again.txt', ContentFile(b'hello'))
+        self.assertEqual(self.storage.ref_count(name), 1)
+        self.assertTrue(os.path.exists(self.blob_path(b'hello')))
+
+    def test_adopt_links_existing_file_to_blob(self):
+        self.storage.save('saved.txt', ContentFile(b'hello'))
+        with open(self.storage.path('copied.txt'), 'wb') as f:
+            f.write(b'hello')
+
+        self.assertEqual(self.storage.adopt('copied.txt'), len(b'hello'))
+        self.assertEqual(self.storage.ref_count('copied.txt'), 2)
+        self.assertEqual(self.storage.adopt('copied.txt'), 0)  # 이미 연결됨
+
+    def test_listdir_hides_blob_directory(self):
+        self.storage.save('doc.txt', ContentFile(b'hello'))
+        directories, files = self.storage.listdir('')
+        self.assertNotIn(dedup.BLOB_DIR, directories)
+        self.assertEqual(files, ['doc.txt'])
+
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix='core-tests-')
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ReleaseFilesTests(TestCase):
+    """행 삭제 시 파일 참조 해제 (classroom.signals.release_files) - 커밋된 뒤에만"""
+
+    @classmethod
+    def setUpTestData(cls):
+        instructor = User.objects.create_user(
+            email='storage@example.com', password='pw', name='강사', phone_number='010-0000-0031'
+        )
+        cls.course = Course.objects.create(
+            instructor=instructor, title='파이썬 기초', description='설명', weekday=0,
+            start_time=time(10), end_time=time(12), start_date=date(2026, 3, 2), end_date=date(2026, 6, 30),
+        )
+
+    def make_content(self, body=b'lecture'):
+        content = WeeklyContent(course=self.course, week_number=1, title='1주차 자료')
+        content.file.save('lecture.pdf', ContentFile(body))
+        return content
+
+    def test_file_is_released_on_commit(self):
+        content = self.make_content()
+        storage, name = content.file.storage, content.file.name
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            content.delete()
+        self.assertTrue(storage.exists(name))  # 롤백되면 행이 남으므로 파일도 그대로
+
+        for callback in callbacks:
+            callback()
+        self.assertFalse(storage.exists(name))
+
+    def test_shared_content_survives_release(self):
+        first = self.make_content()
+        second = self.make_content()
+        storage = first.file.storage
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertFalse(storage.exists(first.file.name))
+        self.assertEqual(storage.ref_count(second.file.name), 1)
+        with second.file.open('rb') as f:
+            self.assertEqual(f.read(), b'lecture')
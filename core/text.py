@@ -0,0 +1,37 @@
+# core/text.py
+
+import re
+import unicodedata
+
+
+# 검색어 끝에 붙은 조사는 떼고 검색 ("파이썬을" → "파이썬")
+# 세 글자 이상일 때만 떼서 "나이", "바다" 같은 단어가 잘리지 않게 함
+KOREAN_PARTICLES = (
+    '에서는', '으로', '에서', '에게', '까지', '부터', '이랑',
+    '을', '를', '이', '가', '은', '는', '의', '에', '도', '로', '와', '과', '랑',
+)
+
+_TOKEN_RE = re.compile(r'[\w]+', re.UNICODE)
+
+
+def normalize(text):
+    """검색용 정규화 - 전각/반각 통일, 소문자, 공백 정리"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    return ' '.join(_TOKEN_RE.findall(text))
+
+
+def strip_particle(token):
+    for particle in KOREAN_PARTICLES:
+        if len(token) >= len(particle) + 2 and token.endswith(particle):
+            return token[:-len(particle)]
+    return token
+
+
+def tokenize(query):
+    """검색어를 토큰으로 분리 (중복 제거, 순서 유지)"""
+    tokens = []
+    for token in normalize(query).split():
+        token = strip_particle(token)
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
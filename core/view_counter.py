@@ -0,0 +1,98 @@
+# core/view_counter.py
+
+import atexit
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """조회수 버퍼 (Notice, CommunityPost, Course 공용)
+
+    조회할 때마다 obj.save() 하지 않고 메모리에 모아 두었다가,
+    일정 시간이 지나거나 일정 개수가 쌓이면 F() UPDATE로 한 번에 반영합니다.
+    update()를 쓰기 때문에 updated_at(auto_now)은 바뀌지 않습니다.
+
+    - 반영은 요청 스레드가 아니라 백그라운드 스레드가 N초마다 (또는 항목이 M개 쌓이면 바로) 합니다.
+      요청이 없어도 주기적으로 반영되므로 프로세스가 강제 종료(SIGKILL)돼도 잃는 조회수는 최대 N초 분량입니다.
+    - 반영에 실패한 증가량은 버리지 않고 다시 합쳐 두었다가 다음 주기에 함께 반영합니다.
+    - 정상 종료 시에는 atexit에서 남은 조회수를 반영합니다.
+    """
+
+    def __init__(self, interval=None, max_pending=None):
+        self.interval = interval or getattr(settings, 'VIEW_COUNT_FLUSH_INTERVAL', 10)
+        self.max_pending = max_pending or getattr(settings, 'VIEW_COUNT_MAX_PENDING', 500)
+        self.pending = Counter()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pid = None  # 백그라운드 스레드를 띄운 프로세스 (fork된 워커에서는 새로 띄움)
+
+    def hit(self, obj, field):
+        """조회수 1 증가 (화면에 보여줄 obj 값도 같이 올려줌)"""
+        setattr(obj, field, getattr(obj, field) + 1)
+
+        with self._lock:
+            self.pending[(type(obj), field, obj.pk)] += 1
+            full = len(self.pending) >= self.max_pending
+
+        self._ensure_worker()
+        if full:
+            self._wake.set()
+
+    def _ensure_worker(self):
+        # 첫 조회 때 띄움 (import만 하는 manage.py 명령에서는 스레드를 만들지 않음)
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+        threading.Thread(target=self._run, name='view-counter', daemon=True).start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+    def flush(self):
+        """모아 둔 조회수를 DB에 반영 - (모델, 필드, 증가량)이 같은 행은 UPDATE 한 번으로 처리"""
+        with self._lock:
+            pending, self.pending = self.pending, Counter()
+
+        if not pending:
+            return 0
+
+        groups = defaultdict(list)
+        for (model, field, pk), count in pending.items():
+            groups[(model, field, count)].append(pk)
+
+        try:
+            with transaction.atomic():
+                for (model, field, count), pks in groups.items():
+                    model.objects.filter(pk__in=pks).update(**{field: F(field) + count})
+        except Exception:
+            # 실패하면 그 사이 들어온 조회수와 합쳐 두었다가 다음 flush 때 다시 시도
+            logger.exception("조회수 %d건 반영 실패 - 다음 주기에 다시 시도합니다", sum(pending.values()))
+            with self._lock:
+                self.pending.update(pending)
+            return 0
+        return sum(pending.values())
+
+
+view_counter = ViewCounter()
+
+# 프로세스 종료 시 남은 조회수 반영
+atexit.register(view_counter.flush)
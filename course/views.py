@@ -6,10 +6,14 @@ from django.contrib import messages
 from .models import Course
 from .forms import CourseForm
 from classroom.models import Enrollment
+from classroom.schedule import aconflicts_for_student
+from core.asyncviews import resolve_user
+from core.view_counter import view_counter
 
 
-def course_list_view(request):
-    """강의 목록 (기간 유효한 강의만)"""
+async def course_list_view(request):
+    """강의 목록 (기간 유효한 강의만, async 뷰)"""
+    user = await resolve_user(request)
     category = request.GET.get('category', '')
 
     courses = Course.active_courses.select_related('instructor')
@@ -17,7 +21,13 @@ def course_list_view(request):
     if category:
         courses = courses.filter(category=category)
 
-    courses = courses.order_by('-created_at')
+    courses = [course async for course in courses.order_by('-created_at')]
+
+    # 내 시간표와 겹치는 강의 표시 (수강 중인 강의로 인덱스를 만들어 한 번에 검사)
+    if user.is_authenticated:
+        conflicts = await aconflicts_for_student(user, courses)
+        for course in courses:
+            course.conflict = conflicts.get(course.course_id)
 
     context = {
         'courses': courses,
@@ -30,8 +40,7 @@ def course_detail_view(request, course_id):
     """강의 상세"""
     course = get_object_or_404(Course, course_id=course_id, is_active=True)
 
-    course.views += 1
-    course.save()
+    view_counter.hit(course, 'views')
 
     is_enrolled = False
     if request.user.is_authenticated:
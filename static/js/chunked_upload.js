@@ -0,0 +1,118 @@
+// static/js/chunked_upload.js
+// 큰 파일을 조각으로 나눠 업로드 - 끊기면 서버가 받은 위치부터 이어서 보냄
+//
+// 사용: <form data-chunked-upload data-purpose="submission" data-target-id="3"
+//             data-start-url="/classroom/upload/"> 안의 <input type="file" name="file">
+// 폼 제출 시 파일을 먼저 분할 업로드하고, 파일 입력 대신 upload_id만 함께 제출합니다.
+
+(function () {
+  const CHUNK_SIZE = 4 * 1024 * 1024;
+  const MAX_RETRIES = 5;
+
+  function csrfToken(form) {
+    const input = form.querySelector('input[name="csrfmiddlewaretoken"]');
+    return input ? input.value : '';
+  }
+
+  async function sha256Hex(blob) {
+    if (!window.crypto || !window.crypto.subtle) return '';  // https가 아니면 조각 체크섬 생략
+    const hash = await crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+    return Array.from(new Uint8Array(hash)).map(b => b.toString(16).padStart(2, '0')).join('');
+  }
+
+  async function request(url, options) {
+    const response = await fetch(url, Object.assign({ credentials: 'same-origin' }, options));
+    const data = await response.json().catch(() => ({}));
+    return { ok: response.ok, status: response.status, data: data };
+  }
+
+  async function uploadFile(form, file, onProgress) {
+    const token = csrfToken(form);
+    const start = await request(form.dataset.startUrl, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', 'X-CSRFToken': token },
+      body: JSON.stringify({
+        purpose: form.dataset.purpose,
+        target_id: form.dataset.targetId,
+        filename: file.name,
+        size: file.size,
+      }),
+    });
+    if (!start.ok) throw new Error(start.data.error || '업로드를 시작할 수 없습니다.');
+
+    const chunkUrl = form.dataset.startUrl + start.data.upload_id + '/';
+    let offset = start.data.offset;  // 이전에 끊긴 업로드면 0이 아님
+    let retries = 0;
+
+    while (offset < file.size) {
+      onProgress(offset / file.size);
+      const chunk = file.slice(offset, offset + CHUNK_SIZE);
+      let result;
+      try {
+        result = await request(chunkUrl, {
+          method: 'PUT',
+          headers: {
+            'X-CSRFToken': token,
+            'X-Upload-Offset': String(offset),
+            'X-Chunk-SHA256': await sha256Hex(chunk),
+          },
+          body: chunk,
+        });
+      } catch (e) {
+        result = { ok: false, status: 0, data: {} };  // 네트워크 오류
+      }
+
+      if (result.ok) {
+        offset = result.data.offset;
+        retries = 0;
+        continue;
+      }
+      if (++retries > MAX_RETRIES) throw new Error(result.data.error || '업로드가 중단되었습니다.');
+
+      // 위치가 어긋났거나 끊긴 경우 서버가 받은 위치를 다시 확인하고 이어서 보냄
+      await new Promise(resolve => setTimeout(resolve, 1000 * retries));
+      const status = await request(chunkUrl, { method: 'GET' }).catch(() => null);
+      if (status && status.ok) offset = status.data.offset;
+    }
+
+    const done = await request(chunkUrl + 'complete/', {
+      method: 'POST',
+      headers: { 'X-CSRFToken': token },
+    });
+    if (!done.ok) throw new Error(done.data.error || '업로드를 완료할 수 없습니다.');
+    onProgress(1);
+    return start.data.upload_id;
+  }
+
+  document.querySelectorAll('form[data-chunked-upload]').forEach(function (form) {
+    const fileInput = form.querySelector('input[type="file"]');
+    const progress = form.querySelector('.upload-progress');
+    if (!fileInput) return;
+
+    form.addEventListener('submit', async function (event) {
+      const file = fileInput.files[0];
+      if (!file || form.dataset.uploaded) return;  // 파일이 없으면 일반 제출
+      event.preventDefault();
+
+      const buttons = form.querySelectorAll('button[type="submit"]');
+      buttons.forEach(b => b.disabled = true);
+      try {
+        const uploadId = await uploadFile(form, file, function (ratio) {
+          if (progress) progress.textContent = '업로드 중... ' + Math.floor(ratio * 100) + '%';
+        });
+
+        const hidden = document.createElement('input');
+        hidden.type = 'hidden';
+        hidden.name = 'upload_id';
+        hidden.value = uploadId;
+        form.appendChild(hidden);
+        fileInput.value = '';  // 파일은 이미 서버에 있으므로 다시 보내지 않음
+        form.dataset.uploaded = '1';
+        form.submit();
+      } catch (e) {
+        if (progress) progress.textContent = e.message + ' 다시 제출하면 이어서 업로드합니다.';
+        buttons.forEach(b => b.disabled = false);
+      }
+    });
+  });
+})();
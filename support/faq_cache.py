@@ -0,0 +1,123 @@
+# support/faq_cache.py
+
+import hashlib
+import json
+import threading
+import time
+
+from django.core.cache import cache
+
+from core.cache import bounded_timeout
+from .models import FAQCategory, FAQItem
+
+
+VERSION_KEY = 'support:faq-version'
+
+_lock = threading.Lock()
+_tree = None
+
+
+def current_version():
+    """FAQ 버전 번호
+
+    공유 캐시(Redis)면 모든 워커 프로세스가 같은 번호를 보고 invalidate()가 바로 전달됩니다.
+    LocMem이면 번호가 프로세스마다 따로라 다른 프로세스의 invalidate()는 보이지 않으므로
+    LOCAL_CACHE_TIMEOUT마다 키가 만료되고 새 번호(시각)로 다시 시작 → 그때 트리를 다시 만듦
+    """
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(VERSION_KEY, version, bounded_timeout(None)):
+            version = cache.get(VERSION_KEY, version)  # 다른 요청이 먼저 만듦
+    return version
+
+
+def invalidate():
+    """관리자 화면에서 카테고리/질문이 바뀌면 호출 - 각 프로세스는 다음 요청 때 트리를 다시 만듦"""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # 버전 키가 사라졌으면 기존 어떤 번호와도 겹치지 않는 값으로 새로 시작
+        cache.set(VERSION_KEY, time.time_ns(), bounded_timeout(None))
+
+
+class FAQTree:
+    """FAQ 카테고리/질문 전체를 메모리에 올린 트리
+
+    - children: 부모 ID(최상위는 None) → 하위 카테고리 목록
+    - items: 카테고리 ID → 질문 목록
+    - document / etag: 위젯이 한 번에 받아 가는 전체 트리 JSON
+    """
+
+    def __init__(self, version, categories, items):
+        self.version = version
+        self.categories = {c['id']: c for c in categories}
+        self.children = {}
+        self.items = {}
+
+        for category in categories:
+            self.children.setdefault(category['parent_id'], []).append(
+                {'id': category['id'], 'name': category['name'], 'depth': category['depth']}
+            )
+        for item in items:
+            self.items.setdefault(item['category_id'], []).append(
+                {'id': item['id'], 'question': item['question'], 'answer': item['answer']}
+            )
+
+        self.document = json.dumps(
+            {'version': version, 'categories': self._nested(None)},
+            ensure_ascii=False, separators=(',', ':'),
+        ).encode('utf-8')
+        self.etag = f'"faq-{hashlib.sha1(self.document).hexdigest()[:16]}"'
+
+    @classmethod
+    def build(cls, version):
+        """쿼리 2번 (카테고리 전체, 질문 전체)"""
+        categories = list(FAQCategory.objects.order_by('id').values('id', 'name', 'depth', 'parent_id'))
+        items = list(FAQItem.objects.order_by('id').values('id', 'question', 'answer', 'category_id'))
+        return cls(version, categories, items)
+
+    def _nested(self, parent_id):
+        return [
+            dict(child, children=self._nested(child['id']), items=self.items.get(child['id'], []))
+            for child in self.children.get(parent_id, [])
+        ]
+
+    def step(self, parent_id):
+        """ChatbotFlowView 응답 - 기존 API와 같은 형식"""
+        has_back = False
+        back_id = None
+        if parent_id is not None:
+            category = self.categories.get(parent_id)
+            if category is not None:
+                has_back = True
+                back_id = category['parent_id']
+
+        if self.children.get(parent_id):
+            res_type, message, data = 'category', '원하시는 항목을 선택해 주세요.', self.children[parent_id]
+        elif self.items.get(parent_id):
+            res_type, message, data = 'question', '아래 질문 중에서 선택해 주세요.', self.items[parent_id]
+        else:
+            res_type, message, data = 'empty', '등록된 내용이 없습니다.', []
+
+        return {
+            'type': res_type,
+            'message': message,
+            'data': data,
+            'has_back': has_back,   # 뒤로가기 가능 여부
+            'back_id': back_id,     # 돌아갈 ID
+        }
+
+
+def get_tree():
+    """현재 버전의 트리 - 버전이 같으면 DB 조회 없이 메모리에 있는 트리를 그대로 사용"""
+    global _tree
+    version = current_version()
+    tree = _tree
+    if tree is not None and tree.version == version:
+        return tree
+
+    with _lock:
+        if _tree is None or _tree.version != version:
+            _tree = FAQTree.build(version)
+        return _tree
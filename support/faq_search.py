@@ -0,0 +1,287 @@
+# support/faq_search.py
+
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.core.cache import cache
+
+from core.cache import bounded_timeout
+from core.text import normalize, strip_particle
+from .models import FAQItem
+
+
+VERSION_KEY = 'support:faq-search-version'
+CHANGE_KEY = 'support:faq-search-change:{}'
+CHANGE_TIMEOUT = 60 * 60 * 24
+MAX_INCREMENTAL_CHANGES = 200   # 이보다 많이 바뀌었으면 하나씩 반영하지 않고 전체 재색인
+
+FIELDS = ('id', 'question', 'answer', 'category_id')
+
+QUESTION_WEIGHT = 3.0
+ANSWER_WEIGHT = 1.0
+
+# ---------- 한글 자모 분해 ----------
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅗㅏ', 'ㅗㅐ', 'ㅗㅣ', 'ㅛ', 'ㅜ',
+             'ㅜㅓ', 'ㅜㅔ', 'ㅜㅣ', 'ㅠ', 'ㅡ', 'ㅡㅣ', 'ㅣ']
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄱㅅ', 'ㄴ', 'ㄴㅈ', 'ㄴㅎ', 'ㄷ', 'ㄹ', 'ㄹㄱ', 'ㄹㅁ', 'ㄹㅂ', 'ㄹㅅ', 'ㄹㅌ',
+             'ㄹㅍ', 'ㄹㅎ', 'ㅁ', 'ㅂ', 'ㅂㅅ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+# 입력 중에 단독으로 들어오는 겹받침/겹모음 자모도 같은 방식으로 풀어 씀
+COMPAT_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+HANGUL_BASE, HANGUL_END = 0xAC00, 0xD7A3
+
+# normalize()의 NFKC가 호환 자모(ㅅ)를 조합용 자모(ᄉ)로 바꾸므로 다시 호환 자모로 되돌림
+_COMPAT_JAMO_CHARS = [chr(code) for code in range(0x3131, 0x3164)]
+RESTORE_JAMO = str.maketrans({
+    unicodedata.normalize('NFKC', c): c for c in _COMPAT_JAMO_CHARS if unicodedata.normalize('NFKC', c) != c
+})
+
+
+def to_jamo(text):
+    """'수강' → 'ㅅㅜㄱㅏㅇ' (겹받침/겹모음은 풀어 씀)
+
+    입력 중인 글자('숙' → 'ㅅㅜㄱ')도 완성된 단어('수강')의 앞부분과 맞게 됩니다.
+    """
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(JONGSEONG[offset % 28])
+        else:
+            result.append(COMPAT_JAMO.get(char, char))
+    return ''.join(result)
+
+
+def to_choseong(text):
+    """'수강신청' → 'ㅅㄱㅅㅊ' (초성 검색용, 한글이 아닌 글자는 그대로)"""
+    return ''.join(
+        CHOSEONG[(ord(c) - HANGUL_BASE) // 588] if HANGUL_BASE <= ord(c) <= HANGUL_END else c
+        for c in text
+    )
+
+
+def is_choseong_query(token):
+    return all(c in CHOSEONG for c in token)
+
+
+def words(text):
+    return [strip_particle(w) for w in normalize(text).translate(RESTORE_JAMO).split()]
+
+
+def bigrams(word):
+    return {word[i:i + 2] for i in range(len(word) - 1)} if len(word) > 1 else {word}
+
+
+# ---------- 인덱스 ----------
+
+class FAQSearchIndex:
+    """FAQ 질문/답변 검색 인덱스 (메모리)
+
+    - 접두어: 단어를 자모로 풀어 정렬한 목록에서 bisect로 범위 검색 ("숙" → "수강")
+    - 초성: 단어의 초성 문자열 정렬 목록 ("ㅅㄱ" → "수강")
+    - n-gram: 음절 2-gram → 문서 (중간 일치, 오타 조금 허용)
+    """
+
+    def __init__(self, version=0):
+        self.version = version
+        self.docs = {}                    # item_id → {'id', 'question', 'answer', 'category_id'}
+        self.doc_terms = {}               # item_id → [(word, weight)] (삭제/수정 시 사용)
+        self.postings = defaultdict(dict)  # word → {item_id: weight}
+        self.ngrams = defaultdict(dict)   # 2-gram → {item_id: weight}
+        self.question_cho = {}            # item_id → 공백을 뺀 질문의 초성 ("수강 신청" → "ㅅㄱㅅㅊ")
+        self._jamo_keys = []               # 정렬된 (자모 문자열, word)
+        self._cho_keys = []                # 정렬된 (초성 문자열, word)
+        self._dirty = False
+
+    # --- 추가 / 삭제 ---
+
+    def add(self, item):
+        self.remove(item['id'])
+        self.docs[item['id']] = item
+
+        terms = {}
+        for text, weight in ((item['answer'], ANSWER_WEIGHT), (item['question'], QUESTION_WEIGHT)):
+            for word in words(text):
+                terms[word] = max(terms.get(word, 0), weight)
+
+        self.doc_terms[item['id']] = list(terms.items())
+        self.question_cho[item['id']] = to_choseong(''.join(normalize(item['question']).split()))
+        for word, weight in terms.items():
+            if word not in self.postings:
+                self._dirty = True
+            self.postings[word][item['id']] = weight
+            for gram in bigrams(word):
+                self.ngrams[gram][item['id']] = max(self.ngrams[gram].get(item['id'], 0), weight)
+
+    def remove(self, item_id):
+        self.docs.pop(item_id, None)
+        self.question_cho.pop(item_id, None)
+        for word, _ in self.doc_terms.pop(item_id, []):
+            posting = self.postings.get(word)
+            if posting is not None:
+                posting.pop(item_id, None)
+                if not posting:
+                    del self.postings[word]
+                    self._dirty = True
+            for gram in bigrams(word):
+                grams = self.ngrams.get(gram)
+                if grams is not None:
+                    grams.pop(item_id, None)
+                    if not grams:
+                        del self.ngrams[gram]
+
+    def _refresh_keys(self):
+        """단어 목록이 바뀌었을 때만 정렬 목록을 다시 만듦"""
+        if self._dirty:
+            self._jamo_keys = sorted((to_jamo(w), w) for w in self.postings)
+            self._cho_keys = sorted((to_choseong(w), w) for w in self.postings)
+            self._dirty = False
+
+    @staticmethod
+    def _prefix_range(keys, prefix):
+        start = bisect_left(keys, (prefix,))
+        for key, word in keys[start:]:
+            if not key.startswith(prefix):
+                break
+            yield key, word
+
+    # --- 검색 ---
+
+    def search(self, query, limit=10):
+        self._refresh_keys()
+        tokens = [t for t in words(query) if t]
+        if not tokens:
+            return []
+
+        scores = defaultdict(float)
+        for token in tokens:
+            token_scores = {}
+
+            def hit(item_id, score):
+                if score > token_scores.get(item_id, 0):
+                    token_scores[item_id] = score
+
+            # 1) 접두어 (자모 단위) - 완전 일치는 가산점
+            token_jamo = to_jamo(token)
+            for key, word in self._prefix_range(self._jamo_keys, token_jamo):
+                bonus = 1.0 if key == token_jamo else len(token_jamo) / len(key)
+                for item_id, weight in self.postings[word].items():
+                    hit(item_id, weight * (1 + bonus))
+
+            # 2) 초성만 입력한 경우 - 단어 초성 접두어, 두 글자 이상이면 질문 전체 초성에서도 찾음 (단어 경계 무시)
+            if is_choseong_query(token):
+                for _, word in self._prefix_range(self._cho_keys, token):
+                    for item_id, weight in self.postings[word].items():
+                        hit(item_id, weight * 1.5)
+                if len(token) > 1:
+                    for item_id, cho in self.question_cho.items():
+                        position = cho.find(token)
+                        if position >= 0:
+                            hit(item_id, QUESTION_WEIGHT * (1.5 if position == 0 else 1.2))
+
+            # 3) 2-gram 겹침 - 단어 중간 일치 / 오타
+            token_grams = bigrams(token)
+            if len(token) > 1:
+                overlap = defaultdict(float)
+                for gram in token_grams:
+                    for item_id, weight in self.ngrams.get(gram, {}).items():
+                        overlap[item_id] += weight
+                for item_id, total in overlap.items():
+                    ratio = total / (len(token_grams) * QUESTION_WEIGHT)
+                    if ratio >= 0.3:
+                        hit(item_id, total / len(token_grams))
+
+            for item_id, score in token_scores.items():
+                scores[item_id] += score
+
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))[:limit]
+        return [dict(self.docs[item_id], score=round(score, 2)) for item_id, score in ranked]
+
+
+# ---------- 버전 / 증분 갱신 ----------
+
+_lock = threading.Lock()
+_index = None
+
+
+def current_version():
+    """검색 인덱스 버전 번호 (faq_cache.current_version과 같은 방식)
+
+    공유 캐시(Redis)면 모든 프로세스가 같은 번호와 변경 기록을 봅니다.
+    LocMem이면 다른 프로세스의 변경이 보이지 않으므로 LOCAL_CACHE_TIMEOUT마다 키가 만료되고
+    새 번호(시각)로 다시 시작 → 변경 기록이 없으니 그때 전체 재색인
+    """
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(VERSION_KEY, version, bounded_timeout(None)):
+            version = cache.get(VERSION_KEY, version)  # 다른 요청이 먼저 만듦
+    return version
+
+
+def record_change(item_id):
+    """FAQItem 추가/수정/삭제 기록 - 각 프로세스가 바뀐 항목만 다시 색인하도록 버전별로 남김"""
+    try:
+        version = cache.incr(VERSION_KEY)
+    except ValueError:
+        # 버전 키가 사라졌으면 기존 어떤 번호보다 큰 값으로 새로 시작 → 모든 프로세스가 전체 재색인
+        cache.set(VERSION_KEY, time.time_ns(), bounded_timeout(None))
+        return
+    cache.set(CHANGE_KEY.format(version), item_id, bounded_timeout(CHANGE_TIMEOUT))
+
+
+def _rebuild(version):
+    index = FAQSearchIndex(version)
+    for item in FAQItem.objects.order_by('id').values(*FIELDS):
+        index.add(item)
+    return index
+
+
+def _apply_changes(index, version):
+    """index.version 이후 바뀐 항목만 다시 색인 - 기록이 빠져 있으면 False (전체 재색인 필요)"""
+    if version - index.version > MAX_INCREMENTAL_CHANGES:
+        return False  # 변경이 많거나 버전이 새로 시작됨 (키 만료)
+
+    changed = set()
+    for v in range(index.version + 1, version + 1):
+        item_id = cache.get(CHANGE_KEY.format(v))
+        if item_id is None:
+            return False
+        changed.add(item_id)
+
+    found = {item['id']: item for item in FAQItem.objects.filter(id__in=changed).values(*FIELDS)}
+    for item_id in changed:
+        if item_id in found:
+            index.add(found[item_id])
+        else:
+            index.remove(item_id)
+    index.version = version
+    return True
+
+
+def _current_index():
+    """현재 버전의 검색 인덱스 - 같은 버전이면 DB 조회 없음, 바뀐 항목이 있으면 그것만 반영"""
+    global _index
+    version = current_version()
+    if _index is None or _index.version > version:
+        _index = _rebuild(version)
+    elif _index.version < version and not _apply_changes(_index, version):
+        _index = _rebuild(version)
+    return _index
+
+
+def search(query, limit=10):
+    # 증분 갱신 중인 인덱스를 다른 스레드가 읽지 않도록 검색도 같은 잠금 안에서 (검색은 수 ms)
+    with _lock:
+        return _current_index().search(query, limit)
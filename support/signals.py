@@ -0,0 +1,25 @@
+# support/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import FAQCategory, FAQItem
+from . import faq_cache, faq_search
+
+
+@receiver([post_save, post_delete], sender=FAQCategory)
+@receiver([post_save, post_delete], sender=FAQItem)
+def invalidate_faq_tree(sender, **kwargs):
+    """관리자 화면에서 FAQ가 바뀌면 메모리 트리 버전 변경
+
+    커밋 후에 - 커밋 전에 올리면 다른 워커가 커밋 전 데이터로 새 버전 트리를 만들어 다음 변경까지 들고 있음
+    """
+    transaction.on_commit(faq_cache.invalidate)
+
+
+@receiver([post_save, post_delete], sender=FAQItem)
+def reindex_faq_item(sender, instance, **kwargs):
+    """바뀐 질문만 검색 인덱스에 다시 반영 (invalidate_faq_tree와 같은 이유로 커밋 후에)"""
+    item_id = instance.pk  # 삭제 후에는 instance.pk가 None이 되므로 미리
+    transaction.on_commit(lambda: faq_search.record_change(item_id))
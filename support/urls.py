@@ -1,6 +1,6 @@
 # support/urls.py
 from django.urls import path
-from .views import ChatbotFlowView, chatbot_page
+from .views import ChatbotFlowView, chatbot_page, chatbot_tree_view, chatbot_search_view
 
 urlpatterns = [
     # 화면 주소: /support/chatbot/
@@ -9,4 +9,8 @@ urlpatterns = [
 
     # API 주소: /support/api/chatbot/
     path('api/chatbot/', ChatbotFlowView.as_view(), name='chatbot-api'),
+    # 전체 FAQ 트리 (ETag 캐시): /support/api/chatbot/tree/
+    path('api/chatbot/tree/', chatbot_tree_view, name='chatbot-tree'),
+    # FAQ 검색 (자동완성): /support/api/chatbot/search/?q=
+    path('api/chatbot/search/', chatbot_search_view, name='chatbot-search'),
 ]
@@ -1,9 +1,9 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
 from django.shortcuts import render
-from .models import FAQCategory, FAQItem
-from .serializers import FAQCategorySerializer, FAQItemSerializer
+from . import faq_cache, faq_search
 
 
 # 1. 화면 렌더링 (HTML 보여주기)
@@ -13,56 +13,43 @@ def chatbot_page(request):
 
 # 2. API 로직 (데이터 보내주기)
 class ChatbotFlowView(APIView):
+    """한 단계씩 이동 - 메모리에 올린 FAQ 트리에서 바로 응답 (DB 조회 없음)"""
+    authentication_classes = []  # 공개 API - 세션/사용자 조회 생략
+
     def get(self, request):
         parent_id = request.query_params.get('parent_id')
 
-        if parent_id == 'null' or parent_id == '':
+        if parent_id == 'null' or parent_id == '' or parent_id is None:
             parent_id = None
+        else:
+            try:
+                parent_id = int(parent_id)
+            except ValueError:
+                parent_id = -1  # 없는 카테고리로 처리 → "등록된 내용이 없습니다."
 
-        # --- [추가된 부분] 뒤로가기 ID 계산 로직 시작 ---
-        back_id = None
-        has_back = False
+        return Response(faq_cache.get_tree().step(parent_id), status=status.HTTP_200_OK)
 
-        if parent_id:  # 현재 최상위가 아니라면 항상 뒤로가기 가능
-            has_back = True
-            try:
-                current_category = FAQCategory.objects.get(id=parent_id)
-                # 부모가 있으면 그 ID로, 없으면 None(최상위)으로 설정
-                if current_category.parent:
-                    back_id = current_category.parent.id
-                else:
-                    back_id = None
-            except FAQCategory.DoesNotExist:
-                has_back = False
-        # --- [추가된 부분] 뒤로가기 ID 계산 로직 끝 ---
 
-        # 공통 응답 데이터 구성을 위한 함수
-        def make_response(res_type, msg, data):
-            return Response({
-                "type": res_type,
-                "message": msg,
-                "data": data,
-                "has_back": has_back,  # 뒤로가기 가능 여부
-                "back_id": back_id     # 돌아갈 ID
-            }, status=status.HTTP_200_OK)
+# 3. 전체 FAQ 트리 (위젯이 한 번 받아서 클라이언트에서 이동)
+def chatbot_tree_view(request):
+    tree = faq_cache.get_tree()
+
+    if tree.etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(tree.document, content_type='application/json; charset=utf-8')
+    response['ETag'] = tree.etag
+    response['Cache-Control'] = 'public, max-age=60'
+    return response
 
-        # 1. 하위 카테고리 확인
-        sub_categories = FAQCategory.objects.filter(parent_id=parent_id)
-        if sub_categories.exists():
-            return make_response(
-                "category",
-                "원하시는 항목을 선택해 주세요.",
-                FAQCategorySerializer(sub_categories, many=True).data
-            )
 
-        # 2. 질문 리스트 확인
-        questions = FAQItem.objects.filter(category_id=parent_id)
-        if questions.exists():
-            return make_response(
-                "question",
-                "아래 질문 중에서 선택해 주세요.",
-                FAQItemSerializer(questions, many=True).data
-            )
+# 4. FAQ 검색 (자동완성) - 메모리 인덱스에서 바로 응답
+def chatbot_search_view(request):
+    query = request.GET.get('q', '').strip()[:50]
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 20)
+    except ValueError:
+        limit = 10
 
-        # 3. 데이터 없음
-        return make_response("empty", "등록된 내용이 없습니다.", [])
\ No newline at end of file
+    results = faq_search.search(query, limit) if query else []
+    return JsonResponse({'query': query, 'results': results})